@@ -31,8 +31,10 @@
 
 #include <Tube/fir.h>
 #include <Tube/input.h>
+#include <Tube/limiter.h>
 #include <Tube/output.h>
 #include <Tube/ring_buffer.h>
+#include <Tube/statistics.h>
 #include <Tube/structs.h>
 #include <Tube/tube.h>
 #include <Tube/util.h>
@@ -0,0 +1,55 @@
+/*******************************************************************************
+ *
+ *  Copyright (c) 1991-2009 David R. Hill, Leonard Manzara, Craig Schock
+ *  
+ *  Contributors: Steve Nygard
+ *
+ *  This program is free software: you can redistribute it and/or modify
+ *  it under the terms of the GNU General Public License as published by
+ *  the Free Software Foundation, either version 3 of the License, or
+ *  (at your option) any later version.
+ *
+ *  This program is distributed in the hope that it will be useful,
+ *  but WITHOUT ANY WARRANTY; without even the implied warranty of
+ *  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+ *  GNU General Public License for more details.
+ *
+ *  You should have received a copy of the GNU General Public License
+ *  along with this program.  If not, see <http://www.gnu.org/licenses/>.
+ *
+ *******************************************************************************
+ *
+ *  fast_tract.h
+ *  Tube
+ *
+ *  Version: 1.0.1
+ *
+ ******************************************************************************/
+
+#ifndef __FAST_TRACT_H
+#define __FAST_TRACT_H
+
+#include "structs.h"
+#include "pipeline.h"
+
+/*  STATE FOR THE FAST ENGINE: FLAT, DOUBLE-BUFFERED TUBE MEMORY (INDEXED
+    [BUFFER][TOP|BOTTOM][SECTION]), AND PER-MODEL FILTER MEMORY  */
+typedef struct _TRMFastTract {
+    double oropharynx[2][2][TOTAL_SECTIONS];
+    double nasal[2][2][TOTAL_NASAL_SECTIONS];
+    int current;
+
+    double reflectionY, radiationX, radiationY;
+    double nasalReflectionY, nasalRadiationX, nasalRadiationY;
+    double throatY;
+    double bpXn1, bpXn2, bpYn1, bpYn2;
+
+    /*  VALUES THAT THE BANDPASS COEFFICIENTS WERE LAST CALCULATED FOR, SO
+        THEY ARE ONLY RECALCULATED WHEN THESE CHANGE  */
+    double bandpassCF, bandpassBW;
+
+    /*  BUFFERS AND STAGES OF THE BLOCK PIPELINE  */
+    TRMPipeline pipeline;
+} TRMFastTract;
+
+#endif
@@ -34,6 +34,9 @@
 #define FIR_GAMMA                 .1
 #define FIR_CUTOFF                .00000001
 
+/*  UPPER BOUND ON THE NUMBER OF TAPS (2 * LIMIT - 1 IN fir.c)  */
+#define FIR_MAXIMUM_TAPS          399
+
 /*  VARIABLES FOR FIR LOWPASS FILTER  */
 typedef struct {
     double *FIRData, *FIRCoef;
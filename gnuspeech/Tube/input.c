@@ -233,6 +233,7 @@ TRMData *parseInputFile(const char *inputFile)
     } else
         data.inputParameters.mixOffset = strtod(line, NULL);
 
+    data.inputParameters.noiseSeed = 0;
 
     data.inputHead = NULL;
     data.inputTail = NULL;
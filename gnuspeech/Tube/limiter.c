@@ -0,0 +1,201 @@
+/*******************************************************************************
+ *
+ *  Copyright (c) 1991-2009 David R. Hill, Leonard Manzara, Craig Schock
+ *  
+ *  Contributors: Steve Nygard
+ *
+ *  This program is free software: you can redistribute it and/or modify
+ *  it under the terms of the GNU General Public License as published by
+ *  the Free Software Foundation, either version 3 of the License, or
+ *  (at your option) any later version.
+ *
+ *  This program is distributed in the hope that it will be useful,
+ *  but WITHOUT ANY WARRANTY; without even the implied warranty of
+ *  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+ *  GNU General Public License for more details.
+ *
+ *  You should have received a copy of the GNU General Public License
+ *  along with this program.  If not, see <http://www.gnu.org/licenses/>.
+ *
+ *******************************************************************************
+ *  limiter.c
+ *  Tube
+ *
+ *  Version: 1.0.1
+ *
+ ******************************************************************************/
+
+#include <stdio.h>
+#include <stdlib.h>
+#include <math.h>
+#include "limiter.h"
+
+
+
+/******************************************************************************
+*
+*       function:       TRMLimiterCreate
+*
+*       purpose:        Creates a limiter for a stream of samples at the
+*                       given sample rate.
+*
+*       arguments:      sampleRate - samples per second
+*                       lookahead - delay of the limiter, in seconds
+*                       release - time constant with which the gain
+*                                recovers after a peak, in seconds
+*                       window - time constant with which the loudness
+*                                envelope decays, in seconds
+*                       target - peak level that the envelope is scaled to
+*                       ceiling - largest magnitude of an output sample
+*                       maximumGain - largest gain applied to quiet input
+*
+*       internal
+*       functions:      TRMLimiterFree
+*
+*       library
+*       functions:      calloc, exp, rint
+*
+******************************************************************************/
+
+TRMLimiter *TRMLimiterCreate(double sampleRate, double lookahead, double release, double window,
+                             double target, double ceiling, double maximumGain)
+{
+    TRMLimiter *newLimiter;
+    int i;
+
+    if ((sampleRate <= 0.0) || (lookahead < 0.0) || (target <= 0.0) || (ceiling <= 0.0) || (maximumGain <= 0.0)) {
+        fprintf(stderr, "Illegal limiter settings.\n");
+        return NULL;
+    }
+
+    newLimiter = (TRMLimiter *)calloc(1, sizeof(TRMLimiter));
+    if (newLimiter == NULL) {
+        fprintf(stderr, "Failed to malloc() space for limiter.\n");
+        return NULL;
+    }
+
+    newLimiter->lookahead = (int)rint(lookahead * sampleRate);
+    if (newLimiter->lookahead < 1)
+        newLimiter->lookahead = 1;
+    newLimiter->window = newLimiter->lookahead + 1;
+    newLimiter->target = target;
+    newLimiter->ceiling = ceiling;
+    newLimiter->maximumGain = maximumGain;
+    newLimiter->releaseCoefficient = (release > 0.0) ? exp(-1.0 / (release * sampleRate)) : 0.0;
+    newLimiter->envelopeCoefficient = (window > 0.0) ? exp(-1.0 / (window * sampleRate)) : 0.0;
+
+    newLimiter->delay = (double *)calloc(newLimiter->lookahead, sizeof(double));
+    newLimiter->gains = (double *)calloc(newLimiter->window, sizeof(double));
+    newLimiter->minimumValue = (double *)calloc(newLimiter->window + 1, sizeof(double));
+    newLimiter->minimumTime = (long int *)calloc(newLimiter->window + 1, sizeof(long int));
+    if ((newLimiter->delay == NULL) || (newLimiter->gains == NULL) ||
+        (newLimiter->minimumValue == NULL) || (newLimiter->minimumTime == NULL)) {
+        fprintf(stderr, "Failed to malloc() space for limiter.\n");
+        TRMLimiterFree(newLimiter);
+        return NULL;
+    }
+
+    newLimiter->gain = maximumGain;
+    for (i = 0; i < newLimiter->window; i++)
+        newLimiter->gains[i] = maximumGain;
+    newLimiter->sum = maximumGain * newLimiter->window;
+
+    return newLimiter;
+}
+
+
+
+void TRMLimiterFree(TRMLimiter *limiter)
+{
+    if (limiter == NULL)
+        return;
+
+    free(limiter->delay);
+    free(limiter->gains);
+    free(limiter->minimumValue);
+    free(limiter->minimumTime);
+    free(limiter);
+}
+
+
+
+/******************************************************************************
+*
+*       function:       TRMLimiterProcess
+*
+*       purpose:        Takes one input sample, and returns the output sample
+*                       from lookahead samples earlier (zero at first).
+*
+*                       Each input sample asks for the largest gain that
+*                       keeps it below the ceiling, and keeps the loudness
+*                       envelope at the target.  The smallest request over
+*                       the last window samples is taken, allowed to recover
+*                       slowly, and then averaged over the window again, so
+*                       the gain never jumps.  Every request that is
+*                       averaged covers the sample being output, so that
+*                       sample can never exceed the ceiling.
+*
+*       arguments:      input
+*
+*       internal
+*       functions:      none
+*
+*       library
+*       functions:      fabs
+*
+******************************************************************************/
+
+double TRMLimiterProcess(TRMLimiter *limiter, double input)
+{
+    double magnitude = fabs(input), required = limiter->maximumGain, minimum, output;
+    int i, slot, size;
+
+    /*  THE GAIN THAT THIS SAMPLE ASKS FOR  */
+    limiter->envelope *= limiter->envelopeCoefficient;
+    if (magnitude > limiter->envelope)
+        limiter->envelope = magnitude;
+    if (limiter->envelope * required > limiter->target)
+        required = limiter->target / limiter->envelope;
+    if (magnitude * required > limiter->ceiling)
+        required = limiter->ceiling / magnitude;
+
+    /*  SLIDING MINIMUM OF THE REQUESTS OVER THE WINDOW, KEPT AS A QUEUE OF
+        INCREASING REQUESTS IN A RING OF window + 1 ENTRIES  */
+    size = limiter->window + 1;
+    if ((limiter->minimumHead != limiter->minimumTail) &&
+        (limiter->minimumTime[limiter->minimumHead] <= limiter->count - limiter->window))
+        limiter->minimumHead = (limiter->minimumHead + 1) % size;
+    while ((limiter->minimumHead != limiter->minimumTail) &&
+           (limiter->minimumValue[(limiter->minimumTail + size - 1) % size] >= required))
+        limiter->minimumTail = (limiter->minimumTail + size - 1) % size;
+    limiter->minimumValue[limiter->minimumTail] = required;
+    limiter->minimumTime[limiter->minimumTail] = limiter->count;
+    limiter->minimumTail = (limiter->minimumTail + 1) % size;
+    minimum = limiter->minimumValue[limiter->minimumHead];
+
+    /*  DROP AT ONCE, RECOVER SLOWLY  */
+    if (minimum < limiter->gain)
+        limiter->gain = minimum;
+    else
+        limiter->gain = minimum + (limiter->releaseCoefficient * (limiter->gain - minimum));
+
+    /*  MOVING AVERAGE OF THE GAIN OVER THE WINDOW, ADDED UP AFRESH ONCE PER
+        WINDOW SO THAT ROUNDING ERRORS DO NOT BUILD UP  */
+    slot = (int)(limiter->count % limiter->window);
+    limiter->sum += limiter->gain - limiter->gains[slot];
+    limiter->gains[slot] = limiter->gain;
+    if (slot == limiter->window - 1) {
+        limiter->sum = 0.0;
+        for (i = 0; i < limiter->window; i++)
+            limiter->sum += limiter->gains[i];
+    }
+
+    /*  DELAY THE INPUT BY THE LOOKAHEAD  */
+    slot = (int)(limiter->count % limiter->lookahead);
+    output = limiter->delay[slot] * (limiter->sum / (double)limiter->window);
+    limiter->delay[slot] = input;
+
+    limiter->count++;
+
+    return output;
+}
@@ -0,0 +1,61 @@
+/*******************************************************************************
+ *
+ *  Copyright (c) 1991-2009 David R. Hill, Leonard Manzara, Craig Schock
+ *  
+ *  Contributors: Steve Nygard
+ *
+ *  This program is free software: you can redistribute it and/or modify
+ *  it under the terms of the GNU General Public License as published by
+ *  the Free Software Foundation, either version 3 of the License, or
+ *  (at your option) any later version.
+ *
+ *  This program is distributed in the hope that it will be useful,
+ *  but WITHOUT ANY WARRANTY; without even the implied warranty of
+ *  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+ *  GNU General Public License for more details.
+ *
+ *  You should have received a copy of the GNU General Public License
+ *  along with this program.  If not, see <http://www.gnu.org/licenses/>.
+ *
+ *******************************************************************************
+ *  limiter.h
+ *  Tube
+ *
+ *  Version: 1.0.1
+ *
+ ******************************************************************************/
+
+#ifndef __LIMITER_H
+#define __LIMITER_H
+
+/*  A STREAMING LOUDNESS NORMALIZER AND PEAK LIMITER.  A SLOW ENVELOPE
+    FOLLOWER STEERS THE GAIN TOWARDS A TARGET PEAK LEVEL, AND A LOOKAHEAD
+    LIMITER KEEPS EVERY OUTPUT SAMPLE BELOW A CEILING.  THE OUTPUT IS DELAYED
+    BY THE LOOKAHEAD  */
+typedef struct _TRMLimiter {
+    int lookahead;                      /*  delay, in samples  */
+    int window;                         /*  lookahead + 1  */
+    double target;                      /*  target peak level  */
+    double ceiling;                     /*  largest output magnitude  */
+    double maximumGain;
+    double releaseCoefficient;          /*  one-pole gain release  */
+    double envelopeCoefficient;         /*  one-pole envelope decay  */
+
+    double envelope;
+    double gain;
+    double sum;                         /*  sum of gains[]  */
+    long int count;                     /*  number of samples processed  */
+
+    double *delay;                      /*  the last lookahead inputs  */
+    double *gains;                      /*  the last window smoothed gains  */
+    double *minimumValue;               /*  queue of the smallest requested gains  */
+    long int *minimumTime;
+    int minimumHead, minimumTail;
+} TRMLimiter;
+
+TRMLimiter *TRMLimiterCreate(double sampleRate, double lookahead, double release, double window,
+                             double target, double ceiling, double maximumGain);
+void TRMLimiterFree(TRMLimiter *limiter);
+double TRMLimiterProcess(TRMLimiter *limiter, double input);
+
+#endif
@@ -83,7 +83,7 @@ void writeOutputToFile(TRMSampleRateConverter *sampleRateConverter, TRMData *dat
     scale = OUTPUT_SCALE * (RANGE_MAX / sampleRateConverter->maximumSampleValue) * amplitude(data->inputParameters.volume);
 
     /*  Print out info  */
-    /*if (verbose)*/ {
+    if (verbose) {
 	printf("\nnumber of samples:\t%-ld\n", sampleRateConverter->numberSamples);
 	printf("maximum sample value:\t%.4f\n", sampleRateConverter->maximumSampleValue);
 	printf("scale:\t\t\t%.4f\n", scale);
@@ -106,7 +106,10 @@ void writeOutputToFile(TRMSampleRateConverter *sampleRateConverter, TRMData *dat
     rewind(sampleRateConverter->tempFilePtr);
 
     /*  Open the output file  */
-    fd = fopen(fileName, "wb");
+    if ((fd = fopen(fileName, "wb")) == NULL) {
+        fprintf(stderr, "Can't open output file \"%s\".\n", fileName);
+        return;
+    }
 
     /*  Scale and write out samples to the output file  */
     if (data->inputParameters.outputFileFormat == AU_FILE_FORMAT) {
@@ -0,0 +1,76 @@
+/*******************************************************************************
+ *
+ *  Copyright (c) 1991-2009 David R. Hill, Leonard Manzara, Craig Schock
+ *  
+ *  Contributors: Steve Nygard
+ *
+ *  This program is free software: you can redistribute it and/or modify
+ *  it under the terms of the GNU General Public License as published by
+ *  the Free Software Foundation, either version 3 of the License, or
+ *  (at your option) any later version.
+ *
+ *  This program is distributed in the hope that it will be useful,
+ *  but WITHOUT ANY WARRANTY; without even the implied warranty of
+ *  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+ *  GNU General Public License for more details.
+ *
+ *  You should have received a copy of the GNU General Public License
+ *  along with this program.  If not, see <http://www.gnu.org/licenses/>.
+ *
+ *******************************************************************************
+ *******************************************************************************
+ *
+ *  pipeline.h
+ *  Tube
+ *
+ *  Version: 1.0.1
+ *
+ ******************************************************************************/
+
+#ifndef __PIPELINE_H
+#define __PIPELINE_H
+
+#include "structs.h"
+#include "tube.h"
+
+/*  NUMBER OF SAMPLES THAT EACH STAGE PROCESSES AT A TIME  */
+#define PIPELINE_BLOCK            256
+
+/*  A STAGE OF THE FAST ENGINE: PROCESSES numberSamples SAMPLES FROM THE
+    BUFFERS OF THE EARLIER STAGES INTO ITS OWN BUFFERS  */
+typedef void (*TRMStageFunction)(TRMTubeModel *tubeModel, TRMInputParameters *inputParameters, int numberSamples);
+
+/*  THE BUFFERS PASSED BETWEEN STAGES, THE STAGE TABLE, AND THE TIME SPENT IN
+    EACH STAGE WHEN PROFILING  */
+typedef struct _TRMPipeline {
+    /*  PARAMETER STAGE: CONTROL VALUES FOR EACH SAMPLE  */
+    TRMParameters parameters[PIPELINE_BLOCK];
+
+    /*  GAIN STAGE: GLOTTAL FREQUENCY AND SOURCE AMPLITUDES  */
+    double f0[PIPELINE_BLOCK];
+    double glottalAmplitude[PIPELINE_BLOCK];
+    double aspirationAmplitude[PIPELINE_BLOCK];
+    double fricationAmplitude[PIPELINE_BLOCK];
+
+    /*  SOURCE AND NOISE STAGES  */
+    double glottalPulse[PIPELINE_BLOCK];
+    double lowpassNoise[PIPELINE_BLOCK];
+
+    /*  MIX STAGE: INPUTS TO THE TUBE, FRICATION FILTER AND THROAT  */
+    double tubeInput[PIPELINE_BLOCK];
+    double fricationInput[PIPELINE_BLOCK];
+    double throatInput[PIPELINE_BLOCK];
+
+    /*  TRACT STAGE  */
+    double output[PIPELINE_BLOCK];
+
+    TRMStageFunction stage[TOTAL_STAGES];
+    int profile;
+    double seconds[TOTAL_STAGES];
+} TRMPipeline;
+
+extern const TRMStageFunction defaultStages[TOTAL_STAGES];
+
+TRMStageFunction TRMTubeModelSetStage(TRMTubeModel *tubeModel, int stage, TRMStageFunction function);
+
+#endif
@@ -28,6 +28,7 @@
 
 #include <stdio.h>
 #include <stdlib.h>
+#include <string.h>
 
 #include "ring_buffer.h"
 
@@ -51,6 +52,7 @@ TRMRingBuffer *TRMRingBufferCreate(int aPadSize)
     newRingBuffer->fillPtr = newRingBuffer->padSize;
     newRingBuffer->emptyPtr = 0;
     newRingBuffer->fillCounter = 0;
+    newRingBuffer->zeroRun = BUFFER_SIZE;
 
     newRingBuffer->context = NULL;
     newRingBuffer->callbackFunction = NULL;
@@ -66,6 +68,18 @@ void TRMRingBufferFree(TRMRingBuffer *ringBuffer)
     free(ringBuffer);
 }
 
+// Copies the samples and pointers of one ring buffer into another, keeping
+// the destination's callback, so that it carries on from the same point.
+void TRMRingBufferCopy(TRMRingBuffer *destination, const TRMRingBuffer *source)
+{
+    void *context = destination->context;
+    void (*callbackFunction)(struct _TRMRingBuffer *, void *) = destination->callbackFunction;
+
+    memcpy(destination, source, sizeof(TRMRingBuffer));
+    destination->context = context;
+    destination->callbackFunction = callbackFunction;
+}
+
 // Fills the ring buffer with a single sample, increments
 // the counters and pointers, and empties the buffer when
 // full.
@@ -73,6 +87,13 @@ void dataFill(TRMRingBuffer *ringBuffer, double data)
 {
     ringBuffer->buffer[ringBuffer->fillPtr] = data;
 
+    /*  COUNT THE ZEROS AT THE END OF THE BUFFER, SO STRETCHES OF SILENCE CAN
+        BE CONVERTED WITHOUT LOOKING AT THEM  */
+    if (data != 0.0)
+        ringBuffer->zeroRun = 0;
+    else if (ringBuffer->zeroRun < BUFFER_SIZE)
+        ringBuffer->zeroRun++;
+
     /*  INCREMENT THE FILL POINTER, MODULO THE BUFFER SIZE  */
     RBIncrement(ringBuffer);
 
@@ -84,6 +105,44 @@ void dataFill(TRMRingBuffer *ringBuffer, double data)
     }
 }
 
+// Same as calling dataFill for each of numberSamples samples, but copies the
+// samples in runs up to the next wrap of the fill pointer or the next time
+// the buffer is full.
+void dataFillBlock(TRMRingBuffer *ringBuffer, const double *data, int numberSamples)
+{
+    int i, count, zeros;
+
+    while (numberSamples > 0) {
+        count = ringBuffer->fillSize - ringBuffer->fillCounter;
+        if (count > BUFFER_SIZE - ringBuffer->fillPtr)
+            count = BUFFER_SIZE - ringBuffer->fillPtr;
+        if (count > numberSamples)
+            count = numberSamples;
+        if (count < 1)
+            count = 1;
+
+        memcpy(ringBuffer->buffer + ringBuffer->fillPtr, data, count * sizeof(double));
+
+        /*  COUNT THE ZEROS AT THE END OF THE RUN, AS IN dataFill  */
+        for (zeros = 0, i = count - 1; (i >= 0) && (data[i] == 0.0); i--)
+            zeros++;
+        if (zeros < count)
+            ringBuffer->zeroRun = zeros;
+        else if ((ringBuffer->zeroRun += zeros) > BUFFER_SIZE)
+            ringBuffer->zeroRun = BUFFER_SIZE;
+
+        if ((ringBuffer->fillPtr += count) >= BUFFER_SIZE)
+            ringBuffer->fillPtr -= BUFFER_SIZE;
+        data += count;
+        numberSamples -= count;
+
+        if ((ringBuffer->fillCounter += count) >= ringBuffer->fillSize) {
+            dataEmpty(ringBuffer);
+            ringBuffer->fillCounter = 0;
+        }
+    }
+}
+
 void dataEmpty(TRMRingBuffer *ringBuffer)
 {
     if (ringBuffer->callbackFunction == NULL) {
@@ -119,6 +178,18 @@ void flushBuffer(TRMRingBuffer *ringBuffer)
     dataEmpty(ringBuffer);
 }
 
+// Converts the samples filled since the last conversion without waiting for
+// the buffer to fill up, so that short blocks can be streamed out.
+void drainBuffer(TRMRingBuffer *ringBuffer)
+{
+    /*  ONLY DRAIN ONCE THE FILL POINTER IS WELL CLEAR OF THE EMPTY POINTER  */
+    if (ringBuffer->fillCounter > ringBuffer->padSize) {
+	dataEmpty(ringBuffer);
+	/* RESET THE FILL COUNTER  */
+	ringBuffer->fillCounter = 0;
+    }
+}
+
 void RBIncrementIndex(int *index)
 {
     if (++(*index) >= BUFFER_SIZE)
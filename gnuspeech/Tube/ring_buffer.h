@@ -39,6 +39,7 @@ typedef struct _TRMRingBuffer {
     int fillPtr;
     int emptyPtr;
     int fillCounter;
+    int zeroRun; // Number of zeros most recently filled (at most BUFFER_SIZE).
 
     void *context;
     void (*callbackFunction)(struct _TRMRingBuffer *, void *);
@@ -46,12 +47,15 @@ typedef struct _TRMRingBuffer {
 
 TRMRingBuffer *TRMRingBufferCreate(int aPadSize);
 void TRMRingBufferFree(TRMRingBuffer *ringBuffer);
+void TRMRingBufferCopy(TRMRingBuffer *destination, const TRMRingBuffer *source);
 
 void dataFill(TRMRingBuffer *ringBuffer, double data);
+void dataFillBlock(TRMRingBuffer *ringBuffer, const double *data, int numberSamples);
 void dataEmpty(TRMRingBuffer *ringBuffer);
 void RBIncrement(TRMRingBuffer *ringBuffer);
 void RBDecrement(TRMRingBuffer *ringBuffer);
 void flushBuffer(TRMRingBuffer *ringBuffer);
+void drainBuffer(TRMRingBuffer *ringBuffer);
 
 void RBIncrementIndex(int *index);
 void RBDecrementIndex(int *index);
@@ -0,0 +1,228 @@
+/*******************************************************************************
+ *
+ *  Copyright (c) 1991-2009 David R. Hill, Leonard Manzara, Craig Schock
+ *  
+ *  Contributors: Steve Nygard
+ *
+ *  This program is free software: you can redistribute it and/or modify
+ *  it under the terms of the GNU General Public License as published by
+ *  the Free Software Foundation, either version 3 of the License, or
+ *  (at your option) any later version.
+ *
+ *  This program is distributed in the hope that it will be useful,
+ *  but WITHOUT ANY WARRANTY; without even the implied warranty of
+ *  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+ *  GNU General Public License for more details.
+ *
+ *  You should have received a copy of the GNU General Public License
+ *  along with this program.  If not, see <http://www.gnu.org/licenses/>.
+ *
+ *******************************************************************************
+ *  statistics.c
+ *  Tube
+ *
+ *  Version: 1.0.1
+ *
+ ******************************************************************************/
+
+#include <stdio.h>
+#include <stdlib.h>
+#include <string.h>
+#include <math.h>
+#include "statistics.h"
+
+static TRMFrameStatistics *frameAt(TRMStatistics *statistics, long int frame);
+
+
+
+/******************************************************************************
+*
+*       function:       TRMStatisticsCreate
+*
+*       purpose:        Creates an empty set of frame statistics.
+*
+*       arguments:      controlRate - control frames per second
+*                       outputRate - output samples per second
+*                       controlPeriod - source samples per control frame
+*
+*       internal
+*       functions:      none
+*
+*       library
+*       functions:      calloc
+*
+******************************************************************************/
+
+TRMStatistics *TRMStatisticsCreate(double controlRate, double outputRate, int controlPeriod)
+{
+    TRMStatistics *newStatistics;
+
+    if ((controlRate <= 0.0) || (outputRate <= 0.0) || (controlPeriod <= 0)) {
+        fprintf(stderr, "Illegal statistics settings.\n");
+        return NULL;
+    }
+
+    newStatistics = (TRMStatistics *)calloc(1, sizeof(TRMStatistics));
+    if (newStatistics == NULL) {
+        fprintf(stderr, "Failed to malloc() space for statistics.\n");
+        return NULL;
+    }
+
+    newStatistics->controlRate = controlRate;
+    newStatistics->outputRate = outputRate;
+    newStatistics->controlPeriod = controlPeriod;
+
+    return newStatistics;
+}
+
+
+
+void TRMStatisticsFree(TRMStatistics *statistics)
+{
+    if (statistics == NULL)
+        return;
+
+    free(statistics->frames);
+    free(statistics);
+}
+
+
+
+/******************************************************************************
+*
+*       function:       frameAt
+*
+*       purpose:        Returns the statistics of a frame, growing the array
+*                       (with zeroed frames) if it does not reach that far
+*                       yet.  Returns NULL if there is no memory for it.
+*
+*       arguments:      frame
+*
+*       internal
+*       functions:      none
+*
+*       library
+*       functions:      realloc, memset
+*
+******************************************************************************/
+
+static TRMFrameStatistics *frameAt(TRMStatistics *statistics, long int frame)
+{
+    TRMFrameStatistics *frames;
+    long int size;
+
+    if (frame >= statistics->size) {
+        size = (statistics->size < 64) ? 64 : 2 * statistics->size;
+        if (size <= frame)
+            size = frame + 1;
+        frames = (TRMFrameStatistics *)realloc(statistics->frames, size * sizeof(TRMFrameStatistics));
+        if (frames == NULL)
+            return NULL;
+        memset(frames + statistics->size, 0, (size - statistics->size) * sizeof(TRMFrameStatistics));
+        statistics->frames = frames;
+        statistics->size = size;
+    }
+
+    if (frame >= statistics->numberFrames)
+        statistics->numberFrames = frame + 1;
+
+    return &(statistics->frames[frame]);
+}
+
+
+
+/******************************************************************************
+*
+*       function:       TRMStatisticsAddOutput
+*
+*       purpose:        Adds one output sample to the statistics of the
+*                       frame that it falls in.  Output sample n falls in
+*                       frame floor(n * controlRate / outputRate), which is
+*                       exact when both rates are whole numbers.  The frame
+*                       is only worked out when a frame boundary is passed.
+*
+*       arguments:      output
+*
+*       internal
+*       functions:      frameAt
+*
+*       library
+*       functions:      fabs, ceil
+*
+******************************************************************************/
+
+void TRMStatisticsAddOutput(TRMStatistics *statistics, double output)
+{
+    TRMFrameStatistics *frame;
+    double magnitude = fabs(output);
+
+    /*  FIND THE FRAME, AND WHERE THE NEXT ONE STARTS, AT EACH BOUNDARY  */
+    if (statistics->outputCount >= statistics->nextFrameStart) {
+        statistics->outputFrame = (long int)(((double)statistics->outputCount * statistics->controlRate) / statistics->outputRate);
+        statistics->nextFrameStart = (long int)ceil(((double)(statistics->outputFrame + 1) * statistics->outputRate) / statistics->controlRate);
+        if (frameAt(statistics, statistics->outputFrame) == NULL)
+            statistics->nextFrameStart = statistics->outputCount;
+    }
+
+    /*  THE ARRAY CAN MOVE WHEN SOURCE SAMPLES ARE ADDED, SO INDEX IT AFRESH  */
+    if (statistics->outputFrame < statistics->size) {
+        frame = &(statistics->frames[statistics->outputFrame]);
+        frame->samples += 1.0;
+        frame->energy += output * output;
+        if (magnitude > frame->peak)
+            frame->peak = magnitude;
+        frame->crossings += (double)((output < 0.0) != (statistics->previous < 0.0));
+    }
+
+    statistics->previous = output;
+    statistics->outputCount++;
+}
+
+
+
+/******************************************************************************
+*
+*       function:       TRMStatisticsAddSource
+*
+*       purpose:        Adds a block of glottal source samples, each
+*                       multiplied by scale, to the statistics of the frames
+*                       that they fall in.  A NULL source stands for zeros.
+*
+*       arguments:      source, scale, numberSamples
+*
+*       internal
+*       functions:      frameAt
+*
+*       library
+*       functions:      none
+*
+******************************************************************************/
+
+void TRMStatisticsAddSource(TRMStatistics *statistics, const double *source, double scale, int numberSamples)
+{
+    TRMFrameStatistics *frame;
+    double sum, value;
+    int i, j, count;
+
+    /*  GO ONE FRAME AT A TIME  */
+    for (i = 0; i < numberSamples; i += count) {
+        count = statistics->controlPeriod - (int)(statistics->sourceCount % statistics->controlPeriod);
+        if (count > numberSamples - i)
+            count = numberSamples - i;
+
+        sum = 0.0;
+        if (source != NULL) {
+            for (j = i; j < i + count; j++) {
+                value = source[j] * scale;
+                sum += value * value;
+            }
+        }
+
+        frame = frameAt(statistics, statistics->sourceCount / statistics->controlPeriod);
+        if (frame != NULL) {
+            frame->sourceSamples += (double)count;
+            frame->voicing += sum;
+        }
+        statistics->sourceCount += count;
+    }
+}
@@ -0,0 +1,70 @@
+/*******************************************************************************
+ *
+ *  Copyright (c) 1991-2009 David R. Hill, Leonard Manzara, Craig Schock
+ *  
+ *  Contributors: Steve Nygard
+ *
+ *  This program is free software: you can redistribute it and/or modify
+ *  it under the terms of the GNU General Public License as published by
+ *  the Free Software Foundation, either version 3 of the License, or
+ *  (at your option) any later version.
+ *
+ *  This program is distributed in the hope that it will be useful,
+ *  but WITHOUT ANY WARRANTY; without even the implied warranty of
+ *  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+ *  GNU General Public License for more details.
+ *
+ *  You should have received a copy of the GNU General Public License
+ *  along with this program.  If not, see <http://www.gnu.org/licenses/>.
+ *
+ *******************************************************************************
+ *  statistics.h
+ *  Tube
+ *
+ *  Version: 1.0.1
+ *
+ ******************************************************************************/
+
+#ifndef __STATISTICS_H
+#define __STATISTICS_H
+
+/*  SUMS OVER ONE CONTROL FRAME.  THE OUTPUT SAMPLES ARE THE ONES THAT THE
+    SAMPLE RATE CONVERTER (AND LIMITER, IF ANY) OUTPUTS DURING THE FRAME, AND
+    THE SOURCE SAMPLES ARE THE GLOTTAL PULSE THAT DRIVES THE TUBE, AT THE
+    INTERNAL SAMPLE RATE.  ALL FIELDS ARE DOUBLES, SO THAT AN ARRAY OF FRAMES
+    CAN BE COPIED OUT AS STATISTICS_FIELDS DOUBLES PER FRAME  */
+typedef struct _TRMFrameStatistics {
+    double samples;                     /*  number of output samples  */
+    double energy;                      /*  sum of squared output samples  */
+    double peak;                        /*  largest output magnitude  */
+    double crossings;                   /*  sign changes between output samples  */
+    double sourceSamples;               /*  number of source samples  */
+    double voicing;                     /*  sum of squared source samples  */
+} TRMFrameStatistics;
+
+#define STATISTICS_FIELDS         6
+
+/*  ACCUMULATES FRAME STATISTICS AS SAMPLES ARE PRODUCED.  THE FRAMES ARE
+    NUMBERED FROM THE FIRST SAMPLE SEEN, AND THE ARRAY GROWS AS NEEDED  */
+typedef struct _TRMStatistics {
+    double controlRate;                 /*  frames per second  */
+    double outputRate;                  /*  output samples per second  */
+    int controlPeriod;                  /*  source samples per frame  */
+
+    long int outputCount;               /*  output samples seen  */
+    long int outputFrame;               /*  frame of the last output sample  */
+    long int nextFrameStart;            /*  first output sample of the next frame  */
+    long int sourceCount;               /*  source samples seen  */
+    double previous;                    /*  the last output sample  */
+
+    TRMFrameStatistics *frames;
+    long int numberFrames;              /*  frames touched so far  */
+    long int size;                      /*  frames allocated  */
+} TRMStatistics;
+
+TRMStatistics *TRMStatisticsCreate(double controlRate, double outputRate, int controlPeriod);
+void TRMStatisticsFree(TRMStatistics *statistics);
+void TRMStatisticsAddOutput(TRMStatistics *statistics, double output);
+void TRMStatisticsAddSource(TRMStatistics *statistics, const double *source, double scale, int numberSamples);
+
+#endif
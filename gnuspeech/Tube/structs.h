@@ -104,7 +104,7 @@ typedef struct _INPUT {
 
 typedef struct _TRMInputParameters {
     int    outputFileFormat;            /*  file format (0=AU, 1=AIFF, 2=WAVE)  */
-    float  outputRate;                  /*  output sample rate (22.05, 44.1 KHz)  */
+    float  outputRate;                  /*  output sample rate (e.g. 8, 16, 22.05, 44.1 KHz)  */
     float  controlRate;                 /*  1.0-1000.0 input tables/second (Hz)  */
 
     double volume;                      /*  master volume (0 - 60 dB)  */
@@ -132,6 +132,8 @@ typedef struct _TRMInputParameters {
 
     int    modulation;                  /*  pulse mod. of noise (0=OFF, 1=ON)  */
     double mixOffset;                   /*  noise crossmix offset (30 - 60 dB)  */
+
+    int    noiseSeed;                   /*  noise generator seed (0=default)  */
 } TRMInputParameters;
 
 typedef struct _TRMData {
@@ -152,6 +154,23 @@ typedef struct _TRMSampleRateConverter {
     double maximumSampleValue;
     long int numberSamples;
     FILE *tempFilePtr;
+
+    // Optional in-memory sample storage, used instead of the temporary file
+    double *outputBuffer;
+    long int outputBufferSize;
+    long int outputBufferCount;
+
+    // If set, samples are scaled by outputGain and added to the buffer
+    int outputAccumulate;
+    double outputGain;
+
+    // Optional streaming loudness normalizer and limiter, applied to each
+    // sample before it is stored
+    struct _TRMLimiter *limiter;
+
+    // Optional per-frame statistics of the output, accumulated as samples
+    // are stored
+    struct _TRMStatistics *statistics;
 } TRMSampleRateConverter;
 
 /*  OROPHARYNX SCATTERING JUNCTION COEFFICIENTS (BETWEEN EACH REGION)  */
@@ -262,6 +281,20 @@ typedef struct {
     TRMSampleRateConverter sampleRateConverter;
     TRMRingBuffer *ringBuffer;
     TRMWavetable *wavetable;
+
+    //  NOISE GENERATOR STATE AND NOISE FILTER MEMORY
+    double noiseState;
+    double noiseX;
+
+    //  SYNTHESIS ENGINE (REFERENCE_ENGINE OR FAST_ENGINE), AND FAST ENGINE STATE
+    int engine;
+    struct _TRMFastTract *fastTract;
+
+    //  SILENCE SKIPPING: WHETHER IT IS ON, THE TUBE LEVEL BELOW WHICH IT
+    //  STARTS, AND THE NUMBER OF SAMPLES SKIPPED SO FAR
+    int skipSilence;
+    double silenceThreshold;
+    long int skippedSamples;
 } TRMTubeModel;
 
 #endif
@@ -82,6 +82,8 @@
 #include <sys/param.h>
 #include <math.h>
 #include <string.h>
+#include <stddef.h>
+#include <time.h>
 #include "tube.h"
 #include "input.h"
 #include "fir.h"
@@ -89,6 +91,9 @@
 #include "structs.h"
 #include "ring_buffer.h"
 #include "wavetable.h"
+#include "fast_tract.h"
+#include "limiter.h"
+#include "statistics.h"
 
 
 int verbose = 0;
@@ -100,6 +105,10 @@ int verbose = 0;
     SOME CONTROL RATE PARAMETERS  */
 #define MATCH_DSP                 0
 
+/*  NUMBER OF SAMPLES AT A TIME THAT ARE CHECKED FOR SILENCE, WHEN SKIPPING
+    SILENCE  */
+#define SILENCE_BLOCK             64
+
 
 /*  GLOBAL FUNCTIONS (LOCAL TO THIS FILE)  ***********************************/
 
@@ -111,19 +120,39 @@ void initializeNasalFilterCoefficients(TRMTubeModel *tubeModel, double coeff);
 double nasalReflectionFilter(TRMTubeModel *tubeModel, double input);
 double nasalRadiationFilter(TRMTubeModel *tubeModel, double input);
 
+void synthesizeSamples(TRMTubeModel *tubeModel, struct _TRMInputParameters *inputParameters, int numberSamples);
+void synthesizeSamplesReference(TRMTubeModel *tubeModel, struct _TRMInputParameters *inputParameters, int numberSamples);
+void synthesizeSamplesFast(TRMTubeModel *tubeModel, struct _TRMInputParameters *inputParameters, int numberSamples);
+void parameterStage(TRMTubeModel *tubeModel, struct _TRMInputParameters *inputParameters, int numberSamples);
+void gainStage(TRMTubeModel *tubeModel, struct _TRMInputParameters *inputParameters, int numberSamples);
+void sourceStage(TRMTubeModel *tubeModel, struct _TRMInputParameters *inputParameters, int numberSamples);
+void noiseStage(TRMTubeModel *tubeModel, struct _TRMInputParameters *inputParameters, int numberSamples);
+void mixStage(TRMTubeModel *tubeModel, struct _TRMInputParameters *inputParameters, int numberSamples);
+void tractStage(TRMTubeModel *tubeModel, struct _TRMInputParameters *inputParameters, int numberSamples);
+void outputStage(TRMTubeModel *tubeModel, struct _TRMInputParameters *inputParameters, int numberSamples);
+int sourcesSilent(TRMTubeModel *tubeModel, int numberSamples);
+double tractLevel(TRMTubeModel *tubeModel);
+void skipSamples(TRMTubeModel *tubeModel, int numberSamples);
 void setControlRateParameters(TRMTubeModel *tubeModel, INPUT *previousInput, INPUT *currentInput);
 void sampleRateInterpolation(TRMTubeModel *tubeModel);
 void initializeNasalCavity(TRMTubeModel *tubeModel, struct _TRMInputParameters *inputParameters);
 void initializeThroat(TRMTubeModel *tubeModel, struct _TRMInputParameters *inputParameters);
 void calculateTubeCoefficients(TRMTubeModel *tubeModel, struct _TRMInputParameters *inputParameters);
+void calculateTubeCoefficientsFrom(TRMTubeModel *tubeModel, struct _TRMInputParameters *inputParameters, const TRMParameters *parameters);
 void setFricationTaps(TRMTubeModel *tubeModel);
+void setFricationTapsFrom(TRMTubeModel *tubeModel, double fricPos, double fricationAmplitude);
 void calculateBandpassCoefficients(TRMTubeModel *tubeModel, int sampleRate);
+void calculateBandpassCoefficientsFrom(TRMTubeModel *tubeModel, int sampleRate, double fricCF, double fricBW);
 double vocalTract(TRMTubeModel *tubeModel, double input, double frication);
 double throat(TRMTubeModel *tubeModel, double input);
 double bandpassFilter(TRMTubeModel *tubeModel, double input);
 
 void initializeConversion(TRMTubeModel *tubeModel, struct _TRMInputParameters *inputParameters);
 void resampleBuffer(struct _TRMRingBuffer *aRingBuffer, void *context);
+int resampleZeros(struct _TRMRingBuffer *aRingBuffer, TRMSampleRateConverter *aConverter, int endPtr);
+void storeSample(TRMSampleRateConverter *aConverter, double output);
+void writeSample(TRMSampleRateConverter *aConverter, double output);
+void flushLimiter(TRMSampleRateConverter *aConverter);
 void initializeFilter(TRMSampleRateConverter *sampleRateConverter);
 
 /******************************************************************************
@@ -134,280 +163,1121 @@ void initializeFilter(TRMSampleRateConverter *sampleRateConverter);
 *                       for the mouth, according to the mouth aperture
 *                       coefficient.
 *
-*       arguments:      coeff - mouth aperture coefficient
+*       arguments:      coeff - mouth aperture coefficient
+*
+*       internal
+*       functions:      none
+*
+*       library
+*       functions:      fabs
+*
+******************************************************************************/
+
+void initializeMouthCoefficients(TRMTubeModel *tubeModel, double coeff)
+{
+    tubeModel->b11 = -coeff;
+    tubeModel->a10 = 1.0 - fabs(tubeModel->b11);
+
+    tubeModel->a20 = coeff;
+    tubeModel->a21 = tubeModel->b21 = -(tubeModel->a20);
+}
+
+
+
+/******************************************************************************
+*
+*       function:       reflectionFilter
+*
+*       purpose:        Is a variable, one-pole lowpass filter, whose cutoff
+*                       is determined by the mouth aperture coefficient.
+*
+*       arguments:      input
+*
+*       internal
+*       functions:      none
+*
+*       library
+*       functions:      none
+*
+******************************************************************************/
+
+double reflectionFilter(TRMTubeModel *tubeModel, double input)
+{
+    static double reflectionY = 0.0;
+
+    double output = (tubeModel->a10 * input) - (tubeModel->b11 * reflectionY);
+    reflectionY = output;
+    return output;
+}
+
+
+
+/******************************************************************************
+*
+*       function:       radiationFilter
+*
+*       purpose:        Is a variable, one-zero, one-pole, highpass filter,
+*                       whose cutoff point is determined by the mouth aperture
+*                       coefficient.
+*
+*       arguments:      input
+*
+*       internal
+*       functions:      none
+*
+*       library
+*       functions:      none
+*
+******************************************************************************/
+
+double radiationFilter(TRMTubeModel *tubeModel, double input)
+{
+    static double radiationX = 0.0, radiationY = 0.0;
+
+    double output = (tubeModel->a20 * input) + (tubeModel->a21 * radiationX) - (tubeModel->b21 * radiationY);
+    radiationX = input;
+    radiationY = output;
+    return output;
+}
+
+
+
+/******************************************************************************
+*
+*       function:       initializeNasalFilterCoefficients
+*
+*       purpose:        Calculates the fixed coefficients for the nasal
+*                       reflection/radiation filter pair, according to the
+*                       nose aperture coefficient.
+*
+*       arguments:      coeff - nose aperture coefficient
+*
+*       internal
+*       functions:      none
+*
+*       library
+*       functions:      fabs
+*
+******************************************************************************/
+
+void initializeNasalFilterCoefficients(TRMTubeModel *tubeModel, double coeff)
+{
+    tubeModel->nb11 = -coeff;
+    tubeModel->na10 = 1.0 - fabs(tubeModel->nb11);
+
+    tubeModel->na20 = coeff;
+    tubeModel->na21 = tubeModel->nb21 = -(tubeModel->na20);
+}
+
+
+
+/******************************************************************************
+*
+*       function:       nasalReflectionFilter
+*
+*       purpose:        Is a one-pole lowpass filter, used for terminating
+*                       the end of the nasal cavity.
+*
+*       arguments:      input
+*
+*       internal
+*       functions:      none
+*
+*       library
+*       functions:      none
+*
+******************************************************************************/
+
+double nasalReflectionFilter(TRMTubeModel *tubeModel, double input)
+{
+    static double nasalReflectionY = 0.0;
+
+    double output = (tubeModel->na10 * input) - (tubeModel->nb11 * nasalReflectionY);
+    nasalReflectionY = output;
+    return output;
+}
+
+
+
+/******************************************************************************
+*
+*       function:       nasalRadiationFilter
+*
+*       purpose:        Is a one-zero, one-pole highpass filter, used for the
+*                       radiation characteristic from the nasal cavity.
+*
+*       arguments:      input
+*
+*       internal
+*       functions:      none
+*
+*       library
+*       functions:      none
+*
+******************************************************************************/
+
+double nasalRadiationFilter(TRMTubeModel *tubeModel, double input)
+{
+    static double nasalRadiationX = 0.0, nasalRadiationY = 0.0;
+
+    double output = (tubeModel->na20 * input) + (tubeModel->na21 * nasalRadiationX) - (tubeModel->nb21 * nasalRadiationY);
+    nasalRadiationX = input;
+    nasalRadiationY = output;
+    return output;
+}
+
+/******************************************************************************
+*
+*       function:       synthesize
+*
+*       purpose:        Performs the actual synthesis of sound samples.
+*
+*       arguments:      none
+*
+*       internal
+*       functions:      setControlRateParameters, frequency, amplitude,
+*                       calculateTubeCoefficients, noise, noiseFilter,
+*                       updateWavetable, oscillator, vocalTract, throat,
+*                       dataFill, sampleRateInterpolation
+*
+*       library
+*       functions:      none
+*
+******************************************************************************/
+
+void synthesize(TRMTubeModel *tubeModel, TRMData *data)
+{
+    INPUT *previousInput, *currentInput;
+
+    /*  CONTROL RATE LOOP  */
+
+    if (data->inputHead == NULL) {
+        // No data
+        return;
+    }
+
+    previousInput = data->inputHead;
+    currentInput = data->inputHead->next;
+
+    while (currentInput != NULL) {
+        /*  SET CONTROL RATE PARAMETERS FROM INPUT TABLES  */
+        setControlRateParameters(tubeModel, previousInput, currentInput);
+
+        /*  SAMPLE RATE LOOP  */
+        synthesizeSamples(tubeModel, &(data->inputParameters), tubeModel->controlPeriod);
+
+        previousInput = currentInput;
+        currentInput = currentInput->next;
+    }
+
+    /*  BE SURE TO FLUSH SRC BUFFER  */
+    finishSynthesis(tubeModel);
+}
+
+
+
+/******************************************************************************
+*
+*       function:       finishSynthesis
+*
+*       purpose:        Flushes the sample rate converter and the limiter, so
+*                       that every synthesized sample has been output.  Call
+*                       this at the end of a stream of synthesizeBlock calls.
+*
+*       arguments:      none
+*
+*       internal
+*       functions:      flushBuffer, flushLimiter
+*
+*       library
+*       functions:      none
+*
+******************************************************************************/
+
+void finishSynthesis(TRMTubeModel *tubeModel)
+{
+    flushBuffer(tubeModel->ringBuffer);
+    flushLimiter(&(tubeModel->sampleRateConverter));
+}
+
+
+
+/******************************************************************************
+*
+*       function:       synthesizeBlock
+*
+*       purpose:        Synthesizes a block of samples while ramping the
+*                       current control parameters linearly towards the
+*                       target values, and then converts whatever the ring
+*                       buffer holds, so that output can be streamed in
+*                       short blocks rather than a whole utterance at once.
+*
+*       arguments:      target - the 16 control parameters of one frame, in
+*                                the same order as a line of an input file
+*                       numberSamples - length of the ramp, in samples at
+*                                the internal sample rate (0 jumps directly
+*                                to the target)
+*
+*       internal
+*       functions:      synthesizeSamples, drainBuffer
+*
+*       library
+*       functions:      none
+*
+******************************************************************************/
+
+void synthesizeBlock(TRMTubeModel *tubeModel, struct _TRMInputParameters *inputParameters, double *target, int numberSamples)
+{
+    int i;
+    double *parameters = (double *)&(tubeModel->current.parameters);
+    double *delta = (double *)&(tubeModel->current.delta);
+
+    /*  SET THE SAMPLE-TO-SAMPLE DELTAS TOWARDS THE TARGET FRAME  */
+    for (i = 0; i < (int)(sizeof(TRMParameters) / sizeof(double)); i++) {
+        if (numberSamples > 0) {
+            delta[i] = (target[i] - parameters[i]) / (double)numberSamples;
+        } else {
+            parameters[i] = target[i];
+            delta[i] = 0.0;
+        }
+    }
+
+    if (numberSamples <= 0)
+        return;
+
+    /*  SAMPLE RATE LOOP  */
+    synthesizeSamples(tubeModel, inputParameters, numberSamples);
+
+    /*  CONVERT THE SAMPLES THAT ARE READY  */
+    drainBuffer(tubeModel->ringBuffer);
+}
+
+
+
+/******************************************************************************
+*
+*       function:       synthesizeKeyframes
+*
+*       purpose:        Synthesizes sound from sparse keyframes, each placed
+*                       at an arbitrary time, rather than from input tables
+*                       spaced one control period apart.  The controls are
+*                       ramped linearly from each keyframe to the next at the
+*                       sample rate, the same way as setControlRateParameters
+*                       and sampleRateInterpolation ramp them between input
+*                       tables.
+*
+*       arguments:      keyframes - the 16 control parameters of each
+*                                keyframe, in the same order as a line of an
+*                                input file, one keyframe after another
+*                       times - the time of each keyframe, in seconds (must
+*                                not decrease)
+*                       numberKeyframes - the number of keyframes
+*
+*       internal
+*       functions:      synthesizeSamples, finishSynthesis
+*
+*       library
+*       functions:      rint
+*
+******************************************************************************/
+
+void synthesizeKeyframes(TRMTubeModel *tubeModel, struct _TRMInputParameters *inputParameters, double *keyframes, double *times, int numberKeyframes)
+{
+    int i, j, numberSamples;
+    int numberParameters = (int)(sizeof(TRMParameters) / sizeof(double));
+    long int start, end;
+    double *parameters = (double *)&(tubeModel->current.parameters);
+    double *delta = (double *)&(tubeModel->current.delta);
+    double *previous, *next;
+
+    if (numberKeyframes < 2)
+        return;
+
+    end = (long int)rint(times[0] * tubeModel->sampleRate);
+    for (i = 1; i < numberKeyframes; i++) {
+        start = end;
+        end = (long int)rint(times[i] * tubeModel->sampleRate);
+        numberSamples = (int)(end - start);
+        if (numberSamples <= 0)
+            continue;
+
+        /*  START EACH SEGMENT EXACTLY AT ITS KEYFRAME, SO THAT ROUNDING
+            ERRORS DO NOT ACCUMULATE FROM ONE SEGMENT TO THE NEXT  */
+        previous = keyframes + (i - 1) * numberParameters;
+        next = keyframes + i * numberParameters;
+        for (j = 0; j < numberParameters; j++) {
+            parameters[j] = previous[j];
+            delta[j] = (next[j] - previous[j]) / (double)numberSamples;
+        }
+
+        /*  SAMPLE RATE LOOP  */
+        synthesizeSamples(tubeModel, inputParameters, numberSamples);
+    }
+
+    /*  BE SURE TO FLUSH SRC BUFFER  */
+    finishSynthesis(tubeModel);
+}
+
+
+
+/******************************************************************************
+*
+*       function:       seekSynthesis
+*
+*       purpose:        Prepares a new tube model to synthesize input tables
+*                       that follow numberTables other tables, so that its
+*                       glottal oscillator phase, noise generator and sample
+*                       rate converter phase match an uninterrupted
+*                       synthesis of all of the tables.  The tube and filter
+*                       memories are not reproduced, so the first tables
+*                       synthesized after seeking should be used as warm-up.
+*
+*       arguments:      glotPitch - the glottal pitch of the numberTables + 1
+*                                tables up to and including the first one
+*                                that will be synthesized
+*                       numberTables - the number of table intervals to skip
+*
+*       returns:        the number of output samples that an uninterrupted
+*                       synthesis produces before the first output sample
+*                       of the seeking model
+*
+*       internal
+*       functions:      frequency, noise, noiseFilter, TRMWavetableAdvance
+*
+*       library
+*       functions:      none
+*
+******************************************************************************/
+
+long int seekSynthesis(TRMTubeModel *tubeModel, double *glotPitch, int numberTables)
+{
+    TRMSampleRateConverter *aConverter = &(tubeModel->sampleRateConverter);
+    long long position, numberSamples, skipped;
+    double pitch, delta;
+    int i, j;
+
+    for (i = 0; i < numberTables; i++) {
+        /*  RAMP THE PITCH THE SAME WAY AS setControlRateParameters AND
+            sampleRateInterpolation, SO THE OSCILLATOR PHASE MATCHES  */
+        pitch = glotPitch[i];
+        delta = (glotPitch[i + 1] - pitch) / (double)tubeModel->controlPeriod;
+        for (j = 0; j < tubeModel->controlPeriod; j++) {
+            TRMWavetableAdvance(tubeModel->wavetable, frequency(pitch));
+            noiseFilter(noise(&tubeModel->noiseState), &tubeModel->noiseX);
+            pitch += delta;
+        }
+    }
+
+    /*  AN UNINTERRUPTED CONVERSION PLACES OUTPUT SAMPLE J AT INPUT POSITION
+        J * timeRegisterIncrement (IN FIXED POINT).  START AT THE FIRST OUTPUT
+        SAMPLE THAT FALLS AFTER THE SKIPPED INPUT SAMPLES  */
+    numberSamples = (long long)numberTables * tubeModel->controlPeriod;
+    skipped = ((numberSamples << FRACTION_BITS) + aConverter->timeRegisterIncrement - 1) / aConverter->timeRegisterIncrement;
+    position = (skipped * aConverter->timeRegisterIncrement) - (numberSamples << FRACTION_BITS);
+    aConverter->timeRegister = (unsigned int)(position & FRACTION_MASK);
+    tubeModel->ringBuffer->emptyPtr = (int)(position >> FRACTION_BITS);
+
+    return (long int)skipped;
+}
+
+
+
+/******************************************************************************
+*
+*       function:       synthesizeSamples
+*
+*       purpose:        Synthesizes sound samples with the engine selected
+*                       for the tube model.  If the model skips silence, and
+*                       all of the sources are off and the tube has died
+*                       away, zeros are output instead.
+*
+*       arguments:      numberSamples
+*
+*       internal
+*       functions:      synthesizeSamplesReference, synthesizeSamplesFast,
+*                       sourcesSilent, tractLevel, skipSamples
+*
+*       library
+*       functions:      none
+*
+******************************************************************************/
+
+void synthesizeSamples(TRMTubeModel *tubeModel, struct _TRMInputParameters *inputParameters, int numberSamples)
+{
+    int i, count;
+
+    if (!tubeModel->skipSilence) {
+        if (tubeModel->engine == FAST_ENGINE)
+            synthesizeSamplesFast(tubeModel, inputParameters, numberSamples);
+        else
+            synthesizeSamplesReference(tubeModel, inputParameters, numberSamples);
+        return;
+    }
+
+    /*  GO A FEW SAMPLES AT A TIME, SO THAT SKIPPING STARTS SOON AFTER THE
+        TUBE DIES AWAY, AND STOPS AS SOON AS A SOURCE TURNS ON  */
+    for (i = 0; i < numberSamples; i += count) {
+        count = (numberSamples - i < SILENCE_BLOCK) ? numberSamples - i : SILENCE_BLOCK;
+        if (sourcesSilent(tubeModel, count) && (tractLevel(tubeModel) < tubeModel->silenceThreshold))
+            skipSamples(tubeModel, count);
+        else if (tubeModel->engine == FAST_ENGINE)
+            synthesizeSamplesFast(tubeModel, inputParameters, count);
+        else
+            synthesizeSamplesReference(tubeModel, inputParameters, count);
+    }
+}
+
+
+
+/******************************************************************************
+*
+*       function:       sourcesSilent
+*
+*       purpose:        Returns 1 if the glottal, aspiration and frication
+*                       volumes stay at 0 dB (no output at all) over the next
+*                       numberSamples samples, and 0 otherwise.  The volumes
+*                       ramp linearly, so only the ends of the ramps need to
+*                       be checked.
+*
+*       arguments:      numberSamples
+*
+*       internal
+*       functions:      none
+*
+*       library
+*       functions:      none
+*
+******************************************************************************/
+
+int sourcesSilent(TRMTubeModel *tubeModel, int numberSamples)
+{
+    TRMParameters *parameters = &(tubeModel->current.parameters);
+    TRMParameters *delta = &(tubeModel->current.delta);
+    double n = (double)(numberSamples - 1);
+
+    return (parameters->glotVol <= 0.0) && (parameters->glotVol + (n * delta->glotVol) <= 0.0) &&
+        (parameters->aspVol <= 0.0) && (parameters->aspVol + (n * delta->aspVol) <= 0.0) &&
+        (parameters->fricVol <= 0.0) && (parameters->fricVol + (n * delta->fricVol) <= 0.0);
+}
+
+
+
+/******************************************************************************
+*
+*       function:       tractLevel
+*
+*       purpose:        Returns the largest magnitude of the pressure waves
+*                       held in the oropharynx and nasal cavity of the engine
+*                       selected for the tube model.
+*
+*       arguments:      none
+*
+*       internal
+*       functions:      none
+*
+*       library
+*       functions:      fabs, fmax
+*
+******************************************************************************/
+
+double tractLevel(TRMTubeModel *tubeModel)
+{
+    int i, j, n[2];
+    double *memory[2], level = 0.0;
+
+    if (tubeModel->engine == FAST_ENGINE) {
+        memory[0] = (double *)tubeModel->fastTract->oropharynx;
+        n[0] = sizeof(tubeModel->fastTract->oropharynx) / sizeof(double);
+        memory[1] = (double *)tubeModel->fastTract->nasal;
+        n[1] = sizeof(tubeModel->fastTract->nasal) / sizeof(double);
+    } else {
+        memory[0] = (double *)tubeModel->oropharynx;
+        n[0] = sizeof(tubeModel->oropharynx) / sizeof(double);
+        memory[1] = (double *)tubeModel->nasal;
+        n[1] = sizeof(tubeModel->nasal) / sizeof(double);
+    }
+
+    for (i = 0; i < 2; i++)
+        for (j = 0; j < n[i]; j++)
+            level = fmax(level, fabs(memory[i][j]));
+
+    return level;
+}
+
+
+
+/******************************************************************************
+*
+*       function:       skipSamples
+*
+*       purpose:        Outputs numberSamples zeros in place of synthesized
+*                       samples, for stretches where sourcesSilent and
+*                       tractLevel show that the output would be
+*                       inaudible.  The tube memory is cleared, while the
+*                       control parameters, glottal oscillator and noise
+*                       generator advance just as they would during
+*                       synthesis, so that synthesis afterwards carries on
+*                       where it would otherwise have been.  Only the tube
+*                       is skipped:  the oscillator, noise generator and
+*                       sample rate converter still run once per sample.
+*                       The filter memory that the reference engine keeps
+*                       in statics is left as it was.
+*
+*       arguments:      numberSamples
+*
+*       internal
+*       functions:      frequency, noise, noiseFilter, TRMWavetableAdvance,
+*                       dataFill, sampleRateInterpolation,
+*                       TRMStatisticsAddSource
+*
+*       library
+*       functions:      memset
+*
+******************************************************************************/
+
+void skipSamples(TRMTubeModel *tubeModel, int numberSamples)
+{
+    int j;
+    TRMFastTract *tract = tubeModel->fastTract;
+
+    memset(tubeModel->oropharynx, 0, sizeof(tubeModel->oropharynx));
+    memset(tubeModel->nasal, 0, sizeof(tubeModel->nasal));
+    memset(tract->oropharynx, 0, sizeof(tract->oropharynx));
+    memset(tract->nasal, 0, sizeof(tract->nasal));
+    tract->reflectionY = tract->radiationX = tract->radiationY = 0.0;
+    tract->nasalReflectionY = tract->nasalRadiationX = tract->nasalRadiationY = 0.0;
+    tract->throatY = 0.0;
+
+    for (j = 0; j < numberSamples; j++) {
+        TRMWavetableAdvance(tubeModel->wavetable, frequency(tubeModel->current.parameters.glotPitch));
+        noiseFilter(noise(&tubeModel->noiseState), &tubeModel->noiseX);
+        dataFill(tubeModel->ringBuffer, 0.0);
+        sampleRateInterpolation(tubeModel);
+    }
+
+    if (tubeModel->sampleRateConverter.statistics != NULL)
+        TRMStatisticsAddSource(tubeModel->sampleRateConverter.statistics, NULL, 0.0, numberSamples);
+
+    tubeModel->skippedSamples += numberSamples;
+}
+
+
+
+/******************************************************************************
+*
+*       function:       synthesizeSamplesReference
+*
+*       purpose:        Performs the actual synthesis of sound samples, using
+*                       the current control rate parameters and deltas.
+*
+*       arguments:      numberSamples
+*
+*       internal
+*       functions:      frequency, amplitude, calculateTubeCoefficients,
+*                       setFricationTaps, calculateBandpassCoefficients,
+*                       noise, noiseFilter, updateWavetable, oscillator,
+*                       vocalTract, throat, dataFill, sampleRateInterpolation,
+*                       TRMStatisticsAddSource
+*
+*       library
+*       functions:      none
+*
+******************************************************************************/
+
+void synthesizeSamplesReference(TRMTubeModel *tubeModel, struct _TRMInputParameters *inputParameters, int numberSamples)
+{
+    int j;
+    double f0, ax, ah1, pulse, lp_noise, pulsed_noise, signal, crossmix;
+
+    for (j = 0; j < numberSamples; j++) {
+
+        /*  CONVERT PARAMETERS HERE  */
+        f0 = frequency(tubeModel->current.parameters.glotPitch);
+        ax = amplitude(tubeModel->current.parameters.glotVol);
+        ah1 = amplitude(tubeModel->current.parameters.aspVol);
+        calculateTubeCoefficients(tubeModel, inputParameters);
+        setFricationTaps(tubeModel);
+        calculateBandpassCoefficients(tubeModel, tubeModel->sampleRate);
+
+
+        /*  DO SYNTHESIS HERE  */
+        /*  CREATE LOW-PASS FILTERED NOISE  */
+        lp_noise = noiseFilter(noise(&tubeModel->noiseState), &tubeModel->noiseX);
+
+        /*  UPDATE THE SHAPE OF THE GLOTTAL PULSE, IF NECESSARY  */
+        if (inputParameters->waveform == PULSE)
+            TRMWavetableUpdate(tubeModel->wavetable, ax);
+
+        /*  CREATE GLOTTAL PULSE (OR SINE TONE)  */
+        pulse = TRMWavetableOscillator(tubeModel->wavetable, f0);
+
+        /*  CREATE PULSED NOISE  */
+        pulsed_noise = lp_noise * pulse;
+
+        /*  CREATE NOISY GLOTTAL PULSE  */
+        pulse = ax * ((pulse * (1.0 - tubeModel->breathinessFactor)) + (pulsed_noise * tubeModel->breathinessFactor));
+        if (tubeModel->sampleRateConverter.statistics != NULL)
+            TRMStatisticsAddSource(tubeModel->sampleRateConverter.statistics, &pulse, 1.0, 1);
+
+        /*  CROSS-MIX PURE NOISE WITH PULSED NOISE  */
+        if (inputParameters->modulation) {
+            crossmix = ax * tubeModel->crossmixFactor;
+            crossmix = (crossmix < 1.0) ? crossmix : 1.0;
+            signal = (pulsed_noise * crossmix) + (lp_noise * (1.0 - crossmix));
+            if (verbose) {
+                printf("\nSignal = %e", signal);
+                fflush(stdout);
+            }
+
+
+        } else
+            signal = lp_noise;
+
+        /*  PUT SIGNAL THROUGH VOCAL TRACT  */
+        signal = vocalTract(tubeModel, ((pulse + (ah1 * signal)) * VT_SCALE), bandpassFilter(tubeModel, signal));
+
+
+        /*  PUT PULSE THROUGH THROAT  */
+        signal += throat(tubeModel, pulse * VT_SCALE);
+        if (verbose)
+            printf("\nDone throat\n");
+
+        /*  OUTPUT SAMPLE HERE  */
+        dataFill(tubeModel->ringBuffer, signal);
+        if (verbose)
+            printf("\nDone datafil\n");
+
+        /*  DO SAMPLE RATE INTERPOLATION OF CONTROL PARAMETERS  */
+        sampleRateInterpolation(tubeModel);
+        if (verbose)
+            printf("\nDone sample rate interp\n");
+
+    }
+}
+
+
+/******************************************************************************
+*
+*       function:       vocalTractFast
+*
+*       purpose:        Same as vocalTract, throat and bandpassFilter, but
+*                       using flat, double-buffered tube memory and
+*                       per-model filter memory, with the filters inlined and
+*                       no branches.  Returns the summed output of the oral
+*                       and nasal cavities plus the throat.
+*
+*       arguments:      input, noise (before the frication filter),
+*                       throatInput
+*
+*       internal
+*       functions:      none
+*
+*       library
+*       functions:      none
+*
+******************************************************************************/
+
+static inline double vocalTractFast(TRMTubeModel *tubeModel, TRMFastTract *tract, double input, double noise, double throatInput)
+{
+    int i;
+    double delta, output, junctionPressure, x, frication;
+    const double dampingFactor = tubeModel->dampingFactor;
+    const double *coeff = tubeModel->oropharynx_coeff;
+    const double *nasalCoeff = tubeModel->nasal_coeff;
+    const double *tap = tubeModel->fricationTap;
+    int current = tract->current ^ 1, prev = tract->current;
+    const double *prevTop = tract->oropharynx[prev][TOP], *prevBottom = tract->oropharynx[prev][BOTTOM];
+    double *top = tract->oropharynx[current][TOP], *bottom = tract->oropharynx[current][BOTTOM];
+    const double *nasalPrevTop = tract->nasal[prev][TOP], *nasalPrevBottom = tract->nasal[prev][BOTTOM];
+    double *nasalTop = tract->nasal[current][TOP], *nasalBottom = tract->nasal[current][BOTTOM];
+
+    tract->current = current;
+
+    /*  FRICATION BANDPASS FILTER  */
+    frication = 2.0 * ((tubeModel->bpAlpha * (noise - tract->bpXn2)) + (tubeModel->bpGamma * tract->bpYn1) - (tubeModel->bpBeta * tract->bpYn2));
+    tract->bpXn2 = tract->bpXn1;
+    tract->bpXn1 = noise;
+    tract->bpYn2 = tract->bpYn1;
+    tract->bpYn1 = frication;
+
+    /*  INPUT TO TOP OF TUBE  */
+    top[S1] = (prevBottom[S1] * dampingFactor) + input;
+
+    /*  S1-S2  */
+    delta = coeff[C1] * (prevTop[S1] - prevBottom[S2]);
+    top[S2] = (prevTop[S1] + delta) * dampingFactor;
+    bottom[S1] = (prevBottom[S2] + delta) * dampingFactor;
+
+    /*  S2-S3 AND S3-S4  */
+    for (i = S2; i < S4; i++) {
+        delta = coeff[i] * (prevTop[i] - prevBottom[i+1]);
+        top[i+1] = ((prevTop[i] + delta) * dampingFactor) + (tap[i-S2+FC1] * frication);
+        bottom[i] = (prevBottom[i+1] + delta) * dampingFactor;
+    }
+
+    /*  3-WAY JUNCTION BETWEEN THE MIDDLE OF R4 AND NASAL CAVITY  */
+    junctionPressure = (tubeModel->alpha[LEFT] * prevTop[S4]) +
+        (tubeModel->alpha[RIGHT] * prevBottom[S5]) +
+        (tubeModel->alpha[UPPER] * nasalPrevBottom[TRM_VELUM]);
+    bottom[S4] = (junctionPressure - prevTop[S4]) * dampingFactor;
+    top[S5] = ((junctionPressure - prevBottom[S5]) * dampingFactor) + (tap[FC3] * frication);
+    nasalTop[TRM_VELUM] = (junctionPressure - nasalPrevBottom[TRM_VELUM]) * dampingFactor;
+
+    /*  S5-S6  */
+    delta = coeff[C4] * (prevTop[S5] - prevBottom[S6]);
+    top[S6] = ((prevTop[S5] + delta) * dampingFactor) + (tap[FC4] * frication);
+    bottom[S5] = (prevBottom[S6] + delta) * dampingFactor;
+
+    /*  S6-S7 (PURE DELAY WITH DAMPING)  */
+    top[S7] = (prevTop[S6] * dampingFactor) + (tap[FC5] * frication);
+    bottom[S6] = prevBottom[S7] * dampingFactor;
+
+    /*  S7-S8, S8-S9, S9-S10  */
+    for (i = S7; i < S10; i++) {
+        delta = coeff[i-S7+C5] * (prevTop[i] - prevBottom[i+1]);
+        top[i+1] = ((prevTop[i] + delta) * dampingFactor) + (tap[i-S7+FC6] * frication);
+        bottom[i] = (prevBottom[i+1] + delta) * dampingFactor;
+    }
+
+    /*  MOUTH REFLECTION (LOWPASS) AND RADIATION (HIGHPASS) FILTERS  */
+    x = coeff[C8] * prevTop[S10];
+    tract->reflectionY = (tubeModel->a10 * x) - (tubeModel->b11 * tract->reflectionY);
+    bottom[S10] = dampingFactor * tract->reflectionY;
+
+    x = (1.0 + coeff[C8]) * prevTop[S10];
+    output = (tubeModel->a20 * x) + (tubeModel->a21 * tract->radiationX) - (tubeModel->b21 * tract->radiationY);
+    tract->radiationX = x;
+    tract->radiationY = output;
+
+    /*  NASAL CAVITY  */
+    for (i = TRM_VELUM; i < TRM_N6; i++) {
+        delta = nasalCoeff[i-TRM_VELUM+NC1] * (nasalPrevTop[i] - nasalPrevBottom[i+1]);
+        nasalTop[i+1] = (nasalPrevTop[i] + delta) * dampingFactor;
+        nasalBottom[i] = (nasalPrevBottom[i+1] + delta) * dampingFactor;
+    }
+
+    /*  NOSE REFLECTION (LOWPASS) AND RADIATION (HIGHPASS) FILTERS  */
+    x = nasalCoeff[NC6] * nasalPrevTop[TRM_N6];
+    tract->nasalReflectionY = (tubeModel->na10 * x) - (tubeModel->nb11 * tract->nasalReflectionY);
+    nasalBottom[TRM_N6] = dampingFactor * tract->nasalReflectionY;
+
+    x = (1.0 + nasalCoeff[NC6]) * nasalPrevTop[TRM_N6];
+    delta = (tubeModel->na20 * x) + (tubeModel->na21 * tract->nasalRadiationX) - (tubeModel->nb21 * tract->nasalRadiationY);
+    tract->nasalRadiationX = x;
+    tract->nasalRadiationY = delta;
+    output += delta;
+
+    /*  THROAT  */
+    tract->throatY = (tubeModel->ta0 * throatInput) + (tubeModel->tb1 * tract->throatY);
+
+    return output + (tract->throatY * tubeModel->throatGain);
+}
+
+
+
+/******************************************************************************
+*
+*       function:       synthesizeSamplesFast
+*
+*       purpose:        Performs the same synthesis as
+*                       synthesizeSamplesReference, as a pipeline of stages
+*                       that each process a block of samples before the next
+*                       stage runs.  The stages pass their results on in the
+*                       buffers of the model's TRMPipeline, and are called
+*                       through its stage table, so that each can be timed
+*                       (see TRMTubeModelProfileStages) or replaced (see
+*                       TRMTubeModelSetStage) on its own.
+*
+*       arguments:      numberSamples
+*
+*       internal
+*       functions:      the stages in the pipeline's stage table,
+*                       stageClock
+*
+*       library
+*       functions:      none
+*
+******************************************************************************/
+
+static double stageClock(void)
+{
+    struct timespec now;
+
+    clock_gettime(CLOCK_MONOTONIC, &now);
+    return now.tv_sec + (now.tv_nsec * 1.0e-9);
+}
+
+void synthesizeSamplesFast(TRMTubeModel *tubeModel, struct _TRMInputParameters *inputParameters, int numberSamples)
+{
+    int i, stage, count;
+    double start, end;
+    TRMPipeline *pipeline = &(tubeModel->fastTract->pipeline);
+
+    /*  THE BANDPASS COEFFICIENTS ONLY DEPEND ON THE FRICATION CF AND BW.
+        FORGET THE CACHED VALUES, SINCE THE REFERENCE ENGINE MAY HAVE RUN
+        MEANWHILE  */
+    tubeModel->fastTract->bandpassCF = tubeModel->fastTract->bandpassBW = -1.0;
+
+    for (i = 0; i < numberSamples; i += count) {
+        count = (numberSamples - i < PIPELINE_BLOCK) ? numberSamples - i : PIPELINE_BLOCK;
+
+        if (!pipeline->profile) {
+            for (stage = 0; stage < TOTAL_STAGES; stage++)
+                (*(pipeline->stage[stage]))(tubeModel, inputParameters, count);
+            continue;
+        }
+
+        start = stageClock();
+        for (stage = 0; stage < TOTAL_STAGES; stage++) {
+            (*(pipeline->stage[stage]))(tubeModel, inputParameters, count);
+            end = stageClock();
+            pipeline->seconds[stage] += end - start;
+            start = end;
+        }
+    }
+}
+
+
+
+/******************************************************************************
+*
+*       function:       parameterStage
+*
+*       purpose:        Records the control parameters for each sample of
+*                       the block, and moves the parameters ahead to the end
+*                       of the block.  This is the only stage that changes
+*                       the current parameters.
+*
+*       arguments:      numberSamples
 *
 *       internal
-*       functions:      none
+*       functions:      sampleRateInterpolation
 *
 *       library
-*       functions:      fabs
+*       functions:      none
 *
 ******************************************************************************/
 
-void initializeMouthCoefficients(TRMTubeModel *tubeModel, double coeff)
+void parameterStage(TRMTubeModel *tubeModel, struct _TRMInputParameters *inputParameters, int numberSamples)
 {
-    tubeModel->b11 = -coeff;
-    tubeModel->a10 = 1.0 - fabs(tubeModel->b11);
+    int j;
+    TRMParameters *parameters = tubeModel->fastTract->pipeline.parameters;
 
-    tubeModel->a20 = coeff;
-    tubeModel->a21 = tubeModel->b21 = -(tubeModel->a20);
+    for (j = 0; j < numberSamples; j++) {
+        parameters[j] = tubeModel->current.parameters;
+        sampleRateInterpolation(tubeModel);
+    }
 }
 
 
 
 /******************************************************************************
 *
-*       function:       reflectionFilter
+*       function:       gainStage
 *
-*       purpose:        Is a variable, one-pole lowpass filter, whose cutoff
-*                       is determined by the mouth aperture coefficient.
+*       purpose:        Converts the pitch and volumes of each sample to a
+*                       frequency and linear amplitudes.
 *
-*       arguments:      input
+*       arguments:      numberSamples
 *
 *       internal
-*       functions:      none
+*       functions:      frequency, amplitude
 *
 *       library
 *       functions:      none
 *
 ******************************************************************************/
 
-double reflectionFilter(TRMTubeModel *tubeModel, double input)
+void gainStage(TRMTubeModel *tubeModel, struct _TRMInputParameters *inputParameters, int numberSamples)
 {
-    static double reflectionY = 0.0;
-
-    double output = (tubeModel->a10 * input) - (tubeModel->b11 * reflectionY);
-    reflectionY = output;
-    return output;
+    int j;
+    TRMPipeline *pipeline = &(tubeModel->fastTract->pipeline);
+    const TRMParameters *parameters = pipeline->parameters;
+
+    for (j = 0; j < numberSamples; j++) {
+        pipeline->f0[j] = frequency(parameters[j].glotPitch);
+        pipeline->glottalAmplitude[j] = amplitude(parameters[j].glotVol);
+        pipeline->aspirationAmplitude[j] = amplitude(parameters[j].aspVol);
+        pipeline->fricationAmplitude[j] = amplitude(parameters[j].fricVol);
+    }
 }
 
 
 
 /******************************************************************************
 *
-*       function:       radiationFilter
+*       function:       sourceStage
 *
-*       purpose:        Is a variable, one-zero, one-pole, highpass filter,
-*                       whose cutoff point is determined by the mouth aperture
-*                       coefficient.
+*       purpose:        Generates the glottal pulse (or sine tone), updating
+*                       the pulse shape for each sample's amplitude.
 *
-*       arguments:      input
+*       arguments:      numberSamples
 *
 *       internal
-*       functions:      none
+*       functions:      TRMWavetableOscillatorBlock
 *
 *       library
 *       functions:      none
 *
 ******************************************************************************/
 
-double radiationFilter(TRMTubeModel *tubeModel, double input)
+void sourceStage(TRMTubeModel *tubeModel, struct _TRMInputParameters *inputParameters, int numberSamples)
 {
-    static double radiationX = 0.0, radiationY = 0.0;
+    TRMPipeline *pipeline = &(tubeModel->fastTract->pipeline);
 
-    double output = (tubeModel->a20 * input) + (tubeModel->a21 * radiationX) - (tubeModel->b21 * radiationY);
-    radiationX = input;
-    radiationY = output;
-    return output;
+    TRMWavetableOscillatorBlock(tubeModel->wavetable, pipeline->f0,
+                                (inputParameters->waveform == PULSE) ? pipeline->glottalAmplitude : NULL,
+                                pipeline->glottalPulse, numberSamples);
 }
 
 
 
 /******************************************************************************
 *
-*       function:       initializeNasalFilterCoefficients
+*       function:       noiseStage
 *
-*       purpose:        Calculates the fixed coefficients for the nasal
-*                       reflection/radiation filter pair, according to the
-*                       nose aperture coefficient.
+*       purpose:        Generates low-pass filtered noise.
 *
-*       arguments:      coeff - nose aperture coefficient
+*       arguments:      numberSamples
 *
 *       internal
-*       functions:      none
+*       functions:      filteredNoise
 *
 *       library
-*       functions:      fabs
+*       functions:      none
 *
 ******************************************************************************/
 
-void initializeNasalFilterCoefficients(TRMTubeModel *tubeModel, double coeff)
+void noiseStage(TRMTubeModel *tubeModel, struct _TRMInputParameters *inputParameters, int numberSamples)
 {
-    tubeModel->nb11 = -coeff;
-    tubeModel->na10 = 1.0 - fabs(tubeModel->nb11);
-
-    tubeModel->na20 = coeff;
-    tubeModel->na21 = tubeModel->nb21 = -(tubeModel->na20);
+    filteredNoise(&tubeModel->noiseState, &tubeModel->noiseX, tubeModel->fastTract->pipeline.lowpassNoise, numberSamples);
 }
 
 
 
 /******************************************************************************
 *
-*       function:       nasalReflectionFilter
+*       function:       mixStage
 *
-*       purpose:        Is a one-pole lowpass filter, used for terminating
-*                       the end of the nasal cavity.
+*       purpose:        Mixes the glottal pulse, aspiration and noise into
+*                       the inputs of the tube, the frication filter and the
+*                       throat.  There is no state, and no branches.
 *
-*       arguments:      input
+*       arguments:      numberSamples
 *
 *       internal
 *       functions:      none
 *
 *       library
-*       functions:      none
+*       functions:      fmin
 *
 ******************************************************************************/
 
-double nasalReflectionFilter(TRMTubeModel *tubeModel, double input)
+void mixStage(TRMTubeModel *tubeModel, struct _TRMInputParameters *inputParameters, int numberSamples)
 {
-    static double nasalReflectionY = 0.0;
-
-    double output = (tubeModel->na10 * input) - (tubeModel->nb11 * nasalReflectionY);
-    nasalReflectionY = output;
-    return output;
+    int j;
+    double pulse, pulsed_noise, signal, crossmix;
+    TRMPipeline *pipeline = &(tubeModel->fastTract->pipeline);
+    const double breathiness = tubeModel->breathinessFactor;
+    const double crossmixFactor = tubeModel->crossmixFactor;
+    const double modulation = (inputParameters->modulation) ? 1.0 : 0.0;
+
+    for (j = 0; j < numberSamples; j++) {
+        const double ax = pipeline->glottalAmplitude[j];
+        const double lp_noise = pipeline->lowpassNoise[j];
+
+        pulse = pipeline->glottalPulse[j];
+        pulsed_noise = lp_noise * pulse;
+        pulse = ax * ((pulse * (1.0 - breathiness)) + (pulsed_noise * breathiness));
+
+        crossmix = fmin(ax * crossmixFactor, 1.0);
+        signal = (modulation * ((pulsed_noise * crossmix) + (lp_noise * (1.0 - crossmix)))) + ((1.0 - modulation) * lp_noise);
+
+        pipeline->tubeInput[j] = (pulse + (pipeline->aspirationAmplitude[j] * signal)) * VT_SCALE;
+        pipeline->fricationInput[j] = signal;
+        pipeline->throatInput[j] = pulse * VT_SCALE;
+    }
 }
 
 
 
 /******************************************************************************
 *
-*       function:       nasalRadiationFilter
+*       function:       tractStage
 *
-*       purpose:        Is a one-zero, one-pole highpass filter, used for the
-*                       radiation characteristic from the nasal cavity.
+*       purpose:        Runs the inputs through the vocal tract, frication
+*                       filter and throat, updating the tube coefficients
+*                       and frication taps for each sample's parameters.
 *
-*       arguments:      input
+*       arguments:      numberSamples
 *
 *       internal
-*       functions:      none
+*       functions:      calculateTubeCoefficientsFrom,
+*                       setFricationTapsFrom,
+*                       calculateBandpassCoefficientsFrom, vocalTractFast
 *
 *       library
 *       functions:      none
 *
 ******************************************************************************/
 
-double nasalRadiationFilter(TRMTubeModel *tubeModel, double input)
+void tractStage(TRMTubeModel *tubeModel, struct _TRMInputParameters *inputParameters, int numberSamples)
 {
-    static double nasalRadiationX = 0.0, nasalRadiationY = 0.0;
+    int j;
+    TRMFastTract *tract = tubeModel->fastTract;
+    TRMPipeline *pipeline = &(tract->pipeline);
+
+    for (j = 0; j < numberSamples; j++) {
+        const TRMParameters *parameters = &(pipeline->parameters[j]);
+
+        calculateTubeCoefficientsFrom(tubeModel, inputParameters, parameters);
+        setFricationTapsFrom(tubeModel, parameters->fricPos, pipeline->fricationAmplitude[j]);
+        if ((parameters->fricCF != tract->bandpassCF) | (parameters->fricBW != tract->bandpassBW)) {
+            calculateBandpassCoefficientsFrom(tubeModel, tubeModel->sampleRate, parameters->fricCF, parameters->fricBW);
+            tract->bandpassCF = parameters->fricCF;
+            tract->bandpassBW = parameters->fricBW;
+        }
 
-    double output = (tubeModel->na20 * input) + (tubeModel->na21 * nasalRadiationX) - (tubeModel->nb21 * nasalRadiationY);
-    nasalRadiationX = input;
-    nasalRadiationY = output;
-    return output;
+        pipeline->output[j] = vocalTractFast(tubeModel, tract, pipeline->tubeInput[j], pipeline->fricationInput[j],
+                                             pipeline->throatInput[j]);
+    }
 }
 
+
+
 /******************************************************************************
 *
-*       function:       synthesize
+*       function:       outputStage
 *
-*       purpose:        Performs the actual synthesis of sound samples.
+*       purpose:        Hands the block of output samples to the sample rate
+*                       converter, and the glottal source to the frame
+*                       statistics, if they are collected.
 *
-*       arguments:      none
+*       arguments:      numberSamples
 *
 *       internal
-*       functions:      setControlRateParameters, frequency, amplitude,
-*                       calculateTubeCoefficients, noise, noiseFilter,
-*                       updateWavetable, oscillator, vocalTract, throat,
-*                       dataFill, sampleRateInterpolation
+*       functions:      dataFillBlock, TRMStatisticsAddSource
 *
 *       library
 *       functions:      none
 *
 ******************************************************************************/
 
-void synthesize(TRMTubeModel *tubeModel, TRMData *data)
+void outputStage(TRMTubeModel *tubeModel, struct _TRMInputParameters *inputParameters, int numberSamples)
 {
-    int j;
-    double f0, ax, ah1, pulse, lp_noise, pulsed_noise, signal, crossmix;
-    INPUT *previousInput, *currentInput;
-
-    /*  CONTROL RATE LOOP  */
-
-    if (data->inputHead == NULL) {
-        // No data
-        return;
-    }
-
-    previousInput = data->inputHead;
-    currentInput = data->inputHead->next;
-
-    while (currentInput != NULL) {
-        /*  SET CONTROL RATE PARAMETERS FROM INPUT TABLES  */
-        setControlRateParameters(tubeModel, previousInput, currentInput);
-
-
-        /*  SAMPLE RATE LOOP  */
-        for (j = 0; j < tubeModel->controlPeriod; j++) {
-
-            /*  CONVERT PARAMETERS HERE  */
-            f0 = frequency(tubeModel->current.parameters.glotPitch);
-            ax = amplitude(tubeModel->current.parameters.glotVol);
-            ah1 = amplitude(tubeModel->current.parameters.aspVol);
-            calculateTubeCoefficients(tubeModel, &(data->inputParameters));
-            setFricationTaps(tubeModel);
-            calculateBandpassCoefficients(tubeModel, tubeModel->sampleRate);
-
-
-            /*  DO SYNTHESIS HERE  */
-            /*  CREATE LOW-PASS FILTERED NOISE  */
-            lp_noise = noiseFilter(noise());
-
-            /*  UPDATE THE SHAPE OF THE GLOTTAL PULSE, IF NECESSARY  */
-            if (data->inputParameters.waveform == PULSE)
-                TRMWavetableUpdate(tubeModel->wavetable, ax);
+    TRMPipeline *pipeline = &(tubeModel->fastTract->pipeline);
 
-            /*  CREATE GLOTTAL PULSE (OR SINE TONE)  */
-            pulse = TRMWavetableOscillator(tubeModel->wavetable, f0);
+    /*  THE THROAT INPUT IS THE GLOTTAL PULSE, SCALED FOR THE TUBE  */
+    if (tubeModel->sampleRateConverter.statistics != NULL)
+        TRMStatisticsAddSource(tubeModel->sampleRateConverter.statistics, pipeline->throatInput, 1.0 / VT_SCALE, numberSamples);
 
-            /*  CREATE PULSED NOISE  */
-            pulsed_noise = lp_noise * pulse;
-
-            /*  CREATE NOISY GLOTTAL PULSE  */
-            pulse = ax * ((pulse * (1.0 - tubeModel->breathinessFactor)) + (pulsed_noise * tubeModel->breathinessFactor));
-
-            /*  CROSS-MIX PURE NOISE WITH PULSED NOISE  */
-            if (data->inputParameters.modulation) {
-                crossmix = ax * tubeModel->crossmixFactor;
-                crossmix = (crossmix < 1.0) ? crossmix : 1.0;
-                signal = (pulsed_noise * crossmix) + (lp_noise * (1.0 - crossmix));
-                if (verbose) {
-                    printf("\nSignal = %e", signal);
-                    fflush(stdout);
-                }
-
-
-            } else
-                signal = lp_noise;
-
-            /*  PUT SIGNAL THROUGH VOCAL TRACT  */
-            signal = vocalTract(tubeModel, ((pulse + (ah1 * signal)) * VT_SCALE), bandpassFilter(tubeModel, signal));
-
-
-            /*  PUT PULSE THROUGH THROAT  */
-            signal += throat(tubeModel, pulse * VT_SCALE);
-            if (verbose)
-                printf("\nDone throat\n");
-
-            /*  OUTPUT SAMPLE HERE  */
-            dataFill(tubeModel->ringBuffer, signal);
-            if (verbose)
-                printf("\nDone datafil\n");
-
-            /*  DO SAMPLE RATE INTERPOLATION OF CONTROL PARAMETERS  */
-            sampleRateInterpolation(tubeModel);
-            if (verbose)
-                printf("\nDone sample rate interp\n");
-
-        }
+    dataFillBlock(tubeModel->ringBuffer, pipeline->output, numberSamples);
+}
 
-        previousInput = currentInput;
-        currentInput = currentInput->next;
-    }
+const TRMStageFunction defaultStages[TOTAL_STAGES] = {
+    parameterStage, gainStage, sourceStage, noiseStage, mixStage, tractStage, outputStage
+};
 
-    /*  BE SURE TO FLUSH SRC BUFFER  */
-    flushBuffer(tubeModel->ringBuffer);
-}
 
 
 /******************************************************************************
@@ -613,6 +1483,13 @@ void initializeThroat(TRMTubeModel *tubeModel, struct _TRMInputParameters *input
 ******************************************************************************/
 
 void calculateTubeCoefficients(TRMTubeModel *tubeModel, struct _TRMInputParameters *inputParameters)
+{
+    calculateTubeCoefficientsFrom(tubeModel, inputParameters, &(tubeModel->current.parameters));
+}
+
+// Same as calculateTubeCoefficients, for the radii and velum in parameters.
+
+void calculateTubeCoefficientsFrom(TRMTubeModel *tubeModel, struct _TRMInputParameters *inputParameters, const TRMParameters *parameters)
 {
     int i;
     double radA2, radB2, r0_2, r1_2, r2_2, sum;
@@ -620,27 +1497,27 @@ void calculateTubeCoefficients(TRMTubeModel *tubeModel, struct _TRMInputParamete
 
     /*  CALCULATE COEFFICIENTS FOR THE OROPHARYNX  */
     for (i = 0; i < (TOTAL_REGIONS-1); i++) {
-        radA2 = tubeModel->current.parameters.radius[i] * tubeModel->current.parameters.radius[i];
-        radB2 = tubeModel->current.parameters.radius[i+1] * tubeModel->current.parameters.radius[i+1];
+        radA2 = parameters->radius[i] * parameters->radius[i];
+        radB2 = parameters->radius[i+1] * parameters->radius[i+1];
         tubeModel->oropharynx_coeff[i] = (radA2 - radB2) / (radA2 + radB2);
     }
 
     /*  CALCULATE THE COEFFICIENT FOR THE MOUTH APERTURE  */
-    radA2 = tubeModel->current.parameters.radius[TRM_R8] * tubeModel->current.parameters.radius[TRM_R8];
+    radA2 = parameters->radius[TRM_R8] * parameters->radius[TRM_R8];
     radB2 = inputParameters->apScale * inputParameters->apScale;
     tubeModel->oropharynx_coeff[C8] = (radA2 - radB2) / (radA2 + radB2);
 
     /*  CALCULATE ALPHA COEFFICIENTS FOR 3-WAY JUNCTION  */
     /*  NOTE:  SINCE JUNCTION IS IN MIDDLE OF REGION 4, r0_2 = r1_2  */
-    r0_2 = r1_2 = tubeModel->current.parameters.radius[TRM_R4] * tubeModel->current.parameters.radius[TRM_R4];
-    r2_2 = tubeModel->current.parameters.velum * tubeModel->current.parameters.velum;
+    r0_2 = r1_2 = parameters->radius[TRM_R4] * parameters->radius[TRM_R4];
+    r2_2 = parameters->velum * parameters->velum;
     sum = 2.0 / (r0_2 + r1_2 + r2_2);
     tubeModel->alpha[LEFT] = sum * r0_2;
     tubeModel->alpha[RIGHT] = sum * r1_2;
     tubeModel->alpha[UPPER] = sum * r2_2;
 
     /*  AND 1ST NASAL PASSAGE COEFFICIENT  */
-    radA2 = tubeModel->current.parameters.velum * tubeModel->current.parameters.velum;
+    radA2 = parameters->velum * parameters->velum;
     radB2 = inputParameters->noseRadius[TRM_N2] * inputParameters->noseRadius[TRM_N2];
     tubeModel->nasal_coeff[NC1] = (radA2 - radB2) / (radA2 + radB2);
 }
@@ -665,15 +1542,21 @@ void calculateTubeCoefficients(TRMTubeModel *tubeModel, struct _TRMInputParamete
 ******************************************************************************/
 
 void setFricationTaps(TRMTubeModel *tubeModel)
+{
+    setFricationTapsFrom(tubeModel, tubeModel->current.parameters.fricPos, amplitude(tubeModel->current.parameters.fricVol));
+}
+
+// Same as setFricationTaps, for the given position and (linear) amplitude.
+
+void setFricationTapsFrom(TRMTubeModel *tubeModel, double fricPos, double fricationAmplitude)
 {
     int i, integerPart;
     double complement, remainder;
-    double fricationAmplitude = amplitude(tubeModel->current.parameters.fricVol);
 
 
     /*  CALCULATE POSITION REMAINDER AND COMPLEMENT  */
-    integerPart = (int)tubeModel->current.parameters.fricPos;
-    complement = tubeModel->current.parameters.fricPos - (double)integerPart;
+    integerPart = (int)fricPos;
+    complement = fricPos - (double)integerPart;
     remainder = 1.0 - complement;
 
     /*  SET THE FRICATION TAPS  */
@@ -717,12 +1600,20 @@ void setFricationTaps(TRMTubeModel *tubeModel)
 
 // TODO (2004-05-13): I imagine passing this a bandpass filter object (which won't have the sample rate) and the sample rate in the future.
 void calculateBandpassCoefficients(TRMTubeModel *tubeModel, int sampleRate)
+{
+    calculateBandpassCoefficientsFrom(tubeModel, sampleRate, tubeModel->current.parameters.fricCF, tubeModel->current.parameters.fricBW);
+}
+
+// Same as calculateBandpassCoefficients, for the given center frequency and
+// bandwidth.
+
+void calculateBandpassCoefficientsFrom(TRMTubeModel *tubeModel, int sampleRate, double fricCF, double fricBW)
 {
     double tanValue, cosValue;
 
 
-    tanValue = tan((PI * tubeModel->current.parameters.fricBW) / sampleRate);
-    cosValue = cos((2.0 * PI * tubeModel->current.parameters.fricCF) / sampleRate);
+    tanValue = tan((PI * fricBW) / sampleRate);
+    cosValue = cos((2.0 * PI * fricCF) / sampleRate);
 
     tubeModel->bpBeta = (1.0 - tanValue) / (2.0 * (1.0 + tanValue));
     tubeModel->bpGamma = (0.5 + tubeModel->bpBeta) * cosValue;
@@ -940,7 +1831,8 @@ void initializeConversion(TRMTubeModel *tubeModel, struct _TRMInputParameters *i
     tubeModel->sampleRateConverter.timeRegister = 0;
     tubeModel->sampleRateConverter.maximumSampleValue = 0.0;
     tubeModel->sampleRateConverter.numberSamples = 0;
-    printf("initializeConversion(), sampleRateConverter.maximumSampleValue: %g\n", tubeModel->sampleRateConverter.maximumSampleValue);
+    if (verbose)
+        printf("initializeConversion(), sampleRateConverter.maximumSampleValue: %g\n", tubeModel->sampleRateConverter.maximumSampleValue);
 
     /*  INITIALIZE FILTER IMPULSE RESPONSE  */
     initializeFilter(&(tubeModel->sampleRateConverter));
@@ -1048,6 +1940,10 @@ void resampleBuffer(struct _TRMRingBuffer *aRingBuffer, void *context)
             unsigned int filterIndex;
             double output, interpolation, absoluteSampleValue;
 
+            /*  THE REST IS SILENCE IF THE FILTER ONLY SEES ZEROS  */
+            if (resampleZeros(aRingBuffer, aConverter, endPtr))
+                break;
+
             /*  RESET ACCUMULATOR TO ZERO  */
             output = 0.0;
 
@@ -1083,8 +1979,8 @@ void resampleBuffer(struct _TRMRingBuffer *aRingBuffer, void *context)
             /*  INCREMENT SAMPLE NUMBER  */
             aConverter->numberSamples++;
 
-            /*  OUTPUT THE SAMPLE TO THE TEMPORARY FILE  */
-            fwrite((char *)&output, sizeof(output), 1, aConverter->tempFilePtr);
+            /*  OUTPUT THE SAMPLE  */
+            storeSample(aConverter, output);
 
             /*  CHANGE TIME REGISTER BACK TO ORIGINAL FORM  */
             aConverter->timeRegister = ~aConverter->timeRegister;
@@ -1111,6 +2007,10 @@ void resampleBuffer(struct _TRMRingBuffer *aRingBuffer, void *context)
             unsigned int phaseIndex, impulseIndex;
             double absoluteSampleValue, output, impulse;
 
+            /*  THE REST IS SILENCE IF THE FILTER ONLY SEES ZEROS  */
+            if (resampleZeros(aRingBuffer, aConverter, endPtr))
+                break;
+
             /*  RESET ACCUMULATOR TO ZERO  */
             output = 0.0;
 
@@ -1141,6 +2041,10 @@ void resampleBuffer(struct _TRMRingBuffer *aRingBuffer, void *context)
                 phaseIndex += aConverter->phaseIncrement;
             }
 
+            /*  THE FILTER IS STRETCHED OVER 1 / RATIO AS MANY INPUT SAMPLES
+                AS WHEN UPSAMPLING, WHICH MULTIPLIES ITS GAIN BY AS MUCH  */
+            output *= (double)aConverter->phaseIncrement / (double)FRACTION_RANGE;
+
             /*  RECORD MAXIMUM SAMPLE VALUE  */
             absoluteSampleValue = fabs(output);
             if (absoluteSampleValue > aConverter->maximumSampleValue)
@@ -1149,8 +2053,8 @@ void resampleBuffer(struct _TRMRingBuffer *aRingBuffer, void *context)
             /*  INCREMENT SAMPLE NUMBER  */
             aConverter->numberSamples++;
 
-            /*  OUTPUT THE SAMPLE TO THE TEMPORARY FILE  */
-            fwrite((char *)&output, sizeof(output), 1, aConverter->tempFilePtr);
+            /*  OUTPUT THE SAMPLE  */
+            storeSample(aConverter, output);
 
             /*  INCREMENT THE TIME REGISTER  */
             aConverter->timeRegister += aConverter->timeRegisterIncrement;
@@ -1168,10 +2072,114 @@ void resampleBuffer(struct _TRMRingBuffer *aRingBuffer, void *context)
     }
 }
 
+/******************************************************************************
+*
+*       function:       resampleZeros
+*
+*       purpose:        If every input sample that the filter can reach, from
+*                       the empty pointer up to the fill pointer, is zero,
+*                       outputs zeros up to the end pointer without doing
+*                       the convolution, and returns 1.  Otherwise does
+*                       nothing and returns 0.  The output is exactly the
+*                       same as the convolution would produce.
+*
+*       arguments:      aRingBuffer, aConverter, endPtr
+*
+*       internal
+*       functions:      storeSample
+*
+*       library
+*       functions:      none
+*
+******************************************************************************/
+
+int resampleZeros(struct _TRMRingBuffer *aRingBuffer, TRMSampleRateConverter *aConverter, int endPtr)
+{
+    int distance = aRingBuffer->fillPtr - aRingBuffer->emptyPtr;
+
+    if (distance < 0)
+        distance += BUFFER_SIZE;
+
+    if (aRingBuffer->zeroRun <= distance + aRingBuffer->padSize)
+        return 0;
+
+    while (aRingBuffer->emptyPtr < endPtr) {
+        aConverter->numberSamples++;
+        storeSample(aConverter, 0.0);
+
+        /*  INCREMENT THE TIME REGISTER AND THE EMPTY POINTER  */
+        aConverter->timeRegister += aConverter->timeRegisterIncrement;
+        aRingBuffer->emptyPtr += nValue(aConverter->timeRegister);
+        if (aRingBuffer->emptyPtr >= BUFFER_SIZE) {
+            aRingBuffer->emptyPtr -= BUFFER_SIZE;
+            endPtr -= BUFFER_SIZE;
+        }
+
+        /*  CLEAR N PART OF TIME REGISTER  */
+        aConverter->timeRegister &= (~N_MASK);
+    }
+
+    return 1;
+}
+
+
+
+// Passes a converted sample through the limiter, if one is set, and outputs
+// it.  The limiter delays its output by its lookahead, so the first few
+// samples out of it (from before the start) are dropped, and flushLimiter()
+// outputs the last few at the end.
+
+void storeSample(TRMSampleRateConverter *aConverter, double output)
+{
+    if (aConverter->limiter != NULL) {
+        output = TRMLimiterProcess(aConverter->limiter, output);
+        if (aConverter->limiter->count <= aConverter->limiter->lookahead)
+            return;
+    }
+
+    writeSample(aConverter, output);
+}
+
+// Outputs the samples still held back by the limiter, if one is set.
+
+void flushLimiter(TRMSampleRateConverter *aConverter)
+{
+    int i, count;
+
+    if (aConverter->limiter == NULL)
+        return;
+
+    count = (aConverter->limiter->count < aConverter->limiter->lookahead) ?
+        (int)aConverter->limiter->count : aConverter->limiter->lookahead;
+    for (i = 0; i < count; i++)
+        writeSample(aConverter, TRMLimiterProcess(aConverter->limiter, 0.0));
+}
+
+// Outputs a converted sample to the in-memory buffer (or mixes it into the
+// buffer, with outputAccumulate), if one is set, or else to the temporary file,
+// and adds it to the frame statistics if they are collected.
+
+void writeSample(TRMSampleRateConverter *aConverter, double output)
+{
+    if (aConverter->statistics != NULL)
+        TRMStatisticsAddOutput(aConverter->statistics, output);
+
+    if (aConverter->outputBuffer != NULL) {
+        if (aConverter->outputBufferCount < aConverter->outputBufferSize) {
+            if (aConverter->outputAccumulate)
+                aConverter->outputBuffer[aConverter->outputBufferCount++] += aConverter->outputGain * output;
+            else
+                aConverter->outputBuffer[aConverter->outputBufferCount++] = output;
+        }
+    } else {
+        fwrite((char *)&output, sizeof(output), 1, aConverter->tempFilePtr);
+    }
+}
+
 TRMTubeModel *TRMTubeModelCreate(TRMInputParameters *inputParameters)
 {
     TRMTubeModel *newTubeModel;
-    double nyquist;
+    double nyquist, ratio;
 
     newTubeModel = (TRMTubeModel *)malloc(sizeof(TRMTubeModel));
     if (newTubeModel == NULL) {
@@ -1181,6 +2189,16 @@ TRMTubeModel *TRMTubeModelCreate(TRMInputParameters *inputParameters)
 
     memset(newTubeModel, 0, sizeof(TRMTubeModel));
 
+    newTubeModel->engine = REFERENCE_ENGINE;
+    newTubeModel->silenceThreshold = SILENCE_THRESHOLD;
+    newTubeModel->fastTract = (TRMFastTract *)calloc(1, sizeof(TRMFastTract));
+    if (newTubeModel->fastTract == NULL) {
+        fprintf(stderr, "Failed to malloc() space for fast tract.\n");
+        free(newTubeModel);
+        return NULL;
+    }
+    memcpy(newTubeModel->fastTract->pipeline.stage, defaultStages, sizeof(defaultStages));
+
     /*  CALCULATE THE SAMPLE RATE, BASED ON NOMINAL TUBE LENGTH AND SPEED OF SOUND  */
     if (inputParameters->length > 0.0) {
         double c = speedOfSound(inputParameters->temperature);
@@ -1191,6 +2209,19 @@ TRMTubeModel *TRMTubeModelCreate(TRMInputParameters *inputParameters)
         nyquist = (double)newTubeModel->sampleRate / 2.0;
     } else {
         fprintf(stderr, "Illegal tube length: %g\n", inputParameters->length);
+        free(newTubeModel->fastTract);
+        free(newTubeModel);
+        return NULL;
+    }
+
+    /*  CHECK THAT THE SAMPLE RATE CONVERTER CAN PRODUCE THE OUTPUT RATE: IT
+        NEEDS AT LEAST ONE STEP OF THE TIME REGISTER PER OUTPUT SAMPLE, AND
+        ROOM IN THE RING BUFFER FOR THE FILTER WHEN DOWNSAMPLING  */
+    ratio = (double)inputParameters->outputRate / (double)newTubeModel->sampleRate;
+    if ((ratio <= 0.0) || (ratio > (double)FRACTION_RANGE) ||
+        ((ratio < 1.0) && (4 * ((int)(ZERO_CROSSINGS / ratio) + 1) > BUFFER_SIZE))) {
+        fprintf(stderr, "Illegal output sample rate: %g\n", inputParameters->outputRate);
+        free(newTubeModel->fastTract);
         free(newTubeModel);
         return NULL;
     }
@@ -1204,6 +2235,9 @@ TRMTubeModel *TRMTubeModelCreate(TRMInputParameters *inputParameters)
     /*  CALCULATE THE DAMPING FACTOR  */
     newTubeModel->dampingFactor = (1.0 - (inputParameters->lossFactor / 100.0));
 
+    /*  START THE NOISE GENERATOR  */
+    TRMTubeModelSeed(newTubeModel, inputParameters->noiseSeed);
+
     /*  INITIALIZE THE WAVE TABLE  */
     newTubeModel->wavetable = TRMWavetableCreate(inputParameters->waveform, inputParameters->tp, inputParameters->tnMin, inputParameters->tnMax, newTubeModel->sampleRate);
 
@@ -1240,6 +2274,174 @@ TRMTubeModel *TRMTubeModelCreate(TRMInputParameters *inputParameters)
     return newTubeModel;
 }
 
+// Restarts the noise generator of the tube model from the given seed.
+
+void TRMTubeModelSeed(TRMTubeModel *tubeModel, int seed)
+{
+    tubeModel->noiseState = noiseSeed(seed);
+    tubeModel->noiseX = 0.0;
+}
+
+// Copies the synthesis state of one tube model into another, which must have
+// been created with the same input parameters, so that both carry on from the
+// same point and produce the same samples from the same controls.  The
+// destination keeps its own output settings (temporary file or buffer, and
+// statistics).  The reference engine keeps some filter memory in static
+// variables, which are not copied, so only the fast engine continues exactly.
+// Returns ERROR if the models do not match, or if either has a limiter.
+
+int TRMTubeModelCopy(TRMTubeModel *destination, TRMTubeModel *source)
+{
+    TRMTubeModel saved;
+    TRMSampleRateConverter *aConverter = &(destination->sampleRateConverter);
+
+    if ((destination->controlPeriod != source->controlPeriod) ||
+        (destination->sampleRate != source->sampleRate) ||
+        (aConverter->sampleRateRatio != source->sampleRateConverter.sampleRateRatio) ||
+        (aConverter->limiter != NULL) || (source->sampleRateConverter.limiter != NULL))
+        return ERROR;
+
+    if (TRMWavetableCopy(destination->wavetable, source->wavetable) != SUCCESS)
+        return ERROR;
+    TRMRingBufferCopy(destination->ringBuffer, source->ringBuffer);
+
+    /*  THE PIPELINE BUFFERS ONLY HOLD SAMPLES WITHIN A BLOCK  */
+    memcpy(destination->fastTract, source->fastTract, offsetof(TRMFastTract, pipeline));
+
+    /*  COPY EVERYTHING ELSE, THEN PUT BACK THE DESTINATION'S OWN MEMORY AND
+        OUTPUT  */
+    saved = *destination;
+    *destination = *source;
+    destination->ringBuffer = saved.ringBuffer;
+    destination->wavetable = saved.wavetable;
+    destination->fastTract = saved.fastTract;
+    aConverter->tempFilePtr = saved.sampleRateConverter.tempFilePtr;
+    aConverter->outputBuffer = saved.sampleRateConverter.outputBuffer;
+    aConverter->outputBufferSize = saved.sampleRateConverter.outputBufferSize;
+    aConverter->outputBufferCount = saved.sampleRateConverter.outputBufferCount;
+    aConverter->outputAccumulate = saved.sampleRateConverter.outputAccumulate;
+    aConverter->outputGain = saved.sampleRateConverter.outputGain;
+    aConverter->statistics = saved.sampleRateConverter.statistics;
+
+    return SUCCESS;
+}
+
+// Streams the output of the tube model through a new loudness normalizer and
+// limiter (see TRMLimiterCreate, the times are in seconds), replacing any
+// previous one.  Returns ERROR if the settings are not valid.
+
+int TRMTubeModelSetLimiter(TRMTubeModel *tubeModel, double lookahead, double release, double window,
+                           double target, double ceiling, double maximumGain)
+{
+    TRMSampleRateConverter *aConverter = &(tubeModel->sampleRateConverter);
+    TRMLimiter *limiter;
+
+    limiter = TRMLimiterCreate(tubeModel->sampleRate * aConverter->sampleRateRatio,
+                               lookahead, release, window, target, ceiling, maximumGain);
+    if (limiter == NULL)
+        return ERROR;
+
+    TRMTubeModelClearLimiter(tubeModel);
+    aConverter->limiter = limiter;
+    return SUCCESS;
+}
+
+// Removes the limiter from the tube model, if it has one.
+
+void TRMTubeModelClearLimiter(TRMTubeModel *tubeModel)
+{
+    if (tubeModel->sampleRateConverter.limiter != NULL) {
+        TRMLimiterFree(tubeModel->sampleRateConverter.limiter);
+        tubeModel->sampleRateConverter.limiter = NULL;
+    }
+}
+
+// Starts collecting statistics of each control frame (see statistics.h) from
+// the next sample on, discarding any collected so far.  Returns ERROR if the
+// rates in the input parameters are not valid.
+
+int TRMTubeModelCollectStatistics(TRMTubeModel *tubeModel, TRMInputParameters *inputParameters)
+{
+    TRMStatistics *statistics;
+
+    statistics = TRMStatisticsCreate(inputParameters->controlRate, inputParameters->outputRate, tubeModel->controlPeriod);
+    if (statistics == NULL)
+        return ERROR;
+
+    TRMTubeModelClearStatistics(tubeModel);
+    tubeModel->sampleRateConverter.statistics = statistics;
+    return SUCCESS;
+}
+
+// Stops collecting frame statistics, and frees the ones collected.
+
+void TRMTubeModelClearStatistics(TRMTubeModel *tubeModel)
+{
+    if (tubeModel->sampleRateConverter.statistics != NULL) {
+        TRMStatisticsFree(tubeModel->sampleRateConverter.statistics);
+        tubeModel->sampleRateConverter.statistics = NULL;
+    }
+}
+
+// Copies up to numberFrames frames of statistics into buffer, as
+// STATISTICS_FIELDS doubles per frame in the order of TRMFrameStatistics.
+// Returns the number of frames collected so far, so a NULL buffer can be
+// passed first to find the size.
+
+long int TRMTubeModelReadStatistics(TRMTubeModel *tubeModel, double *buffer, long int numberFrames)
+{
+    TRMStatistics *statistics = tubeModel->sampleRateConverter.statistics;
+
+    if (statistics == NULL)
+        return 0;
+
+    if (numberFrames > statistics->numberFrames)
+        numberFrames = statistics->numberFrames;
+    if ((buffer != NULL) && (numberFrames > 0))
+        memcpy(buffer, statistics->frames, numberFrames * sizeof(TRMFrameStatistics));
+
+    return statistics->numberFrames;
+}
+
+// Replaces a stage of the fast engine with another function, which takes its
+// inputs from and leaves its results in the pipeline's buffers (see
+// pipeline.h).  Passing NULL restores the default stage.  Returns the stage
+// function that was replaced, or NULL if there is no such stage.
+
+TRMStageFunction TRMTubeModelSetStage(TRMTubeModel *tubeModel, int stage, TRMStageFunction function)
+{
+    TRMStageFunction previous;
+
+    if ((stage < 0) || (stage >= TOTAL_STAGES))
+        return NULL;
+
+    previous = tubeModel->fastTract->pipeline.stage[stage];
+    tubeModel->fastTract->pipeline.stage[stage] = (function != NULL) ? function : defaultStages[stage];
+    return previous;
+}
+
+// Starts (or stops) timing each stage of the fast engine.  Starting resets
+// the times.
+
+void TRMTubeModelProfileStages(TRMTubeModel *tubeModel, int profile)
+{
+    TRMPipeline *pipeline = &(tubeModel->fastTract->pipeline);
+
+    if (profile && !pipeline->profile)
+        memset(pipeline->seconds, 0, sizeof(pipeline->seconds));
+    pipeline->profile = profile;
+}
+
+// Returns the number of seconds spent in a stage of the fast engine since
+// profiling started.
+
+double TRMTubeModelStageSeconds(TRMTubeModel *tubeModel, int stage)
+{
+    if ((stage < 0) || (stage >= TOTAL_STAGES))
+        return 0.0;
+    return tubeModel->fastTract->pipeline.seconds[stage];
+}
+
 void TRMTubeModelFree(TRMTubeModel *tubeModel)
 {
     if (tubeModel == NULL)
@@ -1255,5 +2457,13 @@ void TRMTubeModelFree(TRMTubeModel *tubeModel)
         tubeModel->wavetable = NULL;
     }
 
+    if (tubeModel->fastTract != NULL) {
+        free(tubeModel->fastTract);
+        tubeModel->fastTract = NULL;
+    }
+
+    TRMTubeModelClearLimiter(tubeModel);
+    TRMTubeModelClearStatistics(tubeModel);
+
     free(tubeModel);
 }
@@ -41,6 +41,23 @@
 #define PULSE                     0
 #define SINE                      1
 
+/*  SYNTHESIS ENGINES  */
+#define REFERENCE_ENGINE          0
+#define FAST_ENGINE               1
+
+/*  STAGES OF THE FAST ENGINE, IN THE ORDER THAT THEY RUN  */
+#define PARAMETER_STAGE           0
+#define GAIN_STAGE                1
+#define SOURCE_STAGE              2
+#define NOISE_STAGE               3
+#define MIX_STAGE                 4
+#define TRACT_STAGE               5
+#define OUTPUT_STAGE              6
+#define TOTAL_STAGES              7
+
+/*  DEFAULT TUBE LEVEL BELOW WHICH SILENCE IS SKIPPED  */
+#define SILENCE_THRESHOLD         1.0e-6
+
 /*  MATH CONSTANTS  */
 #define PI                        3.14159265358979
 #define TWO_PI                    (2.0 * PI)
@@ -52,7 +69,21 @@ extern int verbose;
 
 TRMTubeModel *TRMTubeModelCreate(TRMInputParameters *inputParameters);
 void TRMTubeModelFree(TRMTubeModel *model);
+void TRMTubeModelSeed(TRMTubeModel *tubeModel, int seed);
+int TRMTubeModelCopy(TRMTubeModel *destination, TRMTubeModel *source);
+int TRMTubeModelSetLimiter(TRMTubeModel *tubeModel, double lookahead, double release, double window,
+                           double target, double ceiling, double maximumGain);
+void TRMTubeModelClearLimiter(TRMTubeModel *tubeModel);
+int TRMTubeModelCollectStatistics(TRMTubeModel *tubeModel, TRMInputParameters *inputParameters);
+void TRMTubeModelClearStatistics(TRMTubeModel *tubeModel);
+long int TRMTubeModelReadStatistics(TRMTubeModel *tubeModel, double *buffer, long int numberFrames);
+void TRMTubeModelProfileStages(TRMTubeModel *tubeModel, int profile);
+double TRMTubeModelStageSeconds(TRMTubeModel *tubeModel, int stage);
 
 void synthesize(TRMTubeModel *tubeModel, TRMData *data);
+void synthesizeBlock(TRMTubeModel *tubeModel, TRMInputParameters *inputParameters, double *target, int numberSamples);
+void finishSynthesis(TRMTubeModel *tubeModel);
+void synthesizeKeyframes(TRMTubeModel *tubeModel, TRMInputParameters *inputParameters, double *keyframes, double *times, int numberKeyframes);
+long int seekSynthesis(TRMTubeModel *tubeModel, double *glotPitch, int numberTables);
 
 #endif
@@ -35,6 +35,7 @@
 /*  CONSTANTS FOR NOISE GENERATOR  */
 #define FACTOR                    377.0
 #define INITIAL_SEED              0.7892347
+#define SEED_SPACING              0.6180339887498949  /*  golden ratio - 1  */
 
 /*  PITCH VARIABLES  */
 #define PITCH_BASE                220.0
@@ -158,13 +159,44 @@ double Izero(double x)
 
 
 
+/******************************************************************************
+*
+*	function:	noiseSeed
+*
+*	purpose:	Returns the initial state of the noise generator for
+*                       the given seed.  Seed 0 gives the original gnuspeech
+*                       sequence, other seeds start at different points.
+*
+*       arguments:      seed
+*
+*	internal
+*	functions:	none
+*
+*	library
+*	functions:	floor
+*
+******************************************************************************/
+
+double noiseSeed(int seed)
+{
+    double state = INITIAL_SEED + (seed * SEED_SPACING);
+
+    state -= floor(state);
+    if (state == 0.0)
+        state = INITIAL_SEED;
+    return state;
+}
+
+
+
 /******************************************************************************
 *
 *	function:	noise
 *
-*	purpose:	Returns one value of a random sequence.
+*	purpose:	Returns one value of a random sequence, advancing the
+*                       generator state.
 *
-*       arguments:      none
+*       arguments:      state
 *
 *	internal
 *	functions:	none
@@ -174,13 +206,11 @@ double Izero(double x)
 *
 ******************************************************************************/
 
-double noise(void)
+double noise(double *state)
 {
-    static double seed = INITIAL_SEED;
-
-    double product = seed * FACTOR;
-    seed = product - (int)product;
-    return (seed - 0.5);
+    double product = (*state) * FACTOR;
+    (*state) = product - (int)product;
+    return ((*state) - 0.5);
 }
 
 
@@ -191,7 +221,7 @@ double noise(void)
 *
 *	purpose:	One-zero lowpass filter.
 *
-*       arguments:      input
+*       arguments:      input, noiseX (filter memory)
 *
 *	internal
 *	functions:	none
@@ -201,11 +231,45 @@ double noise(void)
 *
 ******************************************************************************/
 
-double noiseFilter(double input)
+double noiseFilter(double input, double *noiseX)
 {
-    static double noiseX = 0.0;
-
-    double output = input + noiseX;
-    noiseX = input;
+    double output = input + (*noiseX);
+    (*noiseX) = input;
     return output;
 }
+
+
+
+/******************************************************************************
+*
+*	function:	filteredNoise
+*
+*	purpose:	Generates a block of lowpass filtered noise, the same as
+*                       calling noiseFilter(noise()) for each sample.
+*
+*       arguments:      state, noiseX, output, numberSamples
+*
+*	internal
+*	functions:	none
+*
+*	library
+*	functions:	none
+*
+******************************************************************************/
+
+void filteredNoise(double *state, double *noiseX, double *output, int numberSamples)
+{
+    int i;
+    double seed = (*state), x = (*noiseX), product, input;
+
+    for (i = 0; i < numberSamples; i++) {
+        product = seed * FACTOR;
+        seed = product - (int)product;
+        input = seed - 0.5;
+        output[i] = input + x;
+        x = input;
+    }
+
+    (*state) = seed;
+    (*noiseX) = x;
+}
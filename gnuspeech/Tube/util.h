@@ -36,7 +36,9 @@ double speedOfSound(double temperature);
 double amplitude(double decibelLevel);
 double frequency(double pitch);
 double Izero(double x);
-double noise(void);
-double noiseFilter(double input);
+double noiseSeed(int seed);
+double noise(double *state);
+double noiseFilter(double input, double *noiseX);
+void filteredNoise(double *state, double *noiseX, double *output, int numberSamples);
 
 #endif
@@ -27,6 +27,7 @@
  ******************************************************************************/
 
 #include <stdlib.h>
+#include <string.h>
 #include <math.h>
 #include "fir.h"
 #include "tube.h"
@@ -43,7 +44,18 @@
 #define TABLE_LENGTH              512
 #define TABLE_MODULUS             (TABLE_LENGTH-1)
 
+//  Number of unused pulse banks kept around for later models
+#define PULSE_BANK_LIMIT          8
+
+//  Number of samples the block oscillator processes at a time
+#define OSCILLATOR_BLOCK          256
+
+static TRMPulseBank *pulseBanks = NULL;
+
 static double mod0(double value);
+static void calculatePulse(double *table, int tableDiv1, double newDiv2);
+static TRMPulseBank *TRMPulseBankAcquire(double tp, double tnMin, double tnMax, int tableDiv1, int tableDiv2, int tnDelta);
+static void TRMPulseBankRelease(TRMPulseBank *pulseBank);
 static void TRMWavetableIncrementPosition(TRMWavetable *wavetable, double frequency);
 
 // Returns the modulus of 'value', keeping it in the range 0 -> TABLE_MODULUS.
@@ -54,11 +66,109 @@ static double mod0(double value)
     return value;
 }
 
+// Writes a glottal pulse that closes at 'newDiv2' into 'table'.
+static void calculatePulse(double *table, int tableDiv1, double newDiv2)
+{
+    int i;
+    double j, tnLength = newDiv2 - tableDiv1;
+
+    //  Calculate rise portion of wave table
+    for (i = 0; i < tableDiv1; i++) {
+        double x = (double)i / (double)tableDiv1;
+        double x2 = x * x;
+        double x3 = x2 * x;
+        table[i] = (3.0 * x2) - (2.0 * x3);
+    }
+
+    //  Calculate fall portion of wave table
+    for (i = tableDiv1, j = 0.0; i < newDiv2; i++, j++) {
+        double x = j / tnLength;
+        table[i] = 1.0 - (x * x);
+    }
+
+    //  Set closed portion of wave table
+    for (i = newDiv2; i < TABLE_LENGTH; i++)
+        table[i] = 0.0;
+}
+
+// Returns the pulse bank for (tp, tnMin, tnMax), building it if no other wavetable has yet.
+// Table k of the bank holds the pulse that closes at tableDiv2 - k.
+static TRMPulseBank *TRMPulseBankAcquire(double tp, double tnMin, double tnMax, int tableDiv1, int tableDiv2, int tnDelta)
+{
+    TRMPulseBank *pulseBank;
+    int k;
+
+    for (pulseBank = pulseBanks; pulseBank != NULL; pulseBank = pulseBank->next) {
+        if (pulseBank->tp == tp && pulseBank->tnMin == tnMin && pulseBank->tnMax == tnMax) {
+            pulseBank->references++;
+            return pulseBank;
+        }
+    }
+
+    pulseBank = (TRMPulseBank *)malloc(sizeof(TRMPulseBank));
+    if (pulseBank == NULL) {
+        fprintf(stderr, "Failed to allocate space for new TRMPulseBank in TRMPulseBankAcquire.\n");
+        return NULL;
+    }
+
+    if (tnDelta < 0)
+        tnDelta = 0;
+    pulseBank->tables = (double *)malloc((tnDelta + 1) * TABLE_LENGTH * sizeof(double));
+    if (pulseBank->tables == NULL) {
+        fprintf(stderr, "Failed to allocate space for pulse tables in TRMPulseBankAcquire.\n");
+        free(pulseBank);
+        return NULL;
+    }
+
+    for (k = 0; k <= tnDelta; k++)
+        calculatePulse(&(pulseBank->tables[k * TABLE_LENGTH]), tableDiv1, (double)(tableDiv2 - k));
+
+    pulseBank->tp = tp;
+    pulseBank->tnMin = tnMin;
+    pulseBank->tnMax = tnMax;
+    pulseBank->tnDelta = tnDelta;
+    pulseBank->references = 1;
+    pulseBank->next = pulseBanks;
+    pulseBanks = pulseBank;
+
+    return pulseBank;
+}
+
+// Drops a reference to a pulse bank, freeing the oldest unused banks once there are too many.
+static void TRMPulseBankRelease(TRMPulseBank *pulseBank)
+{
+    TRMPulseBank **link, **oldest;
+    int unused;
+
+    if (pulseBank == NULL)
+        return;
+
+    pulseBank->references--;
+
+    do {
+        unused = 0;
+        oldest = NULL;
+        for (link = &pulseBanks; *link != NULL; link = &((*link)->next)) {
+            if ((*link)->references == 0) {
+                unused++;
+                oldest = link;
+            }
+        }
+
+        if (unused > PULSE_BANK_LIMIT) {
+            pulseBank = *oldest;
+            *oldest = pulseBank->next;
+            free(pulseBank->tables);
+            free(pulseBank);
+        }
+    } while (unused > PULSE_BANK_LIMIT);
+}
+
 // Calculates the initial glottal pulse and stores it in the wavetable, for use in the oscillator.
 TRMWavetable *TRMWavetableCreate(int waveform, double tp, double tnMin, double tnMax, double sampleRate)
 {
     TRMWavetable *newWavetable;
-    int i, j;
+    int i;
 
     newWavetable = (TRMWavetable *)malloc(sizeof(TRMWavetable));
     if (newWavetable == NULL) {
@@ -68,14 +178,6 @@ TRMWavetable *TRMWavetableCreate(int waveform, double tp, double tnMin, double t
 
     newWavetable->FIRFilter = TRMFIRFilterCreate(FIR_BETA, FIR_GAMMA, FIR_CUTOFF);
 
-    //  Allocate memory for wavetable
-    newWavetable->wavetable = (double *)calloc(TABLE_LENGTH, sizeof(double));
-    if (newWavetable->wavetable == NULL) {
-        fprintf(stderr, "Failed to allocate space for wavetable in TRMWavetableCreate.\n");
-        free(newWavetable);
-        return NULL;
-    }
-
     //  Calculate wave table parameters
     newWavetable->tableDiv1 = rint(TABLE_LENGTH * (tp / 100.0));
     newWavetable->tableDiv2 = rint(TABLE_LENGTH * ((tp + tnMax) / 100.0));
@@ -83,27 +185,27 @@ TRMWavetable *TRMWavetableCreate(int waveform, double tp, double tnMin, double t
     newWavetable->tnDelta = rint(TABLE_LENGTH * ((tnMax - tnMin) / 100.0));
     newWavetable->basicIncrement = (double)TABLE_LENGTH / sampleRate;
     newWavetable->currentPosition = 0;
+    newWavetable->pulseBank = NULL;
 
     //  Initialize the wavetable with either a glottal pulse or sine tone
     if (waveform == PULSE) {
-        //  Calculate rise portion of wave table
-        for (i = 0; i < newWavetable->tableDiv1; i++) {
-            double x = (double)i / (double)newWavetable->tableDiv1;
-            double x2 = x * x;
-            double x3 = x2 * x;
-            newWavetable->wavetable[i] = (3.0 * x2) - (2.0 * x3);
+        //  The pulse tables are shared; start with the fully open one
+        newWavetable->pulseBank = TRMPulseBankAcquire(tp, tnMin, tnMax, newWavetable->tableDiv1,
+                                                      newWavetable->tableDiv2, (int)newWavetable->tnDelta);
+        if (newWavetable->pulseBank == NULL) {
+            free(newWavetable);
+            return NULL;
         }
-
-        //  Calculate fall portion of wave table
-        for (i = newWavetable->tableDiv1, j = 0; i < newWavetable->tableDiv2; i++, j++) {
-            double x = (double)j / newWavetable->tnLength;
-            newWavetable->wavetable[i] = 1.0 - (x * x);
+        newWavetable->wavetable = newWavetable->pulseBank->tables;
+    } else {
+        //  Allocate memory for wavetable
+        newWavetable->wavetable = (double *)calloc(TABLE_LENGTH, sizeof(double));
+        if (newWavetable->wavetable == NULL) {
+            fprintf(stderr, "Failed to allocate space for wavetable in TRMWavetableCreate.\n");
+            free(newWavetable);
+            return NULL;
         }
 
-        //  Set closed portion of wave table
-        for (i = newWavetable->tableDiv2; i < TABLE_LENGTH; i++)
-            newWavetable->wavetable[i] = 0.0;
-    } else {
         //  Sine wave
         for (i = 0; i < TABLE_LENGTH; i++) {
             newWavetable->wavetable[i] = sin( ((double)i / (double)TABLE_LENGTH) * 2.0 * PI );
@@ -123,61 +225,59 @@ void TRMWavetableFree(TRMWavetable *wavetable)
         wavetable->FIRFilter = NULL;
     }
 
-    if (wavetable->wavetable != NULL) {
+    if (wavetable->pulseBank != NULL) {
+        TRMPulseBankRelease(wavetable->pulseBank);
+        wavetable->pulseBank = NULL;
+    } else if (wavetable->wavetable != NULL) {
         free(wavetable->wavetable);
-        wavetable->wavetable = NULL;
     }
+    wavetable->wavetable = NULL;
 
     free(wavetable);
 }
 
+// Copies the oscillator phase, current pulse and oversampling filter memory of
+// one wavetable into another.  Returns ERROR (copying nothing) if the two do
+// not share the same pulse tables, or are not both sine tones with the same
+// filter.
+int TRMWavetableCopy(TRMWavetable *destination, const TRMWavetable *source)
+{
+    if ((destination->pulseBank != source->pulseBank) ||
+        (destination->tableDiv1 != source->tableDiv1) || (destination->tableDiv2 != source->tableDiv2) ||
+        (destination->basicIncrement != source->basicIncrement) ||
+        (destination->FIRFilter->numberTaps != source->FIRFilter->numberTaps))
+        return ERROR;
+
+    /*  A PULSE POINTS INTO THE SHARED TABLES; A SINE TABLE NEVER CHANGES  */
+    if (source->pulseBank != NULL)
+        destination->wavetable = source->wavetable;
+    destination->currentPosition = source->currentPosition;
+
+    memcpy(destination->FIRFilter->FIRData, source->FIRFilter->FIRData,
+           source->FIRFilter->numberTaps * sizeof(double));
+    destination->FIRFilter->FIRPtr = source->FIRFilter->FIRPtr;
+
+    return SUCCESS;
+}
+
+
 
-// Rewrites the changeable part of the glottal pulse according to the amplitude.
+// Selects the precalculated glottal pulse whose closure point matches the amplitude.
 void TRMWavetableUpdate(TRMWavetable *wavetable, double amplitude)
 {
-    int i;
+    int k;
 
-    //  Calculate new closure point, based on amplitude
-    double newDiv2 = wavetable->tableDiv2 - rint(amplitude * wavetable->tnDelta);
-    double newTnLength = newDiv2 - wavetable->tableDiv1;
-    double j;
-
-    //  Recalculate the falling portion of the glottal pulse
-#ifdef USE_VECLIB
-    {
-        double aj[TABLE_LENGTH], ajj[TABLE_LENGTH], one[TABLE_LENGTH];
-        double scale = 1.0 / (newTnLength * newTnLength);
-        int len;
-
-        len = newTnLength;
-        for (i = 0, j = 0.0; i < len; i++, j += 1.0) {
-            aj[i] = j;
-            one[i] = 1.0;
-        }
-
-        vsqD(aj, 1, ajj, 1, len);
-        vsmulD(ajj, 1, &scale, aj, 1, len);
-        vsubD(aj, 1, one, 1, &(wavetable->wavetable[wavetable->tableDiv1]), 1, len); // The docs seem to be wrong about which one gets subtracted...
-    }
-#else
-    {
-        for (i = wavetable->tableDiv1, j = 0.0; i < newDiv2; i++, j++) {
-            double x = j / newTnLength;
-            wavetable->wavetable[i] = 1.0 - (x * x);
-        }
-    }
+    if (wavetable->pulseBank == NULL)
+        return;
 
-#endif
+    //  Calculate new closure point, based on amplitude
+    k = rint(amplitude * wavetable->tnDelta);
+    if (k < 0)
+        k = 0;
+    else if (k > wavetable->pulseBank->tnDelta)
+        k = wavetable->pulseBank->tnDelta;
 
-    //  Fill in with closed portion of glottal pulse
-#if 1
-    for (i = newDiv2; i < wavetable->tableDiv2; i++)
-        wavetable->wavetable[i] = 0.0;
-#else
-    i = newDiv2;
-    if (wavetable->tableDiv2 > i)
-        memset(&(wavetable[i]), 0, (wavetable->tableDiv2 - i) * sizeof(double)); // This seems to be crashy... possibly with 0 sizes?
-#endif
+    wavetable->wavetable = &(wavetable->pulseBank->tables[k * TABLE_LENGTH]);
 }
 
 
@@ -188,6 +288,19 @@ static void TRMWavetableIncrementPosition(TRMWavetable *wavetable, double freque
     wavetable->currentPosition = mod0(wavetable->currentPosition + (frequency * wavetable->basicIncrement));
 }
 
+// Moves the oscillator on by one output sample without computing it, the same
+// way that TRMWavetableOscillator does.
+
+void TRMWavetableAdvance(TRMWavetable *wavetable, double frequency)
+{
+#if OVERSAMPLING_OSCILLATOR
+    TRMWavetableIncrementPosition(wavetable, frequency / 2.0);
+    TRMWavetableIncrementPosition(wavetable, frequency / 2.0);
+#else
+    TRMWavetableIncrementPosition(wavetable, frequency);
+#endif
+}
+
 // A 2X oversampling interpolating wavetable oscillator.
 
 #if OVERSAMPLING_OSCILLATOR
@@ -236,3 +349,79 @@ double TRMWavetableOscillator(TRMWavetable *wavetable, double frequency)  //  Pl
              (wavetable->wavetable[upperPosition] - wavetable->wavetable[lowerPosition])));
 }
 #endif
+
+
+
+// Generates 'numberSamples' oscillator outputs at once, selecting the glottal pulse
+// for amplitude[i] (unless 'amplitude' is NULL) before each one.  The output is
+// identical to calling TRMWavetableUpdate and TRMWavetableOscillator per sample.
+
+#if OVERSAMPLING_OSCILLATOR
+void TRMWavetableOscillatorBlock(TRMWavetable *wavetable, const double *frequency, const double *amplitude,
+                                 double *output, int numberSamples)
+{
+    TRMFIRFilter *filter = wavetable->FIRFilter;
+    const double *coef = filter->FIRCoef;
+    const int numberTaps = filter->numberTaps;
+    const int past = numberTaps - 1;
+    double history[FIR_MAXIMUM_TAPS - 1 + 2 * OSCILLATOR_BLOCK];
+    int i, j, k, count, lowerPosition, upperPosition;
+
+    /*  UNROLL THE CIRCULAR FIR MEMORY INTO A LINEAR HISTORY, OLDEST FIRST  */
+    for (k = 1; k <= past; k++)
+        history[past - k] = filter->FIRData[(filter->FIRPtr + k) % numberTaps];
+
+    while (numberSamples > 0) {
+        count = (numberSamples < OSCILLATOR_BLOCK) ? numberSamples : OSCILLATOR_BLOCK;
+
+        /*  RUN THE OSCILLATOR AT TWICE THE SAMPLE RATE  */
+        for (j = 0; j < count; j++) {
+            if (amplitude != NULL)
+                TRMWavetableUpdate(wavetable, amplitude[j]);
+
+            for (i = 0; i < 2; i++) {
+                wavetable->currentPosition = mod0(wavetable->currentPosition + ((frequency[j] / 2.0) * wavetable->basicIncrement));
+                lowerPosition = (int)wavetable->currentPosition;
+                upperPosition = (lowerPosition == TABLE_MODULUS) ? 0 : lowerPosition + 1;
+                history[past + 2 * j + i] = (wavetable->wavetable[lowerPosition] +
+                                             ((wavetable->currentPosition - lowerPosition) *
+                                              (wavetable->wavetable[upperPosition] - wavetable->wavetable[lowerPosition])));
+            }
+        }
+
+        /*  DECIMATE: ONLY THE SECOND OF EACH PAIR OF INPUTS NEEDS AN OUTPUT  */
+        for (j = 0; j < count; j++) {
+            const double *newest = &history[past + 2 * j + 1];
+            double sum = 0.0;
+            for (k = 0; k < numberTaps; k++)
+                sum += newest[-k] * coef[k];
+            output[j] = sum;
+        }
+
+        /*  KEEP THE LAST INPUTS AS HISTORY FOR THE NEXT BLOCK  */
+        memmove(history, &history[2 * count], past * sizeof(double));
+
+        frequency += count;
+        if (amplitude != NULL)
+            amplitude += count;
+        output += count;
+        numberSamples -= count;
+    }
+
+    /*  WRITE THE HISTORY BACK INTO THE CIRCULAR FIR MEMORY  */
+    for (k = 1; k <= past; k++)
+        filter->FIRData[(filter->FIRPtr + k) % numberTaps] = history[past - k];
+}
+#else
+void TRMWavetableOscillatorBlock(TRMWavetable *wavetable, const double *frequency, const double *amplitude,
+                                 double *output, int numberSamples)
+{
+    int j;
+
+    for (j = 0; j < numberSamples; j++) {
+        if (amplitude != NULL)
+            TRMWavetableUpdate(wavetable, amplitude[j]);
+        output[j] = TRMWavetableOscillator(wavetable, frequency[j]);
+    }
+}
+#endif
@@ -34,9 +34,24 @@
 //  Compile with oversampling or plain oscillator
 #define OVERSAMPLING_OSCILLATOR   1
 
+//  Glottal pulse tables for every closure point of a given (tp, tnMin, tnMax),
+//  shared by all the wavetables that use the same pulse shape
+typedef struct _TRMPulseBank {
+    double tp;
+    double tnMin;
+    double tnMax;
+
+    int tnDelta;
+    double *tables;
+
+    int references;
+    struct _TRMPulseBank *next;
+} TRMPulseBank;
+
 typedef struct _TRMWavetable {
     TRMFIRFilter *FIRFilter;
     double *wavetable;
+    TRMPulseBank *pulseBank;
 
     int tableDiv1;
     int tableDiv2;
@@ -49,8 +64,12 @@ typedef struct _TRMWavetable {
 
 TRMWavetable *TRMWavetableCreate(int waveform, double tp, double tnMin, double tnMax, double sampleRate);
 void TRMWavetableFree(TRMWavetable *wavetable);
+int TRMWavetableCopy(TRMWavetable *destination, const TRMWavetable *source);
 
 void TRMWavetableUpdate(TRMWavetable *wavetable, double amplitude);
 double TRMWavetableOscillator(TRMWavetable *wavetable, double frequency);
+void TRMWavetableAdvance(TRMWavetable *wavetable, double frequency);
+void TRMWavetableOscillatorBlock(TRMWavetable *wavetable, const double *frequency, const double *amplitude,
+                                 double *output, int numberSamples);
 
 #endif
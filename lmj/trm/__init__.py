@@ -18,8 +18,56 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 # SOFTWARE.
 
-'''A Python wrapper for the Tube Resonance Model from gnuspeech.'''
+'''A Python wrapper for the Tube Resonance Model from gnuspeech.
+
+Only the tube model is imported with the package. The other subsystems (and
+NumPy, SciPy and the XML parser that they need) are imported the first time
+one of their names is used, so that short-lived processes which only
+synthesize a control file start quickly (see test/import_time.py).
+'''
+
+import importlib
+import sys
+import types
 
 from tube import Parameters, TubeModel, parse_input_file, synthesize
-from postures import Repertoire
-import babbler
+
+# names that are imported on first use, mapped to (submodule, attribute). an
+# attribute of None stands for the submodule itself.
+_LAZY = dict(
+    Repertoire=('postures', 'Repertoire'),
+    BlockRenderer=('realtime', 'BlockRenderer'),
+    FrameSlot=('realtime', 'FrameSlot'),
+    babbler=('babbler', None),
+)
+
+__all__ = ['Parameters', 'TubeModel', 'parse_input_file', 'synthesize',
+           'Repertoire', 'BlockRenderer', 'FrameSlot', 'babbler']
+
+
+class _LazyModule(types.ModuleType):
+    '''A package module that imports the names in _LAZY on first access.'''
+
+    def __init__(self, module):
+        super(_LazyModule, self).__init__(module.__name__, module.__doc__)
+        self.__dict__.update(module.__dict__)
+        # python 2 clears the globals of a module when it is deallocated, and
+        # the functions in this file still need them.
+        self._module = module
+
+    def __getattr__(self, name):
+        if name not in _LAZY:
+            raise AttributeError(
+                '%r object has no attribute %r' % (self.__name__, name))
+        submodule, attribute = _LAZY[name]
+        value = importlib.import_module('%s.%s' % (self.__name__, submodule))
+        if attribute is not None:
+            value = getattr(value, attribute)
+        setattr(self, name, value)
+        return value
+
+    def __dir__(self):
+        return sorted(set(self.__dict__) | set(_LAZY))
+
+
+sys.modules[__name__] = _LazyModule(sys.modules[__name__])
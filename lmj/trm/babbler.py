@@ -20,6 +20,9 @@
 
 '''Classes for babbling using the postures in a repertoire.'''
 
+import numpy
+import numpy.random as rng
+
 
 class Babbler(list):
     '''A babbler generates sequences of phone symbols from a repertoire.'''
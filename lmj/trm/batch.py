@@ -0,0 +1,304 @@
+# Copyright (c) 2011 Leif Johnson <leif@leifjohnson.net>
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+'''Render directories of .gnuspeech control files across several processes.
+
+This module is installed as the trm-render command:
+
+    trm-render -j 8 -o prompts/audio prompts/control
+
+Each argument is a directory, which is searched recursively for .gnuspeech
+files, a single .gnuspeech file, or a text file listing control files one per
+line. Outputs mirror the layout of the inputs under the output directory, with
+the extension given by the file format in each control file. An output is
+skipped when it is newer than its control file (--check mtime, the default), or
+when the control file has the same SHA-1 digest as in the last run (--check
+hash). A JSON manifest records the duration, peak level (as a fraction of full
+scale) and render time of every output, and the command exits with status 1 if
+any file failed.
+'''
+
+import hashlib
+import json
+import logging
+import multiprocessing
+import optparse
+import os
+import sys
+import time
+
+import gnuspeech
+import loudness
+import tube
+
+EXTENSIONS = {gnuspeech.AU_FILE_FORMAT: '.au',
+              gnuspeech.AIFF_FILE_FORMAT: '.aiff',
+              gnuspeech.WAVE_FILE_FORMAT: '.wav'}
+
+SUFFIX = '.gnuspeech'
+
+
+def read_header(filename, count=4):
+    '''Read the first few values of a control file without parsing it all.
+
+    Returns a list with the output file format, output sample rate, control
+    rate and master volume (see parseInputFile).
+    '''
+    values = []
+    with open(filename) as handle:
+        for line in handle:
+            value = line.split(';')[0].strip()
+            try:
+                values.append(float(value))
+            except ValueError:
+                raise ValueError('%s: bad header value %r' % (filename, value))
+            if len(values) == count:
+                break
+    if len(values) < count:
+        raise ValueError('%s: control file header is too short' % filename)
+    return values
+
+
+def output_peak(filename, peak):
+    '''Return the peak level of the sound file written for a control file.
+
+    peak is the largest absolute sample before scaling, as returned by
+    tube.synthesize. The samples are scaled as in writeOutputToFile (see
+    output.c), using the master volume, channels and balance from the control
+    file header, and the result is a fraction of 16-bit full scale.
+    '''
+    if not peak:
+        return 0.
+    volume, channels, balance = read_header(filename, 6)[3:]
+    scale = gnuspeech.OUTPUT_SCALE * (gnuspeech.RANGE_MAX / peak) * \
+        loudness.amplitude(volume)
+    if int(channels) == 2:
+        # the louder side of the balance gets up to twice the mono scale.
+        scale *= 1. + abs(balance)
+    return round(peak * scale) / gnuspeech.RANGE_MAX
+
+
+def digest(filename):
+    '''Return the SHA-1 digest of the contents of a file.'''
+    sha = hashlib.sha1()
+    with open(filename, 'rb') as handle:
+        for chunk in iter(lambda: handle.read(1 << 16), ''):
+            sha.update(chunk)
+    return sha.hexdigest()
+
+
+def find_inputs(paths):
+    '''Find control files, as (control filename, relative name) pairs.
+
+    Relative names are used to lay out the outputs: files found under a
+    directory are named relative to that directory, files listed in a text file
+    relative to the directory of that file.
+    '''
+    for path in paths:
+        if os.path.isdir(path):
+            for root, dirs, files in os.walk(path):
+                dirs.sort()
+                for name in sorted(files):
+                    if name.endswith(SUFFIX):
+                        filename = os.path.join(root, name)
+                        yield filename, os.path.relpath(filename, path)
+        elif path.endswith(SUFFIX):
+            yield path, os.path.basename(path)
+        else:
+            base = os.path.dirname(path)
+            with open(path) as handle:
+                for line in handle:
+                    line = line.split('#')[0].strip()
+                    if line:
+                        filename = os.path.join(base, line)
+                        yield filename, os.path.relpath(filename, base)
+
+
+def render(job):
+    '''Render one control file and return its manifest entry.
+
+    job is a tuple (control filename, output filename, engine). Samples are
+    written to a temporary file that is renamed over the output when it is
+    complete, so a failed or interrupted render never leaves an output that
+    looks up to date.
+    '''
+    source, output, engine = job
+    entry = dict(input=source, output=output, engine=engine, status='ok')
+    temporary = '%s.%d.tmp' % (output, os.getpid())
+    start = time.time()
+    try:
+        entry['sha1'] = digest(source)
+        rate = read_header(source, 2)[1]
+        samples, peak = tube.synthesize(source, temporary, engine=engine)
+        if not os.path.exists(temporary):
+            raise IOError('%s: cannot write output' % output)
+        os.rename(temporary, output)
+        entry['samples'] = samples
+        entry['duration'] = samples / rate
+        entry['peak'] = output_peak(source, peak)
+    except Exception, e:
+        entry['status'] = 'error'
+        entry['error'] = str(e)
+        if os.path.exists(temporary):
+            os.remove(temporary)
+    entry['seconds'] = time.time() - start
+    return entry
+
+
+def load_manifest(filename):
+    '''Load the entries of a previous manifest, keyed by control filename.'''
+    if not os.path.exists(filename):
+        return {}
+    with open(filename) as handle:
+        return dict((e['input'], e) for e in json.load(handle)['files'])
+
+
+def is_current(source, output, check, previous, engine):
+    '''Decide whether an existing output is up to date with its input.'''
+    if check == 'none' or not os.path.exists(output):
+        return False
+    if check == 'mtime':
+        return os.path.getmtime(output) >= os.path.getmtime(source)
+    entry = previous.get(source)
+    return (entry is not None and
+            entry.get('status') == 'ok' and
+            entry.get('engine') == engine and
+            entry.get('sha1') == digest(source))
+
+
+class Progress(object):
+    '''Report throughput on stderr as files are rendered.'''
+
+    def __init__(self, total, interval=1.):
+        self.total = total
+        self.interval = interval
+        self.done = self.failed = 0
+        self.audio = 0.
+        self.start = self.last = time.time()
+
+    def update(self, entry):
+        self.done += 1
+        if entry['status'] == 'ok':
+            self.audio += entry['duration']
+        else:
+            self.failed += 1
+            logging.error('%s: %s', entry['input'], entry['error'])
+        now = time.time()
+        if now - self.last >= self.interval or self.done == self.total:
+            self.last = now
+            print >> sys.stderr, self
+
+    def __str__(self):
+        elapsed = max(1e-9, time.time() - self.start)
+        return ('%d/%d files, %d failed, %.1f files/s, %.1fx real time' %
+                (self.done, self.total, self.failed, self.done / elapsed,
+                 self.audio / elapsed))
+
+
+def main(args=None):
+    '''Run the trm-render command and return its exit status.'''
+    parser = optparse.OptionParser(
+        usage='%prog [options] DIRECTORY|FILE.gnuspeech|LIST ...')
+    parser.add_option('-o', '--output', default=None, metavar='DIR',
+                      help='write outputs under DIR (default: next to inputs)')
+    parser.add_option('-j', '--processes', type=int, default=None,
+                      help='number of worker processes (default: all cores)')
+    parser.add_option('-e', '--engine', default='fast',
+                      choices=sorted(tube.TubeModel.ENGINES),
+                      help='synthesis engine (default: %default)')
+    parser.add_option('-c', '--check', default='mtime',
+                      choices=('mtime', 'hash', 'none'),
+                      help='how to find up-to-date outputs: mtime, hash or '
+                      'none to render everything (default: %default)')
+    parser.add_option('-m', '--manifest', default=None, metavar='FILE',
+                      help='JSON manifest to write (default: manifest.json '
+                      'in the output directory)')
+    parser.add_option('--progress', type=float, default=1., metavar='SECONDS',
+                      help='seconds between progress reports')
+    parser.add_option('-v', '--verbose', action='store_true',
+                      help='log each file, and print diagnostics from the '
+                      'synthesizer')
+    opts, args = parser.parse_args(args)
+    if not args:
+        parser.error('no inputs given')
+
+    logging.basicConfig(
+        level=logging.INFO if opts.verbose else logging.WARNING,
+        stream=sys.stderr, format='%(asctime)s %(message)s')
+    gnuspeech.cvar.verbose = int(bool(opts.verbose))
+
+    manifest = opts.manifest or os.path.join(opts.output or '.',
+                                             'manifest.json')
+    previous = load_manifest(manifest)
+
+    jobs = []
+    entries = []
+    current = 0
+    for source, relative in find_inputs(args):
+        try:
+            file_format = int(read_header(source, 1)[0])
+        except (IOError, ValueError), e:
+            entries.append(dict(input=source, status='error', error=str(e)))
+            logging.error('%s', e)
+            continue
+        extension = EXTENSIONS.get(file_format, '.au')
+        if opts.output:
+            output = os.path.join(
+                opts.output, os.path.splitext(relative)[0] + extension)
+        else:
+            output = os.path.splitext(source)[0] + extension
+        if is_current(source, output, opts.check, previous, opts.engine):
+            entries.append(previous.get(source) or
+                           dict(input=source, output=output, status='ok'))
+            current += 1
+            continue
+        directory = os.path.dirname(output)
+        if directory and not os.path.isdir(directory):
+            os.makedirs(directory)
+        jobs.append((source, output, opts.engine))
+
+    print >> sys.stderr, '%d files to render, %d up to date' % (
+        len(jobs), current)
+    progress = Progress(len(jobs), opts.progress)
+    if jobs:
+        pool = multiprocessing.Pool(opts.processes)
+        for entry in pool.imap_unordered(render, jobs):
+            progress.update(entry)
+            entries.append(entry)
+        pool.close()
+        pool.join()
+
+    entries.sort(key=lambda e: e['input'])
+    failed = [e for e in entries if e['status'] != 'ok']
+    directory = os.path.dirname(manifest)
+    if directory and not os.path.isdir(directory):
+        os.makedirs(directory)
+    with open(manifest, 'w') as handle:
+        json.dump(dict(files=entries,
+                       rendered=progress.done,
+                       failed=len(failed),
+                       seconds=time.time() - progress.start,
+                       audio_seconds=progress.audio),
+                  handle, indent=1, sort_keys=True)
+    return 1 if failed else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,180 @@
+# Copyright (c) 2011 Leif Johnson <leif@leifjohnson.net>
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+'''Render long control sequences in parallel chunks.
+
+A TubeModel renders a whole utterance serially on one core. This module splits
+a long sequence of control frames into chunks and renders each chunk in a
+worker process. Before a chunk is rendered, its model is moved ahead with
+seekSynthesis so that the glottal oscillator, the noise generator and the
+sample rate converter line up exactly with a serial render of the whole
+sequence. The tube and filter memories still start out empty, so each chunk
+also renders some warm-up frames before its own frames and throws their output
+away. Neighboring chunks overlap by a short crossfade.
+
+    samples = render(parameters, frames, chunk_frames=1000, processes=8)
+    print compare(parameters, frames, chunk_frames=1000, processes=8)
+'''
+
+import logging
+import math
+import multiprocessing
+import numpy
+import time
+
+import gnuspeech
+import tube
+
+
+def _output_position(model, frame):
+    '''Return the (fractional) output sample index at which a frame starts.'''
+    converter = model._model.sampleRateConverter
+    ratio = float(converter.timeRegisterIncrement) / gnuspeech.FRACTION_RANGE
+    return frame * model._model.controlPeriod / ratio
+
+
+def render_chunk(parameters, frames, start, end, warmup=0, engine='fast'):
+    '''Render frames[start:end + 1] as part of the whole sequence of frames.
+
+    The model is first moved ahead to frame start - warmup. Returns a tuple
+    (offset, samples): the samples line up with the output of a serial render
+    of all the frames, beginning at sample offset.
+    '''
+    first = max(0, start - warmup)
+    model = tube.TubeModel(parameters, engine=engine)
+    pitch = numpy.ascontiguousarray(frames[:first + 1, 0], numpy.float64)
+    offset = gnuspeech.seekSynthesis(
+        model._model,
+        gnuspeech.double_array_from_address(pitch.ctypes.data),
+        first)
+    samples = numpy.asarray(model.synthesize(frames[first:end + 1]))
+    return offset, samples
+
+
+_worker = {}
+
+
+def _initialize_worker(parameters, frames, warmup, engine):
+    _worker.update(parameters=parameters, frames=frames, warmup=warmup,
+                   engine=engine)
+
+
+def _render(bounds):
+    w = _worker
+    return render_chunk(w['parameters'], w['frames'], bounds[0], bounds[1],
+                        w['warmup'], w['engine'])
+
+
+def render(parameters, frames, chunk_frames=1000, warmup_frames=20,
+           crossfade=256, processes=None, engine='fast'):
+    '''Render control frames in parallel chunks.
+
+    parameters: A tube.Parameters object.
+    frames: A numpy array of control frames, one per row.
+    chunk_frames: Number of frames in each chunk.
+    warmup_frames: Number of frames before each chunk that are rendered (and
+      discarded) to let the tube and filters settle.
+    crossfade: Number of output samples over which neighboring chunks are
+      crossfaded.
+    processes: Number of worker processes (defaults to the number of CPUs).
+    engine: The synthesis engine (see TubeModel). The fast engine keeps all of
+      its state in the model, so it is the one that lines up best.
+
+    Returns a float64 numpy array of unscaled samples.
+    '''
+    frames = numpy.asarray(frames, numpy.float64)
+    count = len(frames)
+    if count <= chunk_frames + 1:
+        return render_chunk(parameters, frames, 0, count - 1, 0, engine)[1]
+
+    # where each chunk's own frames begin, in frames and in output samples.
+    model = tube.TubeModel(parameters, engine=engine)
+    starts = range(0, count - 1, chunk_frames)
+    seams = [int(math.ceil(_output_position(model, s))) for s in starts]
+
+    # chunks render a few frames past their end, so that the crossfade and the
+    # look-ahead of the sample rate converter are covered.
+    tail = int(math.ceil(crossfade / _output_position(model, 1))) + 2
+    bounds = [(s, min(count - 1, s + chunk_frames + tail)) for s in starts]
+    del model
+
+    processes = min(processes or multiprocessing.cpu_count(), len(bounds))
+    pool = multiprocessing.Pool(
+        processes, _initialize_worker,
+        (parameters, frames, warmup_frames, engine))
+    try:
+        chunks = pool.map(_render, bounds)
+        pool.close()
+    except:
+        pool.terminate()
+        raise
+    finally:
+        pool.join()
+
+    offset, samples = chunks[-1]
+    output = numpy.zeros(offset + len(samples), numpy.float64)
+    fade_in = numpy.linspace(0., 1., crossfade, endpoint=False)
+    for i, (offset, samples) in enumerate(chunks):
+        lo = seams[i]
+        hi = seams[i + 1] + crossfade if i + 1 < len(chunks) else len(output)
+        assert offset <= lo and offset + len(samples) >= hi, \
+            'chunk %d does not cover its output range' % i
+        part = samples[lo - offset:hi - offset].copy()
+        if i > 0:
+            part[:crossfade] *= fade_in
+        if i + 1 < len(chunks):
+            part[-crossfade:] *= 1. - fade_in
+        output[lo:hi] += part
+    return output
+
+
+def compare(parameters, frames, engine='fast', **kwargs):
+    '''Render frames serially and in chunks, and report the differences.
+
+    Keyword arguments are passed on to render(). Returns a dictionary with the
+    largest and root-mean-square error relative to the serial peak, and the
+    time taken by each render.
+    '''
+    frames = numpy.asarray(frames, numpy.float64)
+
+    start = time.time()
+    serial = numpy.asarray(
+        tube.TubeModel(parameters, engine=engine).synthesize(frames))
+    serial_time = time.time() - start
+
+    start = time.time()
+    chunked = render(parameters, frames, engine=engine, **kwargs)
+    chunked_time = time.time() - start
+
+    n = min(len(serial), len(chunked))
+    peak = max(abs(serial).max(), 1e-300)
+    error = serial[:n] - chunked[:n]
+    report = dict(
+        samples=len(serial),
+        length_difference=len(chunked) - len(serial),
+        max_error=abs(error).max() / peak,
+        rms_error=numpy.sqrt((error ** 2).mean()) / peak,
+        serial_time=serial_time,
+        chunked_time=chunked_time,
+        speedup=serial_time / max(chunked_time, 1e-9))
+    logging.info('chunked render: max error %(max_error).3g, rms error '
+                 '%(rms_error).3g, %(serial_time).3fs serial, '
+                 '%(chunked_time).3fs chunked (%(speedup).2fx)', report)
+    return report
@@ -0,0 +1,174 @@
+# Copyright (c) 2011 Leif Johnson <leif@leifjohnson.net>
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+'''A precomputed articulatory codebook for acoustic-to-articulatory inversion.
+
+A Codebook samples tube configurations (8 region radii plus the velum) within
+the bounds given by a Repertoire's parameters, computes their formants with the
+analytical fast path in the spectrum module, and stores configurations and
+formants in memory-mapped .npy chunks on disk. A KD-tree over the (log)
+formants answers nearest-neighbor queries, and the codebook can be extended
+with more samples at any time.
+
+Usage:
+
+    book = Codebook('/data/codebook', lmj.trm.Parameters())
+    book.extend(100000)
+    distances, configurations = book.query([700, 1200, 2500], k=5)
+'''
+
+import glob
+import logging
+import numpy
+import numpy.random as rng
+import os
+import scipy.spatial
+
+import postures
+import spectrum
+
+# names of the repertoire parameters that make up a configuration.
+CONFIGURATION = ('r1', 'r2', 'r3', 'r4', 'r5', 'r6', 'r7', 'r8', 'velum')
+
+
+class Codebook(object):
+    '''A memory-mapped set of tube configurations indexed by their formants.'''
+
+    def __init__(self, root, parameters, formants=3, repertoire=None,
+                 min_radius=0.05):
+        '''Open (or create) a codebook in the given directory.
+
+        root: Directory holding the codebook chunks.
+        parameters: The tube.Parameters used to compute formants. Use the same
+          parameters every time a codebook is opened.
+        formants: Number of formants used as acoustic features.
+        repertoire: A postures.Repertoire whose parameter bounds limit the
+          sampled configurations. Defaults to the standard diphone repertoire.
+        min_radius: Lower bound for sampled radii, since a fully closed tube
+          has no formants.
+        '''
+        self.root = root
+        self.parameters = parameters
+        self.formants = formants
+        self.min_radius = min_radius
+
+        repertoire = repertoire or postures.Repertoire()
+        bounds = [repertoire.parameters[name] for name in CONFIGURATION]
+        self.minimum = numpy.array([max(p.min, min_radius) for p in bounds])
+        self.maximum = numpy.array([p.max for p in bounds])
+
+        if not os.path.isdir(root):
+            os.makedirs(root)
+
+        self._configurations = []
+        self._features = []
+        for path in sorted(glob.glob(os.path.join(root, 'features-*.npy'))):
+            self._load(os.path.basename(path)[len('features-'):-len('.npy')])
+        self._tree = None
+
+    def __len__(self):
+        return sum(len(f) for f in self._features)
+
+    def _path(self, name, chunk):
+        return os.path.join(self.root, '%s-%s.npy' % (name, chunk))
+
+    def _load(self, chunk):
+        features = numpy.load(self._path('features', chunk), mmap_mode='r')
+        assert features.shape[1] == self.formants, \
+            '%s: codebook has %d formants, not %d' % (
+                self.root, features.shape[1], self.formants)
+        self._configurations.append(
+            numpy.load(self._path('configurations', chunk), mmap_mode='r'))
+        self._features.append(features)
+
+    def extend(self, count, chunk_size=50000):
+        '''Sample count new configurations and add them to the codebook.
+
+        Samples are drawn uniformly within the parameter bounds. Samples
+        without the required number of formants are discarded, so the codebook
+        may grow by somewhat less than count.
+        '''
+        added = 0
+        while added < count:
+            n = min(chunk_size, count - added)
+            added += n
+            configurations = rng.uniform(
+                self.minimum, self.maximum, (n, len(CONFIGURATION)))
+            freqs, _ = spectrum.formants(
+                configurations[:, :8], configurations[:, 8], self.parameters,
+                count=self.formants, n=512)
+            valid = ~numpy.isnan(freqs).any(axis=1)
+
+            # chunk names sort in creation order, and never collide.
+            chunk = '%05d' % len(self._features)
+            numpy.save(self._path('configurations', chunk),
+                       configurations[valid].astype(numpy.float32))
+            numpy.save(self._path('features', chunk),
+                       freqs[valid].astype(numpy.float32))
+            self._load(chunk)
+            logging.info('%s: chunk %s has %d of %d valid samples',
+                         self.root, chunk, valid.sum(), n)
+        self._tree = None
+
+    @property
+    def tree(self):
+        '''The KD-tree over log formants, rebuilt after the codebook grows.'''
+        if not len(self):
+            raise ValueError('%s: codebook is empty, call extend() first' %
+                             self.root)
+        if self._tree is None:
+            self._tree = scipy.spatial.cKDTree(numpy.log(numpy.concatenate(
+                [numpy.asarray(f, numpy.float64) for f in self._features])))
+        return self._tree
+
+    def configuration(self, index):
+        '''Return the configuration (8 radii and velum) at a flat index.'''
+        for configurations in self._configurations:
+            if index < len(configurations):
+                return configurations[index]
+            index -= len(configurations)
+        raise IndexError(index)
+
+    def query(self, formants, k=1):
+        '''Find the configurations whose formants are closest to a target.
+
+        formants: Target formant frequencies in Hz, shape (..., formants).
+          Distances are measured between log frequencies, so that relative
+          errors count the same in every formant.
+        k: Number of neighbors to return. This must not be more than the
+          number of configurations in the codebook.
+
+        Returns a tuple (distances, configurations), with shapes (..., k) and
+        (..., k, 9). Raises ValueError if the codebook is empty or smaller
+        than k.
+        '''
+        if not 1 <= k <= len(self):
+            raise ValueError('%s: cannot find %d neighbors among %d '
+                             'configurations' % (self.root, k, len(self)))
+        distances, indices = self.tree.query(numpy.log(formants), k=k)
+        distances = numpy.asarray(distances).reshape(numpy.shape(formants)[:-1] + (k, ))
+        indices = numpy.asarray(indices).reshape(distances.shape)
+        offsets = numpy.cumsum([0] + [len(c) for c in self._configurations])
+        chunks = numpy.searchsorted(offsets, indices, side='right') - 1
+        configurations = numpy.empty(indices.shape + (len(CONFIGURATION), ), numpy.float32)
+        for c in numpy.unique(chunks):
+            mask = chunks == c
+            configurations[mask] = self._configurations[c][indices[mask] - offsets[c]]
+        return distances, configurations
@@ -0,0 +1,363 @@
+# Copyright (c) 2011 Leif Johnson <leif@leifjohnson.net>
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+'''A streaming pipeline for building speech datasets with the TRM.
+
+The pipeline babbles random phone sequences, interpolates them into control
+frames, synthesizes audio, and computes spectral features, with utterances
+processed concurrently in a pool of worker processes. Features are computed
+block by block once an utterance has been synthesized. Results are written into
+fixed-size, memory-mapped .npy shards, with a plain-text index recording where
+each utterance lives. Only a bounded number of utterances are ever in flight,
+so memory use does not grow with the size of the corpus, and an interrupted
+build picks up after the last utterance recorded in the index.
+
+Usage:
+
+    build('/data/babble', count=100000, parameters=lmj.trm.Parameters(...))
+    for utterance in read('/data/babble'):
+        ...
+'''
+
+import logging
+import multiprocessing
+import numpy
+import numpy.lib.format
+import numpy.lib.stride_tricks
+import numpy.random as rng
+import os
+
+import babbler as babblers
+import postures
+import tube
+
+# names of the arrays stored for each utterance.
+STREAMS = ('frames', 'audio', 'features')
+
+INDEX = 'index.txt'
+
+
+def mel_filters(sample_rate, n_fft, n_mels, fmin=0., fmax=None):
+    '''Return an (n_mels, n_fft // 2 + 1) array of triangular mel filters.'''
+    def mel(hz):
+        return 2595. * numpy.log10(1. + hz / 700.)
+
+    def hz(m):
+        return 700. * (10. ** (m / 2595.) - 1.)
+
+    fmax = fmax or sample_rate / 2.
+    edges = hz(numpy.linspace(mel(fmin), mel(fmax), n_mels + 2))
+    bins = numpy.linspace(0, sample_rate / 2., n_fft // 2 + 1)
+    lower = (bins - edges[:-2, None]) / (edges[1:-1] - edges[:-2])[:, None]
+    upper = (edges[2:, None] - bins) / (edges[2:] - edges[1:-1])[:, None]
+    return numpy.maximum(0, numpy.minimum(lower, upper))
+
+
+class SpectralFeatures(object):
+    '''Compute STFT or log-mel features from blocks of audio as they arrive.
+
+    Audio is fed in with process(), which returns the feature frames for every
+    analysis window that has been completed so far; samples belonging to
+    incomplete windows are held over until the next block arrives.
+    '''
+
+    def __init__(self, sample_rate, kind='logmel', n_fft=512, hop=256,
+                 n_mels=40, floor=1e-10):
+        '''Initialize a feature extractor.
+
+        sample_rate: Sample rate of the incoming audio, in Hz.
+        kind: 'logmel' for log mel-band energies, or 'stft' for log power
+          spectra.
+        n_fft: Length of the analysis window, in samples.
+        hop: Number of samples between successive windows.
+        n_mels: Number of mel bands, for 'logmel' features.
+        floor: Small value added to powers before taking the log.
+        '''
+        assert kind in ('logmel', 'stft'), 'unknown feature kind %r' % kind
+        self.kind = kind
+        self.n_fft = n_fft
+        self.hop = hop
+        self.floor = floor
+        self.window = numpy.hanning(n_fft)
+        self.filters = None
+        if kind == 'logmel':
+            self.filters = mel_filters(sample_rate, n_fft, n_mels)
+        self.reset()
+
+    @property
+    def size(self):
+        '''The number of values in each feature frame.'''
+        if self.filters is not None:
+            return len(self.filters)
+        return self.n_fft // 2 + 1
+
+    def reset(self):
+        '''Forget any audio held over from previous blocks.'''
+        self._pending = numpy.zeros(0, dtype=numpy.float64)
+
+    def process(self, block):
+        '''Add a block of audio and return the newly completed feature frames.
+        '''
+        audio = numpy.concatenate([self._pending, block])
+        count = max(0, 1 + (len(audio) - self.n_fft) // self.hop)
+        self._pending = audio[count * self.hop:]
+        if not count:
+            return numpy.zeros((0, self.size), dtype=numpy.float32)
+        strides = (audio.strides[0] * self.hop, audio.strides[0])
+        windows = numpy.lib.stride_tricks.as_strided(
+            audio, shape=(count, self.n_fft), strides=strides)
+        power = abs(numpy.fft.rfft(windows * self.window)) ** 2
+        if self.filters is not None:
+            power = numpy.dot(power, self.filters.T)
+        return numpy.log(power + self.floor).astype(numpy.float32)
+
+
+class ShardWriter(object):
+    '''Append variable-length arrays into a sequence of fixed-size .npy shards.
+
+    Shards are memory-mapped .npy files of shape (rows, ...) named like
+    "audio-00003.npy". An array is never split across shards: if it does not
+    fit into the space left in the current shard, a new shard is started.
+    '''
+
+    def __init__(self, root, name, rows, shape=(), dtype=numpy.float32,
+                 shard=0, offset=0):
+        '''Initialize a writer, optionally resuming at a shard and offset.'''
+        self.root = root
+        self.name = name
+        self.rows = rows
+        self.shape = tuple(shape)
+        self.dtype = numpy.dtype(dtype)
+        self.shard = shard
+        self.offset = offset
+        self._array = None
+
+    def _path(self, shard):
+        return os.path.join(self.root, '%s-%05d.npy' % (self.name, shard))
+
+    def _open(self):
+        path = self._path(self.shard)
+        if os.path.exists(path):
+            self._array = numpy.lib.format.open_memmap(path, mode='r+')
+        else:
+            self._array = numpy.lib.format.open_memmap(
+                path, mode='w+', dtype=self.dtype,
+                shape=(self.rows, ) + self.shape)
+
+    def write(self, data):
+        '''Append an array and return the (shard, offset, length) it went to.
+        '''
+        n = len(data)
+        if n > self.rows:
+            raise ValueError('%s: %d rows do not fit into shards of %d rows' %
+                             (self.name, n, self.rows))
+        if self.offset + n > self.rows:
+            self.close()
+            self.shard += 1
+            self.offset = 0
+        if self._array is None:
+            self._open()
+        self._array[self.offset:self.offset + n] = data
+        location = (self.shard, self.offset, n)
+        self.offset += n
+        return location
+
+    def flush(self):
+        '''Make sure everything written so far is on disk.'''
+        if self._array is not None:
+            self._array.flush()
+
+    def close(self):
+        '''Flush and unmap the current shard.'''
+        self.flush()
+        self._array = None
+
+
+def _parse_index_line(line):
+    fields = line.rstrip('\n').split('\t')
+    entry = dict(id=int(fields[0]), symbols=fields[1].split())
+    for i, name in enumerate(STREAMS):
+        entry[name] = tuple(int(x) for x in fields[2 + i].split(':'))
+    return entry
+
+
+def read_index(root):
+    '''Return a list of the utterances recorded in a dataset's index.'''
+    path = os.path.join(root, INDEX)
+    if not os.path.exists(path):
+        return []
+    entries = []
+    with open(path) as handle:
+        for line in handle:
+            # a partially written last line means the build was interrupted
+            # while recording that utterance, so it does not count.
+            if line.endswith('\n'):
+                entries.append(_parse_index_line(line))
+    return entries
+
+
+def _truncate_index(root):
+    '''Remove a partially written last line from a dataset's index.'''
+    path = os.path.join(root, INDEX)
+    if not os.path.exists(path):
+        return
+    with open(path, 'rb+') as handle:
+        data = handle.read()
+        if data and not data.endswith('\n'):
+            handle.truncate(data.rfind('\n') + 1)
+
+
+def read(root):
+    '''Iterate over (symbols, frames, audio, features) in a dataset.'''
+    shards = dict((name, (None, None)) for name in STREAMS)
+    for entry in read_index(root):
+        arrays = []
+        for name in STREAMS:
+            shard, offset, length = entry[name]
+            if shards[name][0] != shard:
+                shards[name] = (shard, numpy.load(
+                    os.path.join(root, '%s-%05d.npy' % (name, shard)),
+                    mmap_mode='r'))
+            arrays.append(shards[name][1][offset:offset + length])
+        yield [entry['symbols']] + arrays
+
+
+# per-process state for the pipeline workers.
+_worker = None
+
+
+def _initialize_worker(parameters, repertoire, babbler, phones, seed,
+                       features):
+    global _worker
+    ranges = [repertoire.parameters[name] for name in postures.PARAMETERS]
+    _worker = dict(
+        parameters=parameters,
+        repertoire=repertoire,
+        minimum=numpy.array([p.min for p in ranges]),
+        maximum=numpy.array([p.max for p in ranges]),
+        babbler=babbler,
+        phones=phones,
+        seed=seed,
+        features=features,
+        block=4096)
+
+
+def _process(index):
+    '''Babble, interpolate, synthesize and analyze a single utterance.'''
+    w = _worker
+    rng.seed(w['seed'] + index)
+    symbols = list(w['babbler'].generate(w['phones']))
+    frames = w['repertoire'].interpolate(
+        w['parameters'].control_rate_hz, symbols)
+    # the interpolating spline can overshoot wildly between postures, so keep
+    # the controls inside the ranges that the repertoire defines. the frication
+    # bandpass filter also becomes unstable for bandwidths approaching the
+    # nyquist frequency of the tube. the reference engine keeps filter memory
+    # in statics, so each utterance would depend on the ones rendered before
+    # it in the same worker; the fast engine does not.
+    model = tube.TubeModel(w['parameters'], engine='fast')
+    maximum = w['maximum'].copy()
+    maximum[postures.PARAMETERS.index('fricBW')] = 0.45 * model._model.sampleRate
+    frames = numpy.clip(frames, w['minimum'], maximum)
+    audio = numpy.asarray(
+        model.synthesize(frames, seed=w['seed'] + index), numpy.float32)
+    w['features'].reset()
+    features = [w['features'].process(audio[i:i + w['block']])
+                for i in range(0, len(audio), w['block'])]
+    return (index, symbols, numpy.asarray(frames, numpy.float32), audio,
+            numpy.concatenate(features))
+
+
+def build(root, count, parameters=None, babbler=babblers.Uniform, phones=7,
+          seed=0, processes=None, features=None, frame_rows=1 << 16,
+          audio_rows=1 << 22, feature_rows=1 << 16):
+    '''Build (or continue building) a dataset of babbled utterances.
+
+    root: Directory for the shards and the index file.
+    count: Total number of utterances the dataset should contain.
+    parameters: A tube.Parameters object used for synthesis.
+    babbler: A callable that takes a Repertoire and returns a Babbler, e.g. a
+      Babbler subclass. It is called once in this process, and the babbler
+      it returns is sent to the workers, so it must be picklable.
+    phones: Number of phones in each babbled utterance.
+    seed: Utterance i is babbled and synthesized with random seed (seed + i),
+      so a resumed build produces the same utterances as an uninterrupted one.
+    processes: Number of worker processes (defaults to the number of CPUs).
+    features: A SpectralFeatures object (defaults to 40 log-mel bands).
+    frame_rows, audio_rows, feature_rows: Capacity of each shard.
+
+    Returns the number of utterances in the dataset.
+    '''
+    parameters = parameters or tube.Parameters()
+    features = features or SpectralFeatures(parameters.sample_rate_hz)
+    processes = processes or multiprocessing.cpu_count()
+    # load the repertoire here rather than in the workers: a pool whose
+    # initializer raises keeps starting new workers, so build() would hang.
+    repertoire = postures.Repertoire()
+    babbler = babbler(repertoire)
+    if not os.path.isdir(root):
+        os.makedirs(root)
+
+    # resume after the last utterance that made it into the index.
+    entries = read_index(root)
+    start = len(entries)
+    last = entries[-1] if entries else None
+    writers = []
+    for name, rows, shape in (('frames', frame_rows, (len(postures.PARAMETERS), )),
+                              ('audio', audio_rows, ()),
+                              ('features', feature_rows, (features.size, ))):
+        shard, offset = 0, 0
+        if last:
+            shard, offset = last[name][0], last[name][1] + last[name][2]
+        writers.append(ShardWriter(root, name, rows, shape,
+                                   shard=shard, offset=offset))
+    if start:
+        logging.info('%s: resuming after %d utterances', root, start)
+
+    # new lines must not be appended onto an interrupted one.
+    _truncate_index(root)
+    index = open(os.path.join(root, INDEX), 'a')
+    pool = multiprocessing.Pool(
+        processes, _initialize_worker,
+        (parameters, repertoire, babbler, phones, seed, features))
+    try:
+        # keep a bounded number of utterances in flight at any time.
+        batch = 4 * processes
+        for begin in range(start, count, batch):
+            results = pool.imap(_process, range(begin, min(count, begin + batch)))
+            lines = []
+            for i, symbols, frames, audio, feats in results:
+                locations = [w.write(a) for w, a in
+                             zip(writers, (frames, audio, feats))]
+                lines.append('%d\t%s\t%s\n' % (i, ' '.join(symbols), '\t'.join(
+                    ':'.join(str(x) for x in loc) for loc in locations)))
+            # only record utterances once their data are safely on disk.
+            for w in writers:
+                w.flush()
+            index.writelines(lines)
+            index.flush()
+            os.fsync(index.fileno())
+            logging.info('%s: %d of %d utterances', root, begin + len(lines), count)
+    finally:
+        pool.terminate()
+        index.close()
+        for w in writers:
+            w.close()
+    return max(start, count)
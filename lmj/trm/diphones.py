@@ -0,0 +1,214 @@
+# Copyright (c) 2011 Leif Johnson <leif@leifjohnson.net>
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+'''Assemble control frames for phone strings from cached diphone blocks.
+
+Repertoire.interpolate() fits a spline through every posture of an utterance,
+so each call pays for the whole sequence even when the utterance is made of
+posture pairs that have been seen many times before. A DiphoneCache instead
+uses a different, local trajectory that breaks at posture boundaries: the
+block for the pair (A, B) holds posture A for its duration and then moves
+smoothly to the targets of B over B's transition time. Each block starts
+exactly on A's targets, so blocks for consecutive pairs join without a step,
+and the frames for an utterance are just the concatenation of its diphone
+blocks plus a final block holding the last posture. Since there is no spline,
+the frames do not match those from interpolate().
+
+Blocks are kept in memory in least-recently-used order up to a byte budget,
+and can also be written to a directory so that later processes start warm:
+
+    cache = DiphoneCache(repertoire, control_rate=250., path='/tmp/diphones')
+    frames = cache.frames('hh e l uu'.split())
+
+Because a block is computed once from posture.targets, the cache is meant for
+repertoires with fixed targets; a gaussian repertoire (see
+Repertoire.create_gaussian) would have a single random draw frozen into each
+block.
+'''
+
+import collections
+import hashlib
+import itertools
+import numpy
+import os
+import tempfile
+
+import postures
+
+
+def smoothstep(x):
+    '''Map 0..1 onto 0..1 with zero slope at both ends.'''
+    x = numpy.clip(x, 0., 1.)
+    return x * x * (3. - 2. * x)
+
+
+def transition_block(source, target, hold, transition, control_rate):
+    '''Compute the control frames that move from one posture to another.
+
+    source: Control values of the starting posture.
+    target: Control values of the next posture, or None to hold the source.
+    hold: Time to hold the source values, in milliseconds.
+    transition: Time to move to the target values, in milliseconds.
+    control_rate: Number of frames per second.
+
+    Returns a numpy array with one frame per control period in its rows. The
+    first frame is always the source posture, and the target posture itself is
+    not included: it begins the next block.
+    '''
+    source = numpy.asarray(source, numpy.float64)
+    span = hold
+    if target is not None:
+        span += transition
+    count = max(1, int(round(span * control_rate / 1000.)))
+    t = numpy.arange(count) * (1000. / control_rate)
+    if target is None or transition <= 0:
+        return numpy.tile(source, (count, 1))
+    x = smoothstep((t - hold) / transition)
+    target = numpy.asarray(target, numpy.float64)
+    return source + x[:, None] * (target - source)
+
+
+class DiphoneCache(object):
+    '''An LRU cache of diphone frame blocks for one repertoire.'''
+
+    def __init__(self, repertoire, control_rate=250., max_bytes=32 << 20,
+                 path=None):
+        '''Initialize a cache.
+
+        repertoire: The postures.Repertoire that provides the postures.
+        control_rate: Number of control frames per second.
+        max_bytes: Largest total size of the blocks held in memory.
+        path: If given, the name of a directory where blocks are also stored,
+          so they can be reused by other caches and processes.
+        '''
+        self.repertoire = repertoire
+        self.control_rate = float(control_rate)
+        self.max_bytes = max_bytes
+        self.path = path
+        if path and not os.path.isdir(path):
+            os.makedirs(path)
+        self.hits = self.misses = self.loads = 0
+        self.clear()
+
+    def __len__(self):
+        return len(self._blocks)
+
+    def __contains__(self, pair):
+        return self._key(*pair) in self._blocks
+
+    @property
+    def size(self):
+        '''The number of bytes of frame data held in memory.'''
+        return self._bytes
+
+    def clear(self):
+        '''Drop all blocks held in memory (stored blocks are kept).'''
+        self._blocks = collections.OrderedDict()
+        self._bytes = 0
+
+    def _key(self, a, b):
+        return (a, b, self.control_rate)
+
+    def _filename(self, a, b):
+        '''Name the stored block by everything that determines its frames.'''
+        pa = self.repertoire.postures[a]
+        description = [a, pa.targets, pa.duration, self.control_rate]
+        if b is not None:
+            pb = self.repertoire.postures[b]
+            description += [b, pb.targets, pb.transition]
+        digest = hashlib.sha1(repr(description)).hexdigest()
+        return os.path.join(self.path, digest + '.npy')
+
+    def _compute(self, a, b):
+        pa = self.repertoire.postures[a]
+        if b is None:
+            # the last block includes a frame at the end of the last posture.
+            block = transition_block(pa.targets, None, pa.duration, 0,
+                                     self.control_rate)
+            return numpy.vstack([block, block[-1:]])
+        pb = self.repertoire.postures[b]
+        return transition_block(pa.targets, pb.targets, pa.duration,
+                                pb.transition, self.control_rate)
+
+    def _load(self, a, b):
+        '''Get a block from disk, computing and storing it if needed.'''
+        if not self.path:
+            return self._compute(a, b)
+        filename = self._filename(a, b)
+        if os.path.exists(filename):
+            self.loads += 1
+            return numpy.load(filename)
+        block = self._compute(a, b)
+        # write to a temporary name first, so that a concurrent reader never
+        # sees a partial file.
+        handle, temporary = tempfile.mkstemp(suffix='.npy', dir=self.path)
+        with os.fdopen(handle, 'wb') as output:
+            numpy.save(output, block)
+        os.rename(temporary, filename)
+        return block
+
+    def _store(self, key, block):
+        if block.nbytes > self.max_bytes:
+            return
+        self._blocks[key] = block
+        self._bytes += block.nbytes
+        while self._bytes > self.max_bytes:
+            _, old = self._blocks.popitem(last=False)
+            self._bytes -= old.nbytes
+
+    def block(self, a, b=None):
+        '''Return the read-only frame block for the posture pair (a, b).
+
+        a: Symbol of the posture the block starts on.
+        b: Symbol of the following posture, or None for the final block of an
+          utterance, which just holds posture a.
+        '''
+        key = self._key(a, b)
+        block = self._blocks.pop(key, None)
+        if block is not None:
+            self.hits += 1
+            self._blocks[key] = block
+            return block
+        self.misses += 1
+        block = self._load(a, b)
+        block.flags.writeable = False
+        self._store(key, block)
+        return block
+
+    def blocks(self, *symbols):
+        '''Return the list of blocks for a sequence of posture symbols.'''
+        symbols = list(itertools.chain.from_iterable(symbols))
+        pairs = zip(symbols, symbols[1:] + [None])
+        return [self.block(a, b) for a, b in pairs]
+
+    def frames(self, *symbols):
+        '''Given a sequence of posture symbols, produces control frames.
+
+        Symbols are given as for Repertoire.interpolate, and the result has the
+        same layout: one frame per row, at this cache's control rate. The
+        trajectory itself is not the same, though: each transition is a
+        smoothstep ramp rather than a piece of one spline through every
+        posture, so the frames can differ a lot from those of interpolate().
+        They are not a cached copy of it.
+        '''
+        blocks = self.blocks(*symbols)
+        if not blocks:
+            return numpy.zeros((0, len(postures.PARAMETERS)))
+        return numpy.concatenate(blocks)
@@ -7,6 +7,10 @@
 %include "carrays.i"
 %array_functions(double, double_array);
 
+// lets python point C code at memory it allocated itself, e.g. numpy arrays.
+%include "cpointer.i"
+%pointer_cast(long, double *, double_array_from_address);
+
 %typemap(memberin) double [10][2][2] {
     memmove($1, $input, 10 * 2 * 2 * sizeof(double));
 }
@@ -20,6 +24,12 @@
     memmove($1.noseRadius, $input->noseRadius, TOTAL_NASAL_SECTIONS * sizeof(double));
 }
 
+// internal state of the fast engine, the limiter and the statistics, not meant to be touched
+// from Python.
+%ignore fastTract;
+%ignore limiter;
+%ignore statistics;
+
 %typemap(out) FILE * {
     $result = PyFile_FromFile($1, "__temp__", "r", NULL);
 }
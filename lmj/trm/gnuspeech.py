@@ -92,6 +92,10 @@ def double_array_setitem(*args):
   return _gnuspeech.double_array_setitem(*args)
 double_array_setitem = _gnuspeech.double_array_setitem
 
+def double_array_from_address(*args):
+  return _gnuspeech.double_array_from_address(*args)
+double_array_from_address = _gnuspeech.double_array_from_address
+
 def parseInputFile(*args):
   return _gnuspeech.parseInputFile(*args)
 parseInputFile = _gnuspeech.parseInputFile
@@ -260,6 +264,7 @@ class TRMInputParameters(object):
     throatVol = _swig_property(_gnuspeech.TRMInputParameters_throatVol_get, _gnuspeech.TRMInputParameters_throatVol_set)
     modulation = _swig_property(_gnuspeech.TRMInputParameters_modulation_get, _gnuspeech.TRMInputParameters_modulation_set)
     mixOffset = _swig_property(_gnuspeech.TRMInputParameters_mixOffset_get, _gnuspeech.TRMInputParameters_mixOffset_set)
+    noiseSeed = _swig_property(_gnuspeech.TRMInputParameters_noiseSeed_get, _gnuspeech.TRMInputParameters_noiseSeed_set)
     def __init__(self): 
         this = _gnuspeech.new_TRMInputParameters()
         try: self.this.append(this)
@@ -297,6 +302,11 @@ class TRMSampleRateConverter(object):
     maximumSampleValue = _swig_property(_gnuspeech.TRMSampleRateConverter_maximumSampleValue_get, _gnuspeech.TRMSampleRateConverter_maximumSampleValue_set)
     numberSamples = _swig_property(_gnuspeech.TRMSampleRateConverter_numberSamples_get, _gnuspeech.TRMSampleRateConverter_numberSamples_set)
     tempFilePtr = _swig_property(_gnuspeech.TRMSampleRateConverter_tempFilePtr_get, _gnuspeech.TRMSampleRateConverter_tempFilePtr_set)
+    outputBuffer = _swig_property(_gnuspeech.TRMSampleRateConverter_outputBuffer_get, _gnuspeech.TRMSampleRateConverter_outputBuffer_set)
+    outputBufferSize = _swig_property(_gnuspeech.TRMSampleRateConverter_outputBufferSize_get, _gnuspeech.TRMSampleRateConverter_outputBufferSize_set)
+    outputBufferCount = _swig_property(_gnuspeech.TRMSampleRateConverter_outputBufferCount_get, _gnuspeech.TRMSampleRateConverter_outputBufferCount_set)
+    outputAccumulate = _swig_property(_gnuspeech.TRMSampleRateConverter_outputAccumulate_get, _gnuspeech.TRMSampleRateConverter_outputAccumulate_set)
+    outputGain = _swig_property(_gnuspeech.TRMSampleRateConverter_outputGain_get, _gnuspeech.TRMSampleRateConverter_outputGain_set)
     def __init__(self): 
         this = _gnuspeech.new_TRMSampleRateConverter()
         try: self.this.append(this)
@@ -385,6 +395,12 @@ class TRMTubeModel(object):
     sampleRateConverter = _swig_property(_gnuspeech.TRMTubeModel_sampleRateConverter_get, _gnuspeech.TRMTubeModel_sampleRateConverter_set)
     ringBuffer = _swig_property(_gnuspeech.TRMTubeModel_ringBuffer_get, _gnuspeech.TRMTubeModel_ringBuffer_set)
     wavetable = _swig_property(_gnuspeech.TRMTubeModel_wavetable_get, _gnuspeech.TRMTubeModel_wavetable_set)
+    noiseState = _swig_property(_gnuspeech.TRMTubeModel_noiseState_get, _gnuspeech.TRMTubeModel_noiseState_set)
+    noiseX = _swig_property(_gnuspeech.TRMTubeModel_noiseX_get, _gnuspeech.TRMTubeModel_noiseX_set)
+    engine = _swig_property(_gnuspeech.TRMTubeModel_engine_get, _gnuspeech.TRMTubeModel_engine_set)
+    skipSilence = _swig_property(_gnuspeech.TRMTubeModel_skipSilence_get, _gnuspeech.TRMTubeModel_skipSilence_set)
+    silenceThreshold = _swig_property(_gnuspeech.TRMTubeModel_silenceThreshold_get, _gnuspeech.TRMTubeModel_silenceThreshold_set)
+    skippedSamples = _swig_property(_gnuspeech.TRMTubeModel_skippedSamples_get, _gnuspeech.TRMTubeModel_skippedSamples_set)
     current = _swig_property(_gnuspeech.TRMTubeModel_current_get)
     def __init__(self): 
         this = _gnuspeech.new_TRMTubeModel()
@@ -413,6 +429,17 @@ ERROR = _gnuspeech.ERROR
 SUCCESS = _gnuspeech.SUCCESS
 PULSE = _gnuspeech.PULSE
 SINE = _gnuspeech.SINE
+REFERENCE_ENGINE = _gnuspeech.REFERENCE_ENGINE
+FAST_ENGINE = _gnuspeech.FAST_ENGINE
+PARAMETER_STAGE = _gnuspeech.PARAMETER_STAGE
+GAIN_STAGE = _gnuspeech.GAIN_STAGE
+SOURCE_STAGE = _gnuspeech.SOURCE_STAGE
+NOISE_STAGE = _gnuspeech.NOISE_STAGE
+MIX_STAGE = _gnuspeech.MIX_STAGE
+TRACT_STAGE = _gnuspeech.TRACT_STAGE
+OUTPUT_STAGE = _gnuspeech.OUTPUT_STAGE
+TOTAL_STAGES = _gnuspeech.TOTAL_STAGES
+SILENCE_THRESHOLD = _gnuspeech.SILENCE_THRESHOLD
 PI = _gnuspeech.PI
 TWO_PI = _gnuspeech.TWO_PI
 
@@ -424,9 +451,61 @@ def TRMTubeModelFree(*args):
   return _gnuspeech.TRMTubeModelFree(*args)
 TRMTubeModelFree = _gnuspeech.TRMTubeModelFree
 
+def TRMTubeModelSeed(*args):
+  return _gnuspeech.TRMTubeModelSeed(*args)
+TRMTubeModelSeed = _gnuspeech.TRMTubeModelSeed
+
+def TRMTubeModelCopy(*args):
+  return _gnuspeech.TRMTubeModelCopy(*args)
+TRMTubeModelCopy = _gnuspeech.TRMTubeModelCopy
+
+def TRMTubeModelSetLimiter(*args):
+  return _gnuspeech.TRMTubeModelSetLimiter(*args)
+TRMTubeModelSetLimiter = _gnuspeech.TRMTubeModelSetLimiter
+
+def TRMTubeModelClearLimiter(*args):
+  return _gnuspeech.TRMTubeModelClearLimiter(*args)
+TRMTubeModelClearLimiter = _gnuspeech.TRMTubeModelClearLimiter
+
+def TRMTubeModelCollectStatistics(*args):
+  return _gnuspeech.TRMTubeModelCollectStatistics(*args)
+TRMTubeModelCollectStatistics = _gnuspeech.TRMTubeModelCollectStatistics
+
+def TRMTubeModelClearStatistics(*args):
+  return _gnuspeech.TRMTubeModelClearStatistics(*args)
+TRMTubeModelClearStatistics = _gnuspeech.TRMTubeModelClearStatistics
+
+def TRMTubeModelReadStatistics(*args):
+  return _gnuspeech.TRMTubeModelReadStatistics(*args)
+TRMTubeModelReadStatistics = _gnuspeech.TRMTubeModelReadStatistics
+
+def TRMTubeModelProfileStages(*args):
+  return _gnuspeech.TRMTubeModelProfileStages(*args)
+TRMTubeModelProfileStages = _gnuspeech.TRMTubeModelProfileStages
+
+def TRMTubeModelStageSeconds(*args):
+  return _gnuspeech.TRMTubeModelStageSeconds(*args)
+TRMTubeModelStageSeconds = _gnuspeech.TRMTubeModelStageSeconds
+
 def synthesize(*args):
   return _gnuspeech.synthesize(*args)
 synthesize = _gnuspeech.synthesize
 
+def synthesizeBlock(*args):
+  return _gnuspeech.synthesizeBlock(*args)
+synthesizeBlock = _gnuspeech.synthesizeBlock
+
+def finishSynthesis(*args):
+  return _gnuspeech.finishSynthesis(*args)
+finishSynthesis = _gnuspeech.finishSynthesis
+
+def synthesizeKeyframes(*args):
+  return _gnuspeech.synthesizeKeyframes(*args)
+synthesizeKeyframes = _gnuspeech.synthesizeKeyframes
+
+def seekSynthesis(*args):
+  return _gnuspeech.seekSynthesis(*args)
+seekSynthesis = _gnuspeech.seekSynthesis
+
 cvar = _gnuspeech.cvar
 
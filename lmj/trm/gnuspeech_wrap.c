@@ -2730,6 +2730,11 @@ static swig_module_info swig_module = {swig_types, 14, 0, 0, 0, 0};
   }
 
 
+double *double_array_from_address(long x) {
+   return (double *) x;
+}
+
+
 SWIGINTERN int
 SWIG_AsVal_double (PyObject *obj, double *val)
 {
@@ -3217,6 +3222,27 @@ fail:
 }
 
 
+SWIGINTERN PyObject *_wrap_double_array_from_address(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+  PyObject *resultobj = 0;
+  long arg1 ;
+  long val1 ;
+  int ecode1 = 0 ;
+  PyObject * obj0 = 0 ;
+  double *result = 0 ;
+  
+  if(!PyArg_UnpackTuple(args,(char *)"double_array_from_address",1,1,&obj0)) SWIG_fail;
+  ecode1 = SWIG_AsVal_long(obj0, &val1);
+  if (!SWIG_IsOK(ecode1)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode1), "in method '" "double_array_from_address" "', argument " "1"" of type '" "long""'");
+  } 
+  arg1 = (long)(val1);
+  result = (double *)double_array_from_address(arg1);
+  resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_double, 0 |  0 );
+  return resultobj;
+fail:
+  return NULL;
+}
+
 SWIGINTERN PyObject *_wrap_parseInputFile(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
   PyObject *resultobj = 0;
   char *arg1 = (char *) 0 ;
@@ -5609,6 +5635,57 @@ fail:
 }
 
 
+SWIGINTERN PyObject *_wrap_TRMInputParameters_noiseSeed_set(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+  PyObject *resultobj = 0;
+  TRMInputParameters *arg1 = (TRMInputParameters *) 0 ;
+  int arg2 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  int val2 ;
+  int ecode2 = 0 ;
+  PyObject * obj0 = 0 ;
+  PyObject * obj1 = 0 ;
+  
+  if(!PyArg_UnpackTuple(args,(char *)"TRMInputParameters_noiseSeed_set",2,2,&obj0,&obj1)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p__TRMInputParameters, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "TRMInputParameters_noiseSeed_set" "', argument " "1"" of type '" "TRMInputParameters *""'"); 
+  }
+  arg1 = (TRMInputParameters *)(argp1);
+  ecode2 = SWIG_AsVal_int(obj1, &val2);
+  if (!SWIG_IsOK(ecode2)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode2), "in method '" "TRMInputParameters_noiseSeed_set" "', argument " "2"" of type '" "int""'");
+  } 
+  arg2 = (int)(val2);
+  if (arg1) (arg1)->noiseSeed = arg2;
+  resultobj = SWIG_Py_Void();
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_TRMInputParameters_noiseSeed_get(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+  PyObject *resultobj = 0;
+  TRMInputParameters *arg1 = (TRMInputParameters *) 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  PyObject * obj0 = 0 ;
+  int result;
+  
+  if(!PyArg_UnpackTuple(args,(char *)"TRMInputParameters_noiseSeed_get",1,1,&obj0)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p__TRMInputParameters, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "TRMInputParameters_noiseSeed_get" "', argument " "1"" of type '" "TRMInputParameters *""'"); 
+  }
+  arg1 = (TRMInputParameters *)(argp1);
+  result = (int) ((arg1)->noiseSeed);
+  resultobj = SWIG_From_int((int)(result));
+  return resultobj;
+fail:
+  return NULL;
+}
+
 SWIGINTERN PyObject *_wrap_new_TRMInputParameters(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
   PyObject *resultobj = 0;
   TRMInputParameters *result = 0 ;
@@ -6386,70 +6463,80 @@ fail:
 }
 
 
-SWIGINTERN PyObject *_wrap_new_TRMSampleRateConverter(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+SWIGINTERN PyObject *_wrap_TRMSampleRateConverter_outputBuffer_set(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
   PyObject *resultobj = 0;
-  TRMSampleRateConverter *result = 0 ;
+  TRMSampleRateConverter *arg1 = (TRMSampleRateConverter *) 0 ;
+  double *arg2 = (double *) 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  void *argp2 = 0 ;
+  int res2 = 0 ;
+  PyObject * obj0 = 0 ;
+  PyObject * obj1 = 0 ;
   
-  if(!PyArg_UnpackTuple(args,(char *)"new_TRMSampleRateConverter",0,0)) SWIG_fail;
-  result = (TRMSampleRateConverter *)calloc(1, sizeof(TRMSampleRateConverter));
-  resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p__TRMSampleRateConverter, SWIG_POINTER_NEW |  0 );
+  if(!PyArg_UnpackTuple(args,(char *)"TRMSampleRateConverter_outputBuffer_set",2,2,&obj0,&obj1)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p__TRMSampleRateConverter, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "TRMSampleRateConverter_outputBuffer_set" "', argument " "1"" of type '" "TRMSampleRateConverter *""'"); 
+  }
+  arg1 = (TRMSampleRateConverter *)(argp1);
+  res2 = SWIG_ConvertPtr(obj1, &argp2,SWIGTYPE_p_double, SWIG_POINTER_DISOWN |  0 );
+  if (!SWIG_IsOK(res2)) {
+    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "TRMSampleRateConverter_outputBuffer_set" "', argument " "2"" of type '" "double *""'"); 
+  }
+  arg2 = (double *)(argp2);
+  if (arg1) (arg1)->outputBuffer = arg2;
+  resultobj = SWIG_Py_Void();
   return resultobj;
 fail:
   return NULL;
 }
 
 
-SWIGINTERN PyObject *_wrap_delete_TRMSampleRateConverter(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+SWIGINTERN PyObject *_wrap_TRMSampleRateConverter_outputBuffer_get(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
   PyObject *resultobj = 0;
   TRMSampleRateConverter *arg1 = (TRMSampleRateConverter *) 0 ;
   void *argp1 = 0 ;
   int res1 = 0 ;
   PyObject * obj0 = 0 ;
+  double *result = 0 ;
   
-  if(!PyArg_UnpackTuple(args,(char *)"delete_TRMSampleRateConverter",1,1,&obj0)) SWIG_fail;
-  res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p__TRMSampleRateConverter, SWIG_POINTER_DISOWN |  0 );
+  if(!PyArg_UnpackTuple(args,(char *)"TRMSampleRateConverter_outputBuffer_get",1,1,&obj0)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p__TRMSampleRateConverter, 0 |  0 );
   if (!SWIG_IsOK(res1)) {
-    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "delete_TRMSampleRateConverter" "', argument " "1"" of type '" "TRMSampleRateConverter *""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "TRMSampleRateConverter_outputBuffer_get" "', argument " "1"" of type '" "TRMSampleRateConverter *""'"); 
   }
   arg1 = (TRMSampleRateConverter *)(argp1);
-  free((char *) arg1);
-  resultobj = SWIG_Py_Void();
+  result = (double *) ((arg1)->outputBuffer);
+  resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_double, 0 |  0 );
   return resultobj;
 fail:
   return NULL;
 }
 
-
-SWIGINTERN PyObject *TRMSampleRateConverter_swigregister(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
-  PyObject *obj;
-  if (!PyArg_UnpackTuple(args,(char*)"swigregister", 1, 1,&obj)) return NULL;
-  SWIG_TypeNewClientData(SWIGTYPE_p__TRMSampleRateConverter, SWIG_NewClientData(obj));
-  return SWIG_Py_Void();
-}
-
-SWIGINTERN PyObject *_wrap_TRMTubeModel_controlPeriod_set(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+SWIGINTERN PyObject *_wrap_TRMSampleRateConverter_outputBufferSize_set(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
   PyObject *resultobj = 0;
-  TRMTubeModel *arg1 = (TRMTubeModel *) 0 ;
-  int arg2 ;
+  TRMSampleRateConverter *arg1 = (TRMSampleRateConverter *) 0 ;
+  long arg2 ;
   void *argp1 = 0 ;
   int res1 = 0 ;
-  int val2 ;
+  long val2 ;
   int ecode2 = 0 ;
   PyObject * obj0 = 0 ;
   PyObject * obj1 = 0 ;
   
-  if(!PyArg_UnpackTuple(args,(char *)"TRMTubeModel_controlPeriod_set",2,2,&obj0,&obj1)) SWIG_fail;
-  res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_TRMTubeModel, 0 |  0 );
+  if(!PyArg_UnpackTuple(args,(char *)"TRMSampleRateConverter_outputBufferSize_set",2,2,&obj0,&obj1)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p__TRMSampleRateConverter, 0 |  0 );
   if (!SWIG_IsOK(res1)) {
-    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "TRMTubeModel_controlPeriod_set" "', argument " "1"" of type '" "TRMTubeModel *""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "TRMSampleRateConverter_outputBufferSize_set" "', argument " "1"" of type '" "TRMSampleRateConverter *""'"); 
   }
-  arg1 = (TRMTubeModel *)(argp1);
-  ecode2 = SWIG_AsVal_int(obj1, &val2);
+  arg1 = (TRMSampleRateConverter *)(argp1);
+  ecode2 = SWIG_AsVal_long(obj1, &val2);
   if (!SWIG_IsOK(ecode2)) {
-    SWIG_exception_fail(SWIG_ArgError(ecode2), "in method '" "TRMTubeModel_controlPeriod_set" "', argument " "2"" of type '" "int""'");
+    SWIG_exception_fail(SWIG_ArgError(ecode2), "in method '" "TRMSampleRateConverter_outputBufferSize_set" "', argument " "2"" of type '" "long""'");
   } 
-  arg2 = (int)(val2);
-  if (arg1) (arg1)->controlPeriod = arg2;
+  arg2 = (long)(val2);
+  if (arg1) (arg1)->outputBufferSize = arg2;
   resultobj = SWIG_Py_Void();
   return resultobj;
 fail:
@@ -6457,51 +6544,50 @@ fail:
 }
 
 
-SWIGINTERN PyObject *_wrap_TRMTubeModel_controlPeriod_get(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+SWIGINTERN PyObject *_wrap_TRMSampleRateConverter_outputBufferSize_get(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
   PyObject *resultobj = 0;
-  TRMTubeModel *arg1 = (TRMTubeModel *) 0 ;
+  TRMSampleRateConverter *arg1 = (TRMSampleRateConverter *) 0 ;
   void *argp1 = 0 ;
   int res1 = 0 ;
   PyObject * obj0 = 0 ;
-  int result;
+  long result;
   
-  if(!PyArg_UnpackTuple(args,(char *)"TRMTubeModel_controlPeriod_get",1,1,&obj0)) SWIG_fail;
-  res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_TRMTubeModel, 0 |  0 );
+  if(!PyArg_UnpackTuple(args,(char *)"TRMSampleRateConverter_outputBufferSize_get",1,1,&obj0)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p__TRMSampleRateConverter, 0 |  0 );
   if (!SWIG_IsOK(res1)) {
-    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "TRMTubeModel_controlPeriod_get" "', argument " "1"" of type '" "TRMTubeModel *""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "TRMSampleRateConverter_outputBufferSize_get" "', argument " "1"" of type '" "TRMSampleRateConverter *""'"); 
   }
-  arg1 = (TRMTubeModel *)(argp1);
-  result = (int) ((arg1)->controlPeriod);
-  resultobj = SWIG_From_int((int)(result));
+  arg1 = (TRMSampleRateConverter *)(argp1);
+  result = (long) ((arg1)->outputBufferSize);
+  resultobj = SWIG_From_long((long)(result));
   return resultobj;
 fail:
   return NULL;
 }
 
-
-SWIGINTERN PyObject *_wrap_TRMTubeModel_sampleRate_set(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+SWIGINTERN PyObject *_wrap_TRMSampleRateConverter_outputBufferCount_set(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
   PyObject *resultobj = 0;
-  TRMTubeModel *arg1 = (TRMTubeModel *) 0 ;
-  int arg2 ;
+  TRMSampleRateConverter *arg1 = (TRMSampleRateConverter *) 0 ;
+  long arg2 ;
   void *argp1 = 0 ;
   int res1 = 0 ;
-  int val2 ;
+  long val2 ;
   int ecode2 = 0 ;
   PyObject * obj0 = 0 ;
   PyObject * obj1 = 0 ;
   
-  if(!PyArg_UnpackTuple(args,(char *)"TRMTubeModel_sampleRate_set",2,2,&obj0,&obj1)) SWIG_fail;
-  res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_TRMTubeModel, 0 |  0 );
+  if(!PyArg_UnpackTuple(args,(char *)"TRMSampleRateConverter_outputBufferCount_set",2,2,&obj0,&obj1)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p__TRMSampleRateConverter, 0 |  0 );
   if (!SWIG_IsOK(res1)) {
-    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "TRMTubeModel_sampleRate_set" "', argument " "1"" of type '" "TRMTubeModel *""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "TRMSampleRateConverter_outputBufferCount_set" "', argument " "1"" of type '" "TRMSampleRateConverter *""'"); 
   }
-  arg1 = (TRMTubeModel *)(argp1);
-  ecode2 = SWIG_AsVal_int(obj1, &val2);
+  arg1 = (TRMSampleRateConverter *)(argp1);
+  ecode2 = SWIG_AsVal_long(obj1, &val2);
   if (!SWIG_IsOK(ecode2)) {
-    SWIG_exception_fail(SWIG_ArgError(ecode2), "in method '" "TRMTubeModel_sampleRate_set" "', argument " "2"" of type '" "int""'");
+    SWIG_exception_fail(SWIG_ArgError(ecode2), "in method '" "TRMSampleRateConverter_outputBufferCount_set" "', argument " "2"" of type '" "long""'");
   } 
-  arg2 = (int)(val2);
-  if (arg1) (arg1)->sampleRate = arg2;
+  arg2 = (long)(val2);
+  if (arg1) (arg1)->outputBufferCount = arg2;
   resultobj = SWIG_Py_Void();
   return resultobj;
 fail:
@@ -6509,51 +6595,50 @@ fail:
 }
 
 
-SWIGINTERN PyObject *_wrap_TRMTubeModel_sampleRate_get(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+SWIGINTERN PyObject *_wrap_TRMSampleRateConverter_outputBufferCount_get(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
   PyObject *resultobj = 0;
-  TRMTubeModel *arg1 = (TRMTubeModel *) 0 ;
+  TRMSampleRateConverter *arg1 = (TRMSampleRateConverter *) 0 ;
   void *argp1 = 0 ;
   int res1 = 0 ;
   PyObject * obj0 = 0 ;
-  int result;
+  long result;
   
-  if(!PyArg_UnpackTuple(args,(char *)"TRMTubeModel_sampleRate_get",1,1,&obj0)) SWIG_fail;
-  res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_TRMTubeModel, 0 |  0 );
+  if(!PyArg_UnpackTuple(args,(char *)"TRMSampleRateConverter_outputBufferCount_get",1,1,&obj0)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p__TRMSampleRateConverter, 0 |  0 );
   if (!SWIG_IsOK(res1)) {
-    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "TRMTubeModel_sampleRate_get" "', argument " "1"" of type '" "TRMTubeModel *""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "TRMSampleRateConverter_outputBufferCount_get" "', argument " "1"" of type '" "TRMSampleRateConverter *""'"); 
   }
-  arg1 = (TRMTubeModel *)(argp1);
-  result = (int) ((arg1)->sampleRate);
-  resultobj = SWIG_From_int((int)(result));
+  arg1 = (TRMSampleRateConverter *)(argp1);
+  result = (long) ((arg1)->outputBufferCount);
+  resultobj = SWIG_From_long((long)(result));
   return resultobj;
 fail:
   return NULL;
 }
 
-
-SWIGINTERN PyObject *_wrap_TRMTubeModel_actualTubeLength_set(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+SWIGINTERN PyObject *_wrap_TRMSampleRateConverter_outputAccumulate_set(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
   PyObject *resultobj = 0;
-  TRMTubeModel *arg1 = (TRMTubeModel *) 0 ;
-  double arg2 ;
+  TRMSampleRateConverter *arg1 = (TRMSampleRateConverter *) 0 ;
+  int arg2 ;
   void *argp1 = 0 ;
   int res1 = 0 ;
-  double val2 ;
+  int val2 ;
   int ecode2 = 0 ;
   PyObject * obj0 = 0 ;
   PyObject * obj1 = 0 ;
   
-  if(!PyArg_UnpackTuple(args,(char *)"TRMTubeModel_actualTubeLength_set",2,2,&obj0,&obj1)) SWIG_fail;
-  res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_TRMTubeModel, 0 |  0 );
+  if(!PyArg_UnpackTuple(args,(char *)"TRMSampleRateConverter_outputAccumulate_set",2,2,&obj0,&obj1)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p__TRMSampleRateConverter, 0 |  0 );
   if (!SWIG_IsOK(res1)) {
-    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "TRMTubeModel_actualTubeLength_set" "', argument " "1"" of type '" "TRMTubeModel *""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "TRMSampleRateConverter_outputAccumulate_set" "', argument " "1"" of type '" "TRMSampleRateConverter *""'"); 
   }
-  arg1 = (TRMTubeModel *)(argp1);
-  ecode2 = SWIG_AsVal_double(obj1, &val2);
+  arg1 = (TRMSampleRateConverter *)(argp1);
+  ecode2 = SWIG_AsVal_int(obj1, &val2);
   if (!SWIG_IsOK(ecode2)) {
-    SWIG_exception_fail(SWIG_ArgError(ecode2), "in method '" "TRMTubeModel_actualTubeLength_set" "', argument " "2"" of type '" "double""'");
+    SWIG_exception_fail(SWIG_ArgError(ecode2), "in method '" "TRMSampleRateConverter_outputAccumulate_set" "', argument " "2"" of type '" "int""'");
   } 
-  arg2 = (double)(val2);
-  if (arg1) (arg1)->actualTubeLength = arg2;
+  arg2 = (int)(val2);
+  if (arg1) (arg1)->outputAccumulate = arg2;
   resultobj = SWIG_Py_Void();
   return resultobj;
 fail:
@@ -6561,31 +6646,30 @@ fail:
 }
 
 
-SWIGINTERN PyObject *_wrap_TRMTubeModel_actualTubeLength_get(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+SWIGINTERN PyObject *_wrap_TRMSampleRateConverter_outputAccumulate_get(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
   PyObject *resultobj = 0;
-  TRMTubeModel *arg1 = (TRMTubeModel *) 0 ;
+  TRMSampleRateConverter *arg1 = (TRMSampleRateConverter *) 0 ;
   void *argp1 = 0 ;
   int res1 = 0 ;
   PyObject * obj0 = 0 ;
-  double result;
+  int result;
   
-  if(!PyArg_UnpackTuple(args,(char *)"TRMTubeModel_actualTubeLength_get",1,1,&obj0)) SWIG_fail;
-  res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_TRMTubeModel, 0 |  0 );
+  if(!PyArg_UnpackTuple(args,(char *)"TRMSampleRateConverter_outputAccumulate_get",1,1,&obj0)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p__TRMSampleRateConverter, 0 |  0 );
   if (!SWIG_IsOK(res1)) {
-    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "TRMTubeModel_actualTubeLength_get" "', argument " "1"" of type '" "TRMTubeModel *""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "TRMSampleRateConverter_outputAccumulate_get" "', argument " "1"" of type '" "TRMSampleRateConverter *""'"); 
   }
-  arg1 = (TRMTubeModel *)(argp1);
-  result = (double) ((arg1)->actualTubeLength);
-  resultobj = SWIG_From_double((double)(result));
+  arg1 = (TRMSampleRateConverter *)(argp1);
+  result = (int) ((arg1)->outputAccumulate);
+  resultobj = SWIG_From_int((int)(result));
   return resultobj;
 fail:
   return NULL;
 }
 
-
-SWIGINTERN PyObject *_wrap_TRMTubeModel_dampingFactor_set(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+SWIGINTERN PyObject *_wrap_TRMSampleRateConverter_outputGain_set(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
   PyObject *resultobj = 0;
-  TRMTubeModel *arg1 = (TRMTubeModel *) 0 ;
+  TRMSampleRateConverter *arg1 = (TRMSampleRateConverter *) 0 ;
   double arg2 ;
   void *argp1 = 0 ;
   int res1 = 0 ;
@@ -6594,18 +6678,18 @@ SWIGINTERN PyObject *_wrap_TRMTubeModel_dampingFactor_set(PyObject *SWIGUNUSEDPA
   PyObject * obj0 = 0 ;
   PyObject * obj1 = 0 ;
   
-  if(!PyArg_UnpackTuple(args,(char *)"TRMTubeModel_dampingFactor_set",2,2,&obj0,&obj1)) SWIG_fail;
-  res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_TRMTubeModel, 0 |  0 );
+  if(!PyArg_UnpackTuple(args,(char *)"TRMSampleRateConverter_outputGain_set",2,2,&obj0,&obj1)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p__TRMSampleRateConverter, 0 |  0 );
   if (!SWIG_IsOK(res1)) {
-    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "TRMTubeModel_dampingFactor_set" "', argument " "1"" of type '" "TRMTubeModel *""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "TRMSampleRateConverter_outputGain_set" "', argument " "1"" of type '" "TRMSampleRateConverter *""'"); 
   }
-  arg1 = (TRMTubeModel *)(argp1);
+  arg1 = (TRMSampleRateConverter *)(argp1);
   ecode2 = SWIG_AsVal_double(obj1, &val2);
   if (!SWIG_IsOK(ecode2)) {
-    SWIG_exception_fail(SWIG_ArgError(ecode2), "in method '" "TRMTubeModel_dampingFactor_set" "', argument " "2"" of type '" "double""'");
+    SWIG_exception_fail(SWIG_ArgError(ecode2), "in method '" "TRMSampleRateConverter_outputGain_set" "', argument " "2"" of type '" "double""'");
   } 
   arg2 = (double)(val2);
-  if (arg1) (arg1)->dampingFactor = arg2;
+  if (arg1) (arg1)->outputGain = arg2;
   resultobj = SWIG_Py_Void();
   return resultobj;
 fail:
@@ -6613,51 +6697,54 @@ fail:
 }
 
 
-SWIGINTERN PyObject *_wrap_TRMTubeModel_dampingFactor_get(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+SWIGINTERN PyObject *_wrap_TRMSampleRateConverter_outputGain_get(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
   PyObject *resultobj = 0;
-  TRMTubeModel *arg1 = (TRMTubeModel *) 0 ;
+  TRMSampleRateConverter *arg1 = (TRMSampleRateConverter *) 0 ;
   void *argp1 = 0 ;
   int res1 = 0 ;
   PyObject * obj0 = 0 ;
   double result;
   
-  if(!PyArg_UnpackTuple(args,(char *)"TRMTubeModel_dampingFactor_get",1,1,&obj0)) SWIG_fail;
-  res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_TRMTubeModel, 0 |  0 );
+  if(!PyArg_UnpackTuple(args,(char *)"TRMSampleRateConverter_outputGain_get",1,1,&obj0)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p__TRMSampleRateConverter, 0 |  0 );
   if (!SWIG_IsOK(res1)) {
-    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "TRMTubeModel_dampingFactor_get" "', argument " "1"" of type '" "TRMTubeModel *""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "TRMSampleRateConverter_outputGain_get" "', argument " "1"" of type '" "TRMSampleRateConverter *""'"); 
   }
-  arg1 = (TRMTubeModel *)(argp1);
-  result = (double) ((arg1)->dampingFactor);
+  arg1 = (TRMSampleRateConverter *)(argp1);
+  result = (double) ((arg1)->outputGain);
   resultobj = SWIG_From_double((double)(result));
   return resultobj;
 fail:
   return NULL;
 }
 
+SWIGINTERN PyObject *_wrap_new_TRMSampleRateConverter(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+  PyObject *resultobj = 0;
+  TRMSampleRateConverter *result = 0 ;
+  
+  if(!PyArg_UnpackTuple(args,(char *)"new_TRMSampleRateConverter",0,0)) SWIG_fail;
+  result = (TRMSampleRateConverter *)calloc(1, sizeof(TRMSampleRateConverter));
+  resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p__TRMSampleRateConverter, SWIG_POINTER_NEW |  0 );
+  return resultobj;
+fail:
+  return NULL;
+}
+
 
-SWIGINTERN PyObject *_wrap_TRMTubeModel_crossmixFactor_set(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+SWIGINTERN PyObject *_wrap_delete_TRMSampleRateConverter(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
   PyObject *resultobj = 0;
-  TRMTubeModel *arg1 = (TRMTubeModel *) 0 ;
-  double arg2 ;
+  TRMSampleRateConverter *arg1 = (TRMSampleRateConverter *) 0 ;
   void *argp1 = 0 ;
   int res1 = 0 ;
-  double val2 ;
-  int ecode2 = 0 ;
   PyObject * obj0 = 0 ;
-  PyObject * obj1 = 0 ;
   
-  if(!PyArg_UnpackTuple(args,(char *)"TRMTubeModel_crossmixFactor_set",2,2,&obj0,&obj1)) SWIG_fail;
-  res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_TRMTubeModel, 0 |  0 );
+  if(!PyArg_UnpackTuple(args,(char *)"delete_TRMSampleRateConverter",1,1,&obj0)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p__TRMSampleRateConverter, SWIG_POINTER_DISOWN |  0 );
   if (!SWIG_IsOK(res1)) {
-    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "TRMTubeModel_crossmixFactor_set" "', argument " "1"" of type '" "TRMTubeModel *""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "delete_TRMSampleRateConverter" "', argument " "1"" of type '" "TRMSampleRateConverter *""'"); 
   }
-  arg1 = (TRMTubeModel *)(argp1);
-  ecode2 = SWIG_AsVal_double(obj1, &val2);
-  if (!SWIG_IsOK(ecode2)) {
-    SWIG_exception_fail(SWIG_ArgError(ecode2), "in method '" "TRMTubeModel_crossmixFactor_set" "', argument " "2"" of type '" "double""'");
-  } 
-  arg2 = (double)(val2);
-  if (arg1) (arg1)->crossmixFactor = arg2;
+  arg1 = (TRMSampleRateConverter *)(argp1);
+  free((char *) arg1);
   resultobj = SWIG_Py_Void();
   return resultobj;
 fail:
@@ -6665,9 +6752,254 @@ fail:
 }
 
 
-SWIGINTERN PyObject *_wrap_TRMTubeModel_crossmixFactor_get(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
-  PyObject *resultobj = 0;
-  TRMTubeModel *arg1 = (TRMTubeModel *) 0 ;
+SWIGINTERN PyObject *TRMSampleRateConverter_swigregister(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+  PyObject *obj;
+  if (!PyArg_UnpackTuple(args,(char*)"swigregister", 1, 1,&obj)) return NULL;
+  SWIG_TypeNewClientData(SWIGTYPE_p__TRMSampleRateConverter, SWIG_NewClientData(obj));
+  return SWIG_Py_Void();
+}
+
+SWIGINTERN PyObject *_wrap_TRMTubeModel_controlPeriod_set(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+  PyObject *resultobj = 0;
+  TRMTubeModel *arg1 = (TRMTubeModel *) 0 ;
+  int arg2 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  int val2 ;
+  int ecode2 = 0 ;
+  PyObject * obj0 = 0 ;
+  PyObject * obj1 = 0 ;
+  
+  if(!PyArg_UnpackTuple(args,(char *)"TRMTubeModel_controlPeriod_set",2,2,&obj0,&obj1)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_TRMTubeModel, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "TRMTubeModel_controlPeriod_set" "', argument " "1"" of type '" "TRMTubeModel *""'"); 
+  }
+  arg1 = (TRMTubeModel *)(argp1);
+  ecode2 = SWIG_AsVal_int(obj1, &val2);
+  if (!SWIG_IsOK(ecode2)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode2), "in method '" "TRMTubeModel_controlPeriod_set" "', argument " "2"" of type '" "int""'");
+  } 
+  arg2 = (int)(val2);
+  if (arg1) (arg1)->controlPeriod = arg2;
+  resultobj = SWIG_Py_Void();
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_TRMTubeModel_controlPeriod_get(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+  PyObject *resultobj = 0;
+  TRMTubeModel *arg1 = (TRMTubeModel *) 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  PyObject * obj0 = 0 ;
+  int result;
+  
+  if(!PyArg_UnpackTuple(args,(char *)"TRMTubeModel_controlPeriod_get",1,1,&obj0)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_TRMTubeModel, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "TRMTubeModel_controlPeriod_get" "', argument " "1"" of type '" "TRMTubeModel *""'"); 
+  }
+  arg1 = (TRMTubeModel *)(argp1);
+  result = (int) ((arg1)->controlPeriod);
+  resultobj = SWIG_From_int((int)(result));
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_TRMTubeModel_sampleRate_set(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+  PyObject *resultobj = 0;
+  TRMTubeModel *arg1 = (TRMTubeModel *) 0 ;
+  int arg2 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  int val2 ;
+  int ecode2 = 0 ;
+  PyObject * obj0 = 0 ;
+  PyObject * obj1 = 0 ;
+  
+  if(!PyArg_UnpackTuple(args,(char *)"TRMTubeModel_sampleRate_set",2,2,&obj0,&obj1)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_TRMTubeModel, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "TRMTubeModel_sampleRate_set" "', argument " "1"" of type '" "TRMTubeModel *""'"); 
+  }
+  arg1 = (TRMTubeModel *)(argp1);
+  ecode2 = SWIG_AsVal_int(obj1, &val2);
+  if (!SWIG_IsOK(ecode2)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode2), "in method '" "TRMTubeModel_sampleRate_set" "', argument " "2"" of type '" "int""'");
+  } 
+  arg2 = (int)(val2);
+  if (arg1) (arg1)->sampleRate = arg2;
+  resultobj = SWIG_Py_Void();
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_TRMTubeModel_sampleRate_get(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+  PyObject *resultobj = 0;
+  TRMTubeModel *arg1 = (TRMTubeModel *) 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  PyObject * obj0 = 0 ;
+  int result;
+  
+  if(!PyArg_UnpackTuple(args,(char *)"TRMTubeModel_sampleRate_get",1,1,&obj0)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_TRMTubeModel, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "TRMTubeModel_sampleRate_get" "', argument " "1"" of type '" "TRMTubeModel *""'"); 
+  }
+  arg1 = (TRMTubeModel *)(argp1);
+  result = (int) ((arg1)->sampleRate);
+  resultobj = SWIG_From_int((int)(result));
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_TRMTubeModel_actualTubeLength_set(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+  PyObject *resultobj = 0;
+  TRMTubeModel *arg1 = (TRMTubeModel *) 0 ;
+  double arg2 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  double val2 ;
+  int ecode2 = 0 ;
+  PyObject * obj0 = 0 ;
+  PyObject * obj1 = 0 ;
+  
+  if(!PyArg_UnpackTuple(args,(char *)"TRMTubeModel_actualTubeLength_set",2,2,&obj0,&obj1)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_TRMTubeModel, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "TRMTubeModel_actualTubeLength_set" "', argument " "1"" of type '" "TRMTubeModel *""'"); 
+  }
+  arg1 = (TRMTubeModel *)(argp1);
+  ecode2 = SWIG_AsVal_double(obj1, &val2);
+  if (!SWIG_IsOK(ecode2)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode2), "in method '" "TRMTubeModel_actualTubeLength_set" "', argument " "2"" of type '" "double""'");
+  } 
+  arg2 = (double)(val2);
+  if (arg1) (arg1)->actualTubeLength = arg2;
+  resultobj = SWIG_Py_Void();
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_TRMTubeModel_actualTubeLength_get(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+  PyObject *resultobj = 0;
+  TRMTubeModel *arg1 = (TRMTubeModel *) 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  PyObject * obj0 = 0 ;
+  double result;
+  
+  if(!PyArg_UnpackTuple(args,(char *)"TRMTubeModel_actualTubeLength_get",1,1,&obj0)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_TRMTubeModel, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "TRMTubeModel_actualTubeLength_get" "', argument " "1"" of type '" "TRMTubeModel *""'"); 
+  }
+  arg1 = (TRMTubeModel *)(argp1);
+  result = (double) ((arg1)->actualTubeLength);
+  resultobj = SWIG_From_double((double)(result));
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_TRMTubeModel_dampingFactor_set(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+  PyObject *resultobj = 0;
+  TRMTubeModel *arg1 = (TRMTubeModel *) 0 ;
+  double arg2 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  double val2 ;
+  int ecode2 = 0 ;
+  PyObject * obj0 = 0 ;
+  PyObject * obj1 = 0 ;
+  
+  if(!PyArg_UnpackTuple(args,(char *)"TRMTubeModel_dampingFactor_set",2,2,&obj0,&obj1)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_TRMTubeModel, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "TRMTubeModel_dampingFactor_set" "', argument " "1"" of type '" "TRMTubeModel *""'"); 
+  }
+  arg1 = (TRMTubeModel *)(argp1);
+  ecode2 = SWIG_AsVal_double(obj1, &val2);
+  if (!SWIG_IsOK(ecode2)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode2), "in method '" "TRMTubeModel_dampingFactor_set" "', argument " "2"" of type '" "double""'");
+  } 
+  arg2 = (double)(val2);
+  if (arg1) (arg1)->dampingFactor = arg2;
+  resultobj = SWIG_Py_Void();
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_TRMTubeModel_dampingFactor_get(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+  PyObject *resultobj = 0;
+  TRMTubeModel *arg1 = (TRMTubeModel *) 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  PyObject * obj0 = 0 ;
+  double result;
+  
+  if(!PyArg_UnpackTuple(args,(char *)"TRMTubeModel_dampingFactor_get",1,1,&obj0)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_TRMTubeModel, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "TRMTubeModel_dampingFactor_get" "', argument " "1"" of type '" "TRMTubeModel *""'"); 
+  }
+  arg1 = (TRMTubeModel *)(argp1);
+  result = (double) ((arg1)->dampingFactor);
+  resultobj = SWIG_From_double((double)(result));
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_TRMTubeModel_crossmixFactor_set(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+  PyObject *resultobj = 0;
+  TRMTubeModel *arg1 = (TRMTubeModel *) 0 ;
+  double arg2 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  double val2 ;
+  int ecode2 = 0 ;
+  PyObject * obj0 = 0 ;
+  PyObject * obj1 = 0 ;
+  
+  if(!PyArg_UnpackTuple(args,(char *)"TRMTubeModel_crossmixFactor_set",2,2,&obj0,&obj1)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_TRMTubeModel, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "TRMTubeModel_crossmixFactor_set" "', argument " "1"" of type '" "TRMTubeModel *""'"); 
+  }
+  arg1 = (TRMTubeModel *)(argp1);
+  ecode2 = SWIG_AsVal_double(obj1, &val2);
+  if (!SWIG_IsOK(ecode2)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode2), "in method '" "TRMTubeModel_crossmixFactor_set" "', argument " "2"" of type '" "double""'");
+  } 
+  arg2 = (double)(val2);
+  if (arg1) (arg1)->crossmixFactor = arg2;
+  resultobj = SWIG_Py_Void();
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_TRMTubeModel_crossmixFactor_get(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+  PyObject *resultobj = 0;
+  TRMTubeModel *arg1 = (TRMTubeModel *) 0 ;
   void *argp1 = 0 ;
   int res1 = 0 ;
   PyObject * obj0 = 0 ;
@@ -8175,18 +8507,324 @@ fail:
 }
 
 
-SWIGINTERN PyObject *_wrap_TRMTubeModel_current_get(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+SWIGINTERN PyObject *_wrap_TRMTubeModel_noiseState_set(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
   PyObject *resultobj = 0;
   TRMTubeModel *arg1 = (TRMTubeModel *) 0 ;
+  double arg2 ;
   void *argp1 = 0 ;
   int res1 = 0 ;
+  double val2 ;
+  int ecode2 = 0 ;
   PyObject * obj0 = 0 ;
-  TRMTubeModel_current *result = 0 ;
+  PyObject * obj1 = 0 ;
   
-  if(!PyArg_UnpackTuple(args,(char *)"TRMTubeModel_current_get",1,1,&obj0)) SWIG_fail;
+  if(!PyArg_UnpackTuple(args,(char *)"TRMTubeModel_noiseState_set",2,2,&obj0,&obj1)) SWIG_fail;
   res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_TRMTubeModel, 0 |  0 );
   if (!SWIG_IsOK(res1)) {
-    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "TRMTubeModel_current_get" "', argument " "1"" of type '" "TRMTubeModel *""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "TRMTubeModel_noiseState_set" "', argument " "1"" of type '" "TRMTubeModel *""'"); 
+  }
+  arg1 = (TRMTubeModel *)(argp1);
+  ecode2 = SWIG_AsVal_double(obj1, &val2);
+  if (!SWIG_IsOK(ecode2)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode2), "in method '" "TRMTubeModel_noiseState_set" "', argument " "2"" of type '" "double""'");
+  } 
+  arg2 = (double)(val2);
+  if (arg1) (arg1)->noiseState = arg2;
+  resultobj = SWIG_Py_Void();
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_TRMTubeModel_noiseState_get(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+  PyObject *resultobj = 0;
+  TRMTubeModel *arg1 = (TRMTubeModel *) 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  PyObject * obj0 = 0 ;
+  double result;
+  
+  if(!PyArg_UnpackTuple(args,(char *)"TRMTubeModel_noiseState_get",1,1,&obj0)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_TRMTubeModel, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "TRMTubeModel_noiseState_get" "', argument " "1"" of type '" "TRMTubeModel *""'"); 
+  }
+  arg1 = (TRMTubeModel *)(argp1);
+  result = (double) ((arg1)->noiseState);
+  resultobj = SWIG_From_double((double)(result));
+  return resultobj;
+fail:
+  return NULL;
+}
+
+SWIGINTERN PyObject *_wrap_TRMTubeModel_noiseX_set(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+  PyObject *resultobj = 0;
+  TRMTubeModel *arg1 = (TRMTubeModel *) 0 ;
+  double arg2 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  double val2 ;
+  int ecode2 = 0 ;
+  PyObject * obj0 = 0 ;
+  PyObject * obj1 = 0 ;
+  
+  if(!PyArg_UnpackTuple(args,(char *)"TRMTubeModel_noiseX_set",2,2,&obj0,&obj1)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_TRMTubeModel, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "TRMTubeModel_noiseX_set" "', argument " "1"" of type '" "TRMTubeModel *""'"); 
+  }
+  arg1 = (TRMTubeModel *)(argp1);
+  ecode2 = SWIG_AsVal_double(obj1, &val2);
+  if (!SWIG_IsOK(ecode2)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode2), "in method '" "TRMTubeModel_noiseX_set" "', argument " "2"" of type '" "double""'");
+  } 
+  arg2 = (double)(val2);
+  if (arg1) (arg1)->noiseX = arg2;
+  resultobj = SWIG_Py_Void();
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_TRMTubeModel_noiseX_get(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+  PyObject *resultobj = 0;
+  TRMTubeModel *arg1 = (TRMTubeModel *) 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  PyObject * obj0 = 0 ;
+  double result;
+  
+  if(!PyArg_UnpackTuple(args,(char *)"TRMTubeModel_noiseX_get",1,1,&obj0)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_TRMTubeModel, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "TRMTubeModel_noiseX_get" "', argument " "1"" of type '" "TRMTubeModel *""'"); 
+  }
+  arg1 = (TRMTubeModel *)(argp1);
+  result = (double) ((arg1)->noiseX);
+  resultobj = SWIG_From_double((double)(result));
+  return resultobj;
+fail:
+  return NULL;
+}
+
+SWIGINTERN PyObject *_wrap_TRMTubeModel_engine_set(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+  PyObject *resultobj = 0;
+  TRMTubeModel *arg1 = (TRMTubeModel *) 0 ;
+  int arg2 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  int val2 ;
+  int ecode2 = 0 ;
+  PyObject * obj0 = 0 ;
+  PyObject * obj1 = 0 ;
+  
+  if(!PyArg_UnpackTuple(args,(char *)"TRMTubeModel_engine_set",2,2,&obj0,&obj1)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_TRMTubeModel, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "TRMTubeModel_engine_set" "', argument " "1"" of type '" "TRMTubeModel *""'"); 
+  }
+  arg1 = (TRMTubeModel *)(argp1);
+  ecode2 = SWIG_AsVal_int(obj1, &val2);
+  if (!SWIG_IsOK(ecode2)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode2), "in method '" "TRMTubeModel_engine_set" "', argument " "2"" of type '" "int""'");
+  } 
+  arg2 = (int)(val2);
+  if (arg1) (arg1)->engine = arg2;
+  resultobj = SWIG_Py_Void();
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_TRMTubeModel_engine_get(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+  PyObject *resultobj = 0;
+  TRMTubeModel *arg1 = (TRMTubeModel *) 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  PyObject * obj0 = 0 ;
+  int result;
+  
+  if(!PyArg_UnpackTuple(args,(char *)"TRMTubeModel_engine_get",1,1,&obj0)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_TRMTubeModel, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "TRMTubeModel_engine_get" "', argument " "1"" of type '" "TRMTubeModel *""'"); 
+  }
+  arg1 = (TRMTubeModel *)(argp1);
+  result = (int) ((arg1)->engine);
+  resultobj = SWIG_From_int((int)(result));
+  return resultobj;
+fail:
+  return NULL;
+}
+
+SWIGINTERN PyObject *_wrap_TRMTubeModel_skipSilence_set(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+  PyObject *resultobj = 0;
+  TRMTubeModel *arg1 = (TRMTubeModel *) 0 ;
+  int arg2 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  int val2 ;
+  int ecode2 = 0 ;
+  PyObject * obj0 = 0 ;
+  PyObject * obj1 = 0 ;
+  
+  if(!PyArg_UnpackTuple(args,(char *)"TRMTubeModel_skipSilence_set",2,2,&obj0,&obj1)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_TRMTubeModel, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "TRMTubeModel_skipSilence_set" "', argument " "1"" of type '" "TRMTubeModel *""'"); 
+  }
+  arg1 = (TRMTubeModel *)(argp1);
+  ecode2 = SWIG_AsVal_int(obj1, &val2);
+  if (!SWIG_IsOK(ecode2)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode2), "in method '" "TRMTubeModel_skipSilence_set" "', argument " "2"" of type '" "int""'");
+  } 
+  arg2 = (int)(val2);
+  if (arg1) (arg1)->skipSilence = arg2;
+  resultobj = SWIG_Py_Void();
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_TRMTubeModel_skipSilence_get(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+  PyObject *resultobj = 0;
+  TRMTubeModel *arg1 = (TRMTubeModel *) 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  PyObject * obj0 = 0 ;
+  int result;
+  
+  if(!PyArg_UnpackTuple(args,(char *)"TRMTubeModel_skipSilence_get",1,1,&obj0)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_TRMTubeModel, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "TRMTubeModel_skipSilence_get" "', argument " "1"" of type '" "TRMTubeModel *""'"); 
+  }
+  arg1 = (TRMTubeModel *)(argp1);
+  result = (int) ((arg1)->skipSilence);
+  resultobj = SWIG_From_int((int)(result));
+  return resultobj;
+fail:
+  return NULL;
+}
+
+SWIGINTERN PyObject *_wrap_TRMTubeModel_silenceThreshold_set(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+  PyObject *resultobj = 0;
+  TRMTubeModel *arg1 = (TRMTubeModel *) 0 ;
+  double arg2 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  double val2 ;
+  int ecode2 = 0 ;
+  PyObject * obj0 = 0 ;
+  PyObject * obj1 = 0 ;
+  
+  if(!PyArg_UnpackTuple(args,(char *)"TRMTubeModel_silenceThreshold_set",2,2,&obj0,&obj1)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_TRMTubeModel, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "TRMTubeModel_silenceThreshold_set" "', argument " "1"" of type '" "TRMTubeModel *""'"); 
+  }
+  arg1 = (TRMTubeModel *)(argp1);
+  ecode2 = SWIG_AsVal_double(obj1, &val2);
+  if (!SWIG_IsOK(ecode2)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode2), "in method '" "TRMTubeModel_silenceThreshold_set" "', argument " "2"" of type '" "double""'");
+  } 
+  arg2 = (double)(val2);
+  if (arg1) (arg1)->silenceThreshold = arg2;
+  resultobj = SWIG_Py_Void();
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_TRMTubeModel_silenceThreshold_get(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+  PyObject *resultobj = 0;
+  TRMTubeModel *arg1 = (TRMTubeModel *) 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  PyObject * obj0 = 0 ;
+  double result;
+  
+  if(!PyArg_UnpackTuple(args,(char *)"TRMTubeModel_silenceThreshold_get",1,1,&obj0)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_TRMTubeModel, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "TRMTubeModel_silenceThreshold_get" "', argument " "1"" of type '" "TRMTubeModel *""'"); 
+  }
+  arg1 = (TRMTubeModel *)(argp1);
+  result = (double) ((arg1)->silenceThreshold);
+  resultobj = SWIG_From_double((double)(result));
+  return resultobj;
+fail:
+  return NULL;
+}
+
+SWIGINTERN PyObject *_wrap_TRMTubeModel_skippedSamples_set(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+  PyObject *resultobj = 0;
+  TRMTubeModel *arg1 = (TRMTubeModel *) 0 ;
+  long arg2 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  long val2 ;
+  int ecode2 = 0 ;
+  PyObject * obj0 = 0 ;
+  PyObject * obj1 = 0 ;
+  
+  if(!PyArg_UnpackTuple(args,(char *)"TRMTubeModel_skippedSamples_set",2,2,&obj0,&obj1)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_TRMTubeModel, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "TRMTubeModel_skippedSamples_set" "', argument " "1"" of type '" "TRMTubeModel *""'"); 
+  }
+  arg1 = (TRMTubeModel *)(argp1);
+  ecode2 = SWIG_AsVal_long(obj1, &val2);
+  if (!SWIG_IsOK(ecode2)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode2), "in method '" "TRMTubeModel_skippedSamples_set" "', argument " "2"" of type '" "long""'");
+  } 
+  arg2 = (long)(val2);
+  if (arg1) (arg1)->skippedSamples = arg2;
+  resultobj = SWIG_Py_Void();
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_TRMTubeModel_skippedSamples_get(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+  PyObject *resultobj = 0;
+  TRMTubeModel *arg1 = (TRMTubeModel *) 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  PyObject * obj0 = 0 ;
+  long result;
+  
+  if(!PyArg_UnpackTuple(args,(char *)"TRMTubeModel_skippedSamples_get",1,1,&obj0)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_TRMTubeModel, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "TRMTubeModel_skippedSamples_get" "', argument " "1"" of type '" "TRMTubeModel *""'"); 
+  }
+  arg1 = (TRMTubeModel *)(argp1);
+  result = (long) ((arg1)->skippedSamples);
+  resultobj = SWIG_From_long((long)(result));
+  return resultobj;
+fail:
+  return NULL;
+}
+
+SWIGINTERN PyObject *_wrap_TRMTubeModel_current_get(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+  PyObject *resultobj = 0;
+  TRMTubeModel *arg1 = (TRMTubeModel *) 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  PyObject * obj0 = 0 ;
+  TRMTubeModel_current *result = 0 ;
+  
+  if(!PyArg_UnpackTuple(args,(char *)"TRMTubeModel_current_get",1,1,&obj0)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_TRMTubeModel, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "TRMTubeModel_current_get" "', argument " "1"" of type '" "TRMTubeModel *""'"); 
   }
   arg1 = (TRMTubeModel *)(argp1);
   result = (TRMTubeModel_current *)& ((arg1)->current);
@@ -8449,13 +9087,315 @@ fail:
 }
 
 
-SWIGINTERN PyObject *_wrap_synthesize(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+SWIGINTERN PyObject *_wrap_TRMTubeModelSeed(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
   PyObject *resultobj = 0;
   TRMTubeModel *arg1 = (TRMTubeModel *) 0 ;
-  TRMData *arg2 = (TRMData *) 0 ;
+  int arg2 ;
   void *argp1 = 0 ;
   int res1 = 0 ;
-  void *argp2 = 0 ;
+  int val2 ;
+  int ecode2 = 0 ;
+  PyObject * obj0 = 0 ;
+  PyObject * obj1 = 0 ;
+  
+  if(!PyArg_UnpackTuple(args,(char *)"TRMTubeModelSeed",2,2,&obj0,&obj1)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_TRMTubeModel, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "TRMTubeModelSeed" "', argument " "1"" of type '" "TRMTubeModel *""'"); 
+  }
+  arg1 = (TRMTubeModel *)(argp1);
+  ecode2 = SWIG_AsVal_int(obj1, &val2);
+  if (!SWIG_IsOK(ecode2)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode2), "in method '" "TRMTubeModelSeed" "', argument " "2"" of type '" "int""'");
+  } 
+  arg2 = (int)(val2);
+  TRMTubeModelSeed(arg1,arg2);
+  resultobj = SWIG_Py_Void();
+  return resultobj;
+fail:
+  return NULL;
+}
+
+SWIGINTERN PyObject *_wrap_TRMTubeModelCopy(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+  PyObject *resultobj = 0;
+  TRMTubeModel *arg1 = (TRMTubeModel *) 0 ;
+  TRMTubeModel *arg2 = (TRMTubeModel *) 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  void *argp2 = 0 ;
+  int res2 = 0 ;
+  PyObject * obj0 = 0 ;
+  PyObject * obj1 = 0 ;
+  int result;
+  
+  if(!PyArg_UnpackTuple(args,(char *)"TRMTubeModelCopy",2,2,&obj0,&obj1)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_TRMTubeModel, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "TRMTubeModelCopy" "', argument " "1"" of type '" "TRMTubeModel *""'"); 
+  }
+  arg1 = (TRMTubeModel *)(argp1);
+  res2 = SWIG_ConvertPtr(obj1, &argp2,SWIGTYPE_p_TRMTubeModel, 0 |  0 );
+  if (!SWIG_IsOK(res2)) {
+    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "TRMTubeModelCopy" "', argument " "2"" of type '" "TRMTubeModel *""'"); 
+  }
+  arg2 = (TRMTubeModel *)(argp2);
+  result = (int)TRMTubeModelCopy(arg1,arg2);
+  resultobj = SWIG_From_int((int)(result));
+  return resultobj;
+fail:
+  return NULL;
+}
+
+SWIGINTERN PyObject *_wrap_TRMTubeModelSetLimiter(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+  PyObject *resultobj = 0;
+  TRMTubeModel *arg1 = (TRMTubeModel *) 0 ;
+  double arg2 ;
+  double arg3 ;
+  double arg4 ;
+  double arg5 ;
+  double arg6 ;
+  double arg7 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  double val2 ;
+  int ecode2 = 0 ;
+  double val3 ;
+  int ecode3 = 0 ;
+  double val4 ;
+  int ecode4 = 0 ;
+  double val5 ;
+  int ecode5 = 0 ;
+  double val6 ;
+  int ecode6 = 0 ;
+  double val7 ;
+  int ecode7 = 0 ;
+  PyObject * obj0 = 0 ;
+  PyObject * obj1 = 0 ;
+  PyObject * obj2 = 0 ;
+  PyObject * obj3 = 0 ;
+  PyObject * obj4 = 0 ;
+  PyObject * obj5 = 0 ;
+  PyObject * obj6 = 0 ;
+  int result;
+  
+  if(!PyArg_UnpackTuple(args,(char *)"TRMTubeModelSetLimiter",7,7,&obj0,&obj1,&obj2,&obj3,&obj4,&obj5,&obj6)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_TRMTubeModel, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "TRMTubeModelSetLimiter" "', argument " "1"" of type '" "TRMTubeModel *""'"); 
+  }
+  arg1 = (TRMTubeModel *)(argp1);
+  ecode2 = SWIG_AsVal_double(obj1, &val2);
+  if (!SWIG_IsOK(ecode2)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode2), "in method '" "TRMTubeModelSetLimiter" "', argument " "2"" of type '" "double""'");
+  } 
+  arg2 = (double)(val2);
+  ecode3 = SWIG_AsVal_double(obj2, &val3);
+  if (!SWIG_IsOK(ecode3)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode3), "in method '" "TRMTubeModelSetLimiter" "', argument " "3"" of type '" "double""'");
+  } 
+  arg3 = (double)(val3);
+  ecode4 = SWIG_AsVal_double(obj3, &val4);
+  if (!SWIG_IsOK(ecode4)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode4), "in method '" "TRMTubeModelSetLimiter" "', argument " "4"" of type '" "double""'");
+  } 
+  arg4 = (double)(val4);
+  ecode5 = SWIG_AsVal_double(obj4, &val5);
+  if (!SWIG_IsOK(ecode5)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode5), "in method '" "TRMTubeModelSetLimiter" "', argument " "5"" of type '" "double""'");
+  } 
+  arg5 = (double)(val5);
+  ecode6 = SWIG_AsVal_double(obj5, &val6);
+  if (!SWIG_IsOK(ecode6)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode6), "in method '" "TRMTubeModelSetLimiter" "', argument " "6"" of type '" "double""'");
+  } 
+  arg6 = (double)(val6);
+  ecode7 = SWIG_AsVal_double(obj6, &val7);
+  if (!SWIG_IsOK(ecode7)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode7), "in method '" "TRMTubeModelSetLimiter" "', argument " "7"" of type '" "double""'");
+  } 
+  arg7 = (double)(val7);
+  result = (int)TRMTubeModelSetLimiter(arg1,arg2,arg3,arg4,arg5,arg6,arg7);
+  resultobj = SWIG_From_int((int)(result));
+  return resultobj;
+fail:
+  return NULL;
+}
+
+SWIGINTERN PyObject *_wrap_TRMTubeModelClearLimiter(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+  PyObject *resultobj = 0;
+  TRMTubeModel *arg1 = (TRMTubeModel *) 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  PyObject * obj0 = 0 ;
+  
+  if(!PyArg_UnpackTuple(args,(char *)"TRMTubeModelClearLimiter",1,1,&obj0)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_TRMTubeModel, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "TRMTubeModelClearLimiter" "', argument " "1"" of type '" "TRMTubeModel *""'"); 
+  }
+  arg1 = (TRMTubeModel *)(argp1);
+  TRMTubeModelClearLimiter(arg1);
+  resultobj = SWIG_Py_Void();
+  return resultobj;
+fail:
+  return NULL;
+}
+
+SWIGINTERN PyObject *_wrap_TRMTubeModelCollectStatistics(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+  PyObject *resultobj = 0;
+  TRMTubeModel *arg1 = (TRMTubeModel *) 0 ;
+  TRMInputParameters *arg2 = (TRMInputParameters *) 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  void *argp2 = 0 ;
+  int res2 = 0 ;
+  PyObject * obj0 = 0 ;
+  PyObject * obj1 = 0 ;
+  int result;
+  
+  if(!PyArg_UnpackTuple(args,(char *)"TRMTubeModelCollectStatistics",2,2,&obj0,&obj1)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_TRMTubeModel, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "TRMTubeModelCollectStatistics" "', argument " "1"" of type '" "TRMTubeModel *""'"); 
+  }
+  arg1 = (TRMTubeModel *)(argp1);
+  res2 = SWIG_ConvertPtr(obj1, &argp2,SWIGTYPE_p__TRMInputParameters, 0 |  0 );
+  if (!SWIG_IsOK(res2)) {
+    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "TRMTubeModelCollectStatistics" "', argument " "2"" of type '" "TRMInputParameters *""'"); 
+  }
+  arg2 = (TRMInputParameters *)(argp2);
+  result = (int)TRMTubeModelCollectStatistics(arg1,arg2);
+  resultobj = SWIG_From_int((int)(result));
+  return resultobj;
+fail:
+  return NULL;
+}
+
+SWIGINTERN PyObject *_wrap_TRMTubeModelClearStatistics(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+  PyObject *resultobj = 0;
+  TRMTubeModel *arg1 = (TRMTubeModel *) 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  PyObject * obj0 = 0 ;
+  
+  if(!PyArg_UnpackTuple(args,(char *)"TRMTubeModelClearStatistics",1,1,&obj0)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_TRMTubeModel, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "TRMTubeModelClearStatistics" "', argument " "1"" of type '" "TRMTubeModel *""'"); 
+  }
+  arg1 = (TRMTubeModel *)(argp1);
+  TRMTubeModelClearStatistics(arg1);
+  resultobj = SWIG_Py_Void();
+  return resultobj;
+fail:
+  return NULL;
+}
+
+SWIGINTERN PyObject *_wrap_TRMTubeModelReadStatistics(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+  PyObject *resultobj = 0;
+  TRMTubeModel *arg1 = (TRMTubeModel *) 0 ;
+  double *arg2 = (double *) 0 ;
+  long arg3 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  void *argp2 = 0 ;
+  int res2 = 0 ;
+  long val3 ;
+  int ecode3 = 0 ;
+  PyObject * obj0 = 0 ;
+  PyObject * obj1 = 0 ;
+  PyObject * obj2 = 0 ;
+  long result;
+  
+  if(!PyArg_UnpackTuple(args,(char *)"TRMTubeModelReadStatistics",3,3,&obj0,&obj1,&obj2)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_TRMTubeModel, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "TRMTubeModelReadStatistics" "', argument " "1"" of type '" "TRMTubeModel *""'"); 
+  }
+  arg1 = (TRMTubeModel *)(argp1);
+  res2 = SWIG_ConvertPtr(obj1, &argp2,SWIGTYPE_p_double, 0 |  0 );
+  if (!SWIG_IsOK(res2)) {
+    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "TRMTubeModelReadStatistics" "', argument " "2"" of type '" "double *""'"); 
+  }
+  arg2 = (double *)(argp2);
+  ecode3 = SWIG_AsVal_long(obj2, &val3);
+  if (!SWIG_IsOK(ecode3)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode3), "in method '" "TRMTubeModelReadStatistics" "', argument " "3"" of type '" "long""'");
+  } 
+  arg3 = (long)(val3);
+  result = (long)TRMTubeModelReadStatistics(arg1,arg2,arg3);
+  resultobj = SWIG_From_long((long)(result));
+  return resultobj;
+fail:
+  return NULL;
+}
+
+SWIGINTERN PyObject *_wrap_TRMTubeModelProfileStages(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+  PyObject *resultobj = 0;
+  TRMTubeModel *arg1 = (TRMTubeModel *) 0 ;
+  int arg2 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  int val2 ;
+  int ecode2 = 0 ;
+  PyObject * obj0 = 0 ;
+  PyObject * obj1 = 0 ;
+  
+  if(!PyArg_UnpackTuple(args,(char *)"TRMTubeModelProfileStages",2,2,&obj0,&obj1)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_TRMTubeModel, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "TRMTubeModelProfileStages" "', argument " "1"" of type '" "TRMTubeModel *""'"); 
+  }
+  arg1 = (TRMTubeModel *)(argp1);
+  ecode2 = SWIG_AsVal_int(obj1, &val2);
+  if (!SWIG_IsOK(ecode2)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode2), "in method '" "TRMTubeModelProfileStages" "', argument " "2"" of type '" "int""'");
+  } 
+  arg2 = (int)(val2);
+  TRMTubeModelProfileStages(arg1,arg2);
+  resultobj = SWIG_Py_Void();
+  return resultobj;
+fail:
+  return NULL;
+}
+
+SWIGINTERN PyObject *_wrap_TRMTubeModelStageSeconds(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+  PyObject *resultobj = 0;
+  TRMTubeModel *arg1 = (TRMTubeModel *) 0 ;
+  int arg2 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  int val2 ;
+  int ecode2 = 0 ;
+  PyObject * obj0 = 0 ;
+  PyObject * obj1 = 0 ;
+  double result;
+  
+  if(!PyArg_UnpackTuple(args,(char *)"TRMTubeModelStageSeconds",2,2,&obj0,&obj1)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_TRMTubeModel, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "TRMTubeModelStageSeconds" "', argument " "1"" of type '" "TRMTubeModel *""'"); 
+  }
+  arg1 = (TRMTubeModel *)(argp1);
+  ecode2 = SWIG_AsVal_int(obj1, &val2);
+  if (!SWIG_IsOK(ecode2)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode2), "in method '" "TRMTubeModelStageSeconds" "', argument " "2"" of type '" "int""'");
+  } 
+  arg2 = (int)(val2);
+  result = (double)TRMTubeModelStageSeconds(arg1,arg2);
+  resultobj = SWIG_From_double((double)(result));
+  return resultobj;
+fail:
+  return NULL;
+}
+
+SWIGINTERN PyObject *_wrap_synthesize(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+  PyObject *resultobj = 0;
+  TRMTubeModel *arg1 = (TRMTubeModel *) 0 ;
+  TRMData *arg2 = (TRMData *) 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  void *argp2 = 0 ;
   int res2 = 0 ;
   PyObject * obj0 = 0 ;
   PyObject * obj1 = 0 ;
@@ -8479,12 +9419,175 @@ fail:
 }
 
 
+SWIGINTERN PyObject *_wrap_synthesizeBlock(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+  PyObject *resultobj = 0;
+  TRMTubeModel *arg1 = (TRMTubeModel *) 0 ;
+  TRMInputParameters *arg2 = (TRMInputParameters *) 0 ;
+  double *arg3 = (double *) 0 ;
+  int arg4 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  void *argp2 = 0 ;
+  int res2 = 0 ;
+  void *argp3 = 0 ;
+  int res3 = 0 ;
+  int val4 ;
+  int ecode4 = 0 ;
+  PyObject * obj0 = 0 ;
+  PyObject * obj1 = 0 ;
+  PyObject * obj2 = 0 ;
+  PyObject * obj3 = 0 ;
+  
+  if(!PyArg_UnpackTuple(args,(char *)"synthesizeBlock",4,4,&obj0,&obj1,&obj2,&obj3)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_TRMTubeModel, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "synthesizeBlock" "', argument " "1"" of type '" "TRMTubeModel *""'"); 
+  }
+  arg1 = (TRMTubeModel *)(argp1);
+  res2 = SWIG_ConvertPtr(obj1, &argp2,SWIGTYPE_p__TRMInputParameters, 0 |  0 );
+  if (!SWIG_IsOK(res2)) {
+    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "synthesizeBlock" "', argument " "2"" of type '" "TRMInputParameters *""'"); 
+  }
+  arg2 = (TRMInputParameters *)(argp2);
+  res3 = SWIG_ConvertPtr(obj2, &argp3,SWIGTYPE_p_double, 0 |  0 );
+  if (!SWIG_IsOK(res3)) {
+    SWIG_exception_fail(SWIG_ArgError(res3), "in method '" "synthesizeBlock" "', argument " "3"" of type '" "double *""'"); 
+  }
+  arg3 = (double *)(argp3);
+  ecode4 = SWIG_AsVal_int(obj3, &val4);
+  if (!SWIG_IsOK(ecode4)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode4), "in method '" "synthesizeBlock" "', argument " "4"" of type '" "int""'");
+  } 
+  arg4 = (int)(val4);
+  synthesizeBlock(arg1,arg2,arg3,arg4);
+  resultobj = SWIG_Py_Void();
+  return resultobj;
+fail:
+  return NULL;
+}
+
+SWIGINTERN PyObject *_wrap_finishSynthesis(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+  PyObject *resultobj = 0;
+  TRMTubeModel *arg1 = (TRMTubeModel *) 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  PyObject * obj0 = 0 ;
+  
+  if(!PyArg_UnpackTuple(args,(char *)"finishSynthesis",1,1,&obj0)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_TRMTubeModel, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "finishSynthesis" "', argument " "1"" of type '" "TRMTubeModel *""'"); 
+  }
+  arg1 = (TRMTubeModel *)(argp1);
+  finishSynthesis(arg1);
+  resultobj = SWIG_Py_Void();
+  return resultobj;
+fail:
+  return NULL;
+}
+
+SWIGINTERN PyObject *_wrap_synthesizeKeyframes(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+  PyObject *resultobj = 0;
+  TRMTubeModel *arg1 = (TRMTubeModel *) 0 ;
+  TRMInputParameters *arg2 = (TRMInputParameters *) 0 ;
+  double *arg3 = (double *) 0 ;
+  double *arg4 = (double *) 0 ;
+  int arg5 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  void *argp2 = 0 ;
+  int res2 = 0 ;
+  void *argp3 = 0 ;
+  int res3 = 0 ;
+  void *argp4 = 0 ;
+  int res4 = 0 ;
+  int val5 ;
+  int ecode5 = 0 ;
+  PyObject * obj0 = 0 ;
+  PyObject * obj1 = 0 ;
+  PyObject * obj2 = 0 ;
+  PyObject * obj3 = 0 ;
+  PyObject * obj4 = 0 ;
+  
+  if(!PyArg_UnpackTuple(args,(char *)"synthesizeKeyframes",5,5,&obj0,&obj1,&obj2,&obj3,&obj4)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_TRMTubeModel, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "synthesizeKeyframes" "', argument " "1"" of type '" "TRMTubeModel *""'"); 
+  }
+  arg1 = (TRMTubeModel *)(argp1);
+  res2 = SWIG_ConvertPtr(obj1, &argp2,SWIGTYPE_p__TRMInputParameters, 0 |  0 );
+  if (!SWIG_IsOK(res2)) {
+    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "synthesizeKeyframes" "', argument " "2"" of type '" "TRMInputParameters *""'"); 
+  }
+  arg2 = (TRMInputParameters *)(argp2);
+  res3 = SWIG_ConvertPtr(obj2, &argp3,SWIGTYPE_p_double, 0 |  0 );
+  if (!SWIG_IsOK(res3)) {
+    SWIG_exception_fail(SWIG_ArgError(res3), "in method '" "synthesizeKeyframes" "', argument " "3"" of type '" "double *""'"); 
+  }
+  arg3 = (double *)(argp3);
+  res4 = SWIG_ConvertPtr(obj3, &argp4,SWIGTYPE_p_double, 0 |  0 );
+  if (!SWIG_IsOK(res4)) {
+    SWIG_exception_fail(SWIG_ArgError(res4), "in method '" "synthesizeKeyframes" "', argument " "4"" of type '" "double *""'"); 
+  }
+  arg4 = (double *)(argp4);
+  ecode5 = SWIG_AsVal_int(obj4, &val5);
+  if (!SWIG_IsOK(ecode5)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode5), "in method '" "synthesizeKeyframes" "', argument " "5"" of type '" "int""'");
+  } 
+  arg5 = (int)(val5);
+  synthesizeKeyframes(arg1,arg2,arg3,arg4,arg5);
+  resultobj = SWIG_Py_Void();
+  return resultobj;
+fail:
+  return NULL;
+}
+
+SWIGINTERN PyObject *_wrap_seekSynthesis(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+  PyObject *resultobj = 0;
+  TRMTubeModel *arg1 = (TRMTubeModel *) 0 ;
+  double *arg2 = (double *) 0 ;
+  int arg3 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  void *argp2 = 0 ;
+  int res2 = 0 ;
+  int val3 ;
+  int ecode3 = 0 ;
+  PyObject * obj0 = 0 ;
+  PyObject * obj1 = 0 ;
+  PyObject * obj2 = 0 ;
+  long result;
+  
+  if(!PyArg_UnpackTuple(args,(char *)"seekSynthesis",3,3,&obj0,&obj1,&obj2)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_TRMTubeModel, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "seekSynthesis" "', argument " "1"" of type '" "TRMTubeModel *""'"); 
+  }
+  arg1 = (TRMTubeModel *)(argp1);
+  res2 = SWIG_ConvertPtr(obj1, &argp2,SWIGTYPE_p_double, 0 |  0 );
+  if (!SWIG_IsOK(res2)) {
+    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "seekSynthesis" "', argument " "2"" of type '" "double *""'"); 
+  }
+  arg2 = (double *)(argp2);
+  ecode3 = SWIG_AsVal_int(obj2, &val3);
+  if (!SWIG_IsOK(ecode3)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode3), "in method '" "seekSynthesis" "', argument " "3"" of type '" "int""'");
+  } 
+  arg3 = (int)(val3);
+  result = (long)seekSynthesis(arg1,arg2,arg3);
+  resultobj = SWIG_From_long((long)(result));
+  return resultobj;
+fail:
+  return NULL;
+}
+
 static PyMethodDef SwigMethods[] = {
 	 { (char *)"SWIG_PyInstanceMethod_New", (PyCFunction)SWIG_PyInstanceMethod_New, METH_O, NULL},
 	 { (char *)"new_double_array", _wrap_new_double_array, METH_VARARGS, NULL},
 	 { (char *)"delete_double_array", _wrap_delete_double_array, METH_VARARGS, NULL},
 	 { (char *)"double_array_getitem", _wrap_double_array_getitem, METH_VARARGS, NULL},
 	 { (char *)"double_array_setitem", _wrap_double_array_setitem, METH_VARARGS, NULL},
+	 { (char *)"double_array_from_address", _wrap_double_array_from_address, METH_VARARGS, NULL},
 	 { (char *)"parseInputFile", _wrap_parseInputFile, METH_VARARGS, NULL},
 	 { (char *)"addInput", _wrap_addInput, METH_VARARGS, NULL},
 	 { (char *)"glotPitchAt", _wrap_glotPitchAt, METH_VARARGS, NULL},
@@ -8576,6 +9679,8 @@ static PyMethodDef SwigMethods[] = {
 	 { (char *)"TRMInputParameters_modulation_get", _wrap_TRMInputParameters_modulation_get, METH_VARARGS, NULL},
 	 { (char *)"TRMInputParameters_mixOffset_set", _wrap_TRMInputParameters_mixOffset_set, METH_VARARGS, NULL},
 	 { (char *)"TRMInputParameters_mixOffset_get", _wrap_TRMInputParameters_mixOffset_get, METH_VARARGS, NULL},
+	 { (char *)"TRMInputParameters_noiseSeed_set", _wrap_TRMInputParameters_noiseSeed_set, METH_VARARGS, NULL},
+	 { (char *)"TRMInputParameters_noiseSeed_get", _wrap_TRMInputParameters_noiseSeed_get, METH_VARARGS, NULL},
 	 { (char *)"new_TRMInputParameters", _wrap_new_TRMInputParameters, METH_VARARGS, NULL},
 	 { (char *)"delete_TRMInputParameters", _wrap_delete_TRMInputParameters, METH_VARARGS, NULL},
 	 { (char *)"TRMInputParameters_swigregister", TRMInputParameters_swigregister, METH_VARARGS, NULL},
@@ -8608,6 +9713,16 @@ static PyMethodDef SwigMethods[] = {
 	 { (char *)"TRMSampleRateConverter_numberSamples_get", _wrap_TRMSampleRateConverter_numberSamples_get, METH_VARARGS, NULL},
 	 { (char *)"TRMSampleRateConverter_tempFilePtr_set", _wrap_TRMSampleRateConverter_tempFilePtr_set, METH_VARARGS, NULL},
 	 { (char *)"TRMSampleRateConverter_tempFilePtr_get", _wrap_TRMSampleRateConverter_tempFilePtr_get, METH_VARARGS, NULL},
+	 { (char *)"TRMSampleRateConverter_outputBuffer_set", _wrap_TRMSampleRateConverter_outputBuffer_set, METH_VARARGS, NULL},
+	 { (char *)"TRMSampleRateConverter_outputBuffer_get", _wrap_TRMSampleRateConverter_outputBuffer_get, METH_VARARGS, NULL},
+	 { (char *)"TRMSampleRateConverter_outputBufferSize_set", _wrap_TRMSampleRateConverter_outputBufferSize_set, METH_VARARGS, NULL},
+	 { (char *)"TRMSampleRateConverter_outputBufferSize_get", _wrap_TRMSampleRateConverter_outputBufferSize_get, METH_VARARGS, NULL},
+	 { (char *)"TRMSampleRateConverter_outputBufferCount_set", _wrap_TRMSampleRateConverter_outputBufferCount_set, METH_VARARGS, NULL},
+	 { (char *)"TRMSampleRateConverter_outputBufferCount_get", _wrap_TRMSampleRateConverter_outputBufferCount_get, METH_VARARGS, NULL},
+	 { (char *)"TRMSampleRateConverter_outputAccumulate_set", _wrap_TRMSampleRateConverter_outputAccumulate_set, METH_VARARGS, NULL},
+	 { (char *)"TRMSampleRateConverter_outputAccumulate_get", _wrap_TRMSampleRateConverter_outputAccumulate_get, METH_VARARGS, NULL},
+	 { (char *)"TRMSampleRateConverter_outputGain_set", _wrap_TRMSampleRateConverter_outputGain_set, METH_VARARGS, NULL},
+	 { (char *)"TRMSampleRateConverter_outputGain_get", _wrap_TRMSampleRateConverter_outputGain_get, METH_VARARGS, NULL},
 	 { (char *)"new_TRMSampleRateConverter", _wrap_new_TRMSampleRateConverter, METH_VARARGS, NULL},
 	 { (char *)"delete_TRMSampleRateConverter", _wrap_delete_TRMSampleRateConverter, METH_VARARGS, NULL},
 	 { (char *)"TRMSampleRateConverter_swigregister", TRMSampleRateConverter_swigregister, METH_VARARGS, NULL},
@@ -8677,6 +9792,18 @@ static PyMethodDef SwigMethods[] = {
 	 { (char *)"TRMTubeModel_ringBuffer_get", _wrap_TRMTubeModel_ringBuffer_get, METH_VARARGS, NULL},
 	 { (char *)"TRMTubeModel_wavetable_set", _wrap_TRMTubeModel_wavetable_set, METH_VARARGS, NULL},
 	 { (char *)"TRMTubeModel_wavetable_get", _wrap_TRMTubeModel_wavetable_get, METH_VARARGS, NULL},
+	 { (char *)"TRMTubeModel_noiseState_set", _wrap_TRMTubeModel_noiseState_set, METH_VARARGS, NULL},
+	 { (char *)"TRMTubeModel_noiseState_get", _wrap_TRMTubeModel_noiseState_get, METH_VARARGS, NULL},
+	 { (char *)"TRMTubeModel_noiseX_set", _wrap_TRMTubeModel_noiseX_set, METH_VARARGS, NULL},
+	 { (char *)"TRMTubeModel_noiseX_get", _wrap_TRMTubeModel_noiseX_get, METH_VARARGS, NULL},
+	 { (char *)"TRMTubeModel_engine_set", _wrap_TRMTubeModel_engine_set, METH_VARARGS, NULL},
+	 { (char *)"TRMTubeModel_engine_get", _wrap_TRMTubeModel_engine_get, METH_VARARGS, NULL},
+	 { (char *)"TRMTubeModel_skipSilence_set", _wrap_TRMTubeModel_skipSilence_set, METH_VARARGS, NULL},
+	 { (char *)"TRMTubeModel_skipSilence_get", _wrap_TRMTubeModel_skipSilence_get, METH_VARARGS, NULL},
+	 { (char *)"TRMTubeModel_silenceThreshold_set", _wrap_TRMTubeModel_silenceThreshold_set, METH_VARARGS, NULL},
+	 { (char *)"TRMTubeModel_silenceThreshold_get", _wrap_TRMTubeModel_silenceThreshold_get, METH_VARARGS, NULL},
+	 { (char *)"TRMTubeModel_skippedSamples_set", _wrap_TRMTubeModel_skippedSamples_set, METH_VARARGS, NULL},
+	 { (char *)"TRMTubeModel_skippedSamples_get", _wrap_TRMTubeModel_skippedSamples_get, METH_VARARGS, NULL},
 	 { (char *)"TRMTubeModel_current_get", _wrap_TRMTubeModel_current_get, METH_VARARGS, NULL},
 	 { (char *)"new_TRMTubeModel", _wrap_new_TRMTubeModel, METH_VARARGS, NULL},
 	 { (char *)"delete_TRMTubeModel", _wrap_delete_TRMTubeModel, METH_VARARGS, NULL},
@@ -8690,7 +9817,20 @@ static PyMethodDef SwigMethods[] = {
 	 { (char *)"TRMTubeModel_current_swigregister", TRMTubeModel_current_swigregister, METH_VARARGS, NULL},
 	 { (char *)"TRMTubeModelCreate", _wrap_TRMTubeModelCreate, METH_VARARGS, NULL},
 	 { (char *)"TRMTubeModelFree", _wrap_TRMTubeModelFree, METH_VARARGS, NULL},
+	 { (char *)"TRMTubeModelSeed", _wrap_TRMTubeModelSeed, METH_VARARGS, NULL},
+	 { (char *)"TRMTubeModelCopy", _wrap_TRMTubeModelCopy, METH_VARARGS, NULL},
+	 { (char *)"TRMTubeModelSetLimiter", _wrap_TRMTubeModelSetLimiter, METH_VARARGS, NULL},
+	 { (char *)"TRMTubeModelClearLimiter", _wrap_TRMTubeModelClearLimiter, METH_VARARGS, NULL},
+	 { (char *)"TRMTubeModelCollectStatistics", _wrap_TRMTubeModelCollectStatistics, METH_VARARGS, NULL},
+	 { (char *)"TRMTubeModelClearStatistics", _wrap_TRMTubeModelClearStatistics, METH_VARARGS, NULL},
+	 { (char *)"TRMTubeModelReadStatistics", _wrap_TRMTubeModelReadStatistics, METH_VARARGS, NULL},
+	 { (char *)"TRMTubeModelProfileStages", _wrap_TRMTubeModelProfileStages, METH_VARARGS, NULL},
+	 { (char *)"TRMTubeModelStageSeconds", _wrap_TRMTubeModelStageSeconds, METH_VARARGS, NULL},
 	 { (char *)"synthesize", _wrap_synthesize, METH_VARARGS, NULL},
+	 { (char *)"synthesizeBlock", _wrap_synthesizeBlock, METH_VARARGS, NULL},
+	 { (char *)"finishSynthesis", _wrap_finishSynthesis, METH_VARARGS, NULL},
+	 { (char *)"synthesizeKeyframes", _wrap_synthesizeKeyframes, METH_VARARGS, NULL},
+	 { (char *)"seekSynthesis", _wrap_seekSynthesis, METH_VARARGS, NULL},
 	 { NULL, NULL, 0, NULL }
 };
 
@@ -9439,6 +10579,17 @@ SWIG_init(void) {
   SWIG_Python_SetConstant(d, "SUCCESS",SWIG_From_int((int)(0)));
   SWIG_Python_SetConstant(d, "PULSE",SWIG_From_int((int)(0)));
   SWIG_Python_SetConstant(d, "SINE",SWIG_From_int((int)(1)));
+  SWIG_Python_SetConstant(d, "REFERENCE_ENGINE",SWIG_From_int((int)(0)));
+  SWIG_Python_SetConstant(d, "FAST_ENGINE",SWIG_From_int((int)(1)));
+  SWIG_Python_SetConstant(d, "PARAMETER_STAGE",SWIG_From_int((int)(0)));
+  SWIG_Python_SetConstant(d, "GAIN_STAGE",SWIG_From_int((int)(1)));
+  SWIG_Python_SetConstant(d, "SOURCE_STAGE",SWIG_From_int((int)(2)));
+  SWIG_Python_SetConstant(d, "NOISE_STAGE",SWIG_From_int((int)(3)));
+  SWIG_Python_SetConstant(d, "MIX_STAGE",SWIG_From_int((int)(4)));
+  SWIG_Python_SetConstant(d, "TRACT_STAGE",SWIG_From_int((int)(5)));
+  SWIG_Python_SetConstant(d, "OUTPUT_STAGE",SWIG_From_int((int)(6)));
+  SWIG_Python_SetConstant(d, "TOTAL_STAGES",SWIG_From_int((int)(7)));
+  SWIG_Python_SetConstant(d, "SILENCE_THRESHOLD",SWIG_From_double((double)(1.0e-6)));
   SWIG_Python_SetConstant(d, "PI",SWIG_From_double((double)(3.14159265358979)));
   SWIG_Python_SetConstant(d, "TWO_PI",SWIG_From_double((double)((2.0*3.14159265358979))));
   PyDict_SetItemString(d,(char*)"cvar", SWIG_globals());
@@ -0,0 +1,137 @@
+# Copyright (c) 2011 Leif Johnson <leif@leifjohnson.net>
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+'''Scale synthesized samples for playback or storage.
+
+The gnuspeech tools scale a render by its peak: every sample is held in a
+temporary file until synthesis is done, and then the whole file is scaled so
+its largest sample reaches the master volume. normalize_peak() does the same
+for a numpy array of samples.
+
+For streaming, TubeModel.set_limiter() instead puts a loudness normalizer and
+lookahead peak limiter after the sample rate converter, so samples are final as
+soon as they come out of the model. stream() uses this to hand out blocks of
+16-bit or float32 samples while the rest of the utterance is still being
+synthesized:
+
+    for block in stream(parameters, frames, block_size=1024):
+        device.write(block.tostring())
+'''
+
+import ctypes
+import math
+import numpy
+
+import gnuspeech
+import tube
+
+# largest value of a 16-bit sample (RANGE_MAX in output.h).
+RANGE_MAX = 32767.
+
+
+def amplitude(volume_db):
+    '''Convert a volume in dB (0-60) to a linear amplitude, as in util.c.'''
+    if volume_db <= 0:
+        return 0.
+    if volume_db >= 60:
+        return 1.
+    return 10 ** ((volume_db - 60.) / 20.)
+
+
+def normalize_peak(samples, volume_db=60.):
+    '''Scale samples so their peak is at the given master volume.
+
+    This is the global-peak scaling of writeOutputToFile, for samples that are
+    all available at once. Returns float64 samples between -1 and 1.
+    '''
+    samples = numpy.asarray(samples, numpy.float64)
+    peak = abs(samples).max() if len(samples) else 0.
+    if peak == 0:
+        return samples.copy()
+    return samples * (amplitude(volume_db) / peak)
+
+
+def convert(samples, dtype='int16'):
+    '''Convert samples between -1 and 1 to int16 or float32 samples.'''
+    samples = numpy.asarray(samples)
+    if numpy.dtype(dtype) == numpy.int16:
+        return numpy.clip(numpy.round(samples * RANGE_MAX),
+                          -RANGE_MAX, RANGE_MAX).astype(numpy.int16)
+    if numpy.dtype(dtype) == numpy.float32:
+        return samples.astype(numpy.float32)
+    raise ValueError('unsupported sample type %r' % dtype)
+
+
+def stream(parameters, frames, block_size=1024, dtype='int16', engine='fast',
+           **limiter):
+    '''Synthesize frames, yielding blocks of samples as they are produced.
+
+    parameters: A tube.Parameters object.
+    frames: A sequence of control frames (see TubeModel.synthesize).
+    block_size: Number of samples in each block. The last block may be shorter.
+    dtype: 'int16' or 'float32' samples.
+    engine: The synthesis engine (see TubeModel).
+
+    Other keyword arguments are passed on to TubeModel.set_limiter.
+    '''
+    frames = iter(frames)
+    model = tube.TubeModel(parameters, engine=engine)
+    model.set_limiter(**limiter)
+    params = parameters._params
+    period = model._model.controlPeriod
+    converter = model._model.sampleRateConverter
+
+    # the converter can emit up to a ring buffer's worth of samples beyond
+    # what one frame produces, so leave plenty of headroom.
+    ratio = int(math.ceil(converter.sampleRateRatio))
+    size = block_size + ratio * (period + 4096)
+    output = numpy.zeros(size, numpy.float64)
+    converter.outputBuffer = gnuspeech.double_array_from_address(output.ctypes.data)
+    converter.outputBufferSize = size
+    converter.outputBufferCount = 0
+
+    def blocks(last=False):
+        count = converter.outputBufferCount
+        assert count < size, 'output buffer overflow'
+        done = 0
+        while count - done >= block_size or (last and done < count):
+            n = min(block_size, count - done)
+            yield convert(output[done:done + n], dtype)
+            done += n
+        address = output.ctypes.data
+        ctypes.memmove(address, address + 8 * done, 8 * (count - done))
+        converter.outputBufferCount = count - done
+
+    target_ptr = gnuspeech.new_double_array(tube.FRAME_SIZE)
+    try:
+        steps = 0
+        for frame in frames:
+            for i, v in enumerate(frame):
+                gnuspeech.double_array_setitem(target_ptr, i, v)
+            gnuspeech.synthesizeBlock(model._model, params, target_ptr, steps)
+            steps = period
+            for block in blocks():
+                yield block
+        gnuspeech.finishSynthesis(model._model)
+        for block in blocks(last=True):
+            yield block
+    finally:
+        converter.outputBuffer = None
+        gnuspeech.delete_double_array(target_ptr)
@@ -0,0 +1,146 @@
+# Copyright (c) 2011 Leif Johnson <leif@leifjohnson.net>
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+'''Mix many synthesized voices into a single output buffer.
+
+Each voice is a (parameters, frames, start, gain) tuple: a tube.Parameters
+object, a sequence of control frames (see TubeModel.synthesize), the offset of
+the voice in the output (in output samples) and a linear gain. Rather than
+synthesizing each voice into its own array and summing those, the sample rate
+converter of each voice adds its scaled samples straight into the output as
+they are produced, so memory use depends on the length of the output and not
+on the number of voices:
+
+    out = mixdown([(adult, frames_a, 0, 1.), (child, frames_b, 4410, .5)],
+                  processes=4)
+
+With more than one process, each worker process mixes its voices into its own
+shared partial buffer, and the partial buffers are summed at the end.
+'''
+
+import logging
+import math
+import multiprocessing
+import numpy
+
+import gnuspeech
+import tube
+
+
+def voice_length(parameters, frames):
+    '''Return an upper bound on the number of output samples of a voice.'''
+    seconds = float(len(frames)) / parameters.control_rate_hz
+    return int(math.ceil(seconds * parameters.sample_rate_hz))
+
+
+def mix_voice(output, parameters, frames, start=0, gain=1., engine='fast'):
+    '''Synthesize one voice and add it into output (a float64 numpy array).
+
+    Samples that would fall beyond the end of output are dropped. Returns the
+    number of samples that were mixed in.
+    '''
+    assert start >= 0, 'voices cannot start before the output'
+    assert output.dtype == numpy.float64 and output.flags.c_contiguous
+    if start >= len(output):
+        return 0
+    model = tube.TubeModel(parameters, engine=engine)
+    converter = model._model.sampleRateConverter
+    converter.outputBuffer = gnuspeech.double_array_from_address(
+        output.ctypes.data + output.itemsize * start)
+    converter.outputBufferSize = len(output) - start
+    converter.outputBufferCount = 0
+    converter.outputGain = gain
+    converter.outputAccumulate = 1
+    try:
+        gnuspeech.synthesize(model._model, model._control_data(frames))
+        return converter.outputBufferCount
+    finally:
+        converter.outputBuffer = None
+
+
+_worker = {}
+
+
+def _initialize_worker(voices, partials, counter, engine):
+    '''Claim one of the partial buffers for this worker process.'''
+    with counter.get_lock():
+        index = counter.value
+        counter.value += 1
+    _worker.update(
+        voices=voices,
+        output=numpy.frombuffer(partials[index], dtype=numpy.float64),
+        engine=engine)
+
+
+def _mix(index):
+    w = _worker
+    parameters, frames, start, gain = w['voices'][index]
+    return mix_voice(w['output'], parameters, frames, start, gain, w['engine'])
+
+
+def mixdown(voices, length=None, processes=1, engine='fast'):
+    '''Synthesize voices and mix them into one array of samples.
+
+    voices: A sequence of (parameters, frames, start, gain) tuples. All voices
+      must use the same output sample rate.
+    length: Number of output samples. Defaults to the end of the last voice.
+    processes: Number of worker processes. With 1 (the default) all voices are
+      mixed in this process.
+    engine: The synthesis engine (see TubeModel). The reference engine keeps
+      filter memory in statics, so with it each voice depends on the voices
+      mixed before it in the same process, and the output changes with the
+      number of processes.
+
+    Returns a float64 numpy array of unscaled samples.
+    '''
+    voices = list(voices)
+    if not voices:
+        return numpy.zeros(length or 0, dtype=numpy.float64)
+    rates = set(parameters.sample_rate_hz for parameters, _, _, _ in voices)
+    assert len(rates) == 1, 'voices have different sample rates: %s' % sorted(rates)
+    if length is None:
+        length = max(start + voice_length(parameters, frames)
+                     for parameters, frames, start, _ in voices)
+
+    processes = min(processes or multiprocessing.cpu_count(), len(voices))
+    if processes <= 1:
+        output = numpy.zeros(length, dtype=numpy.float64)
+        for parameters, frames, start, gain in voices:
+            mix_voice(output, parameters, frames, start, gain, engine)
+        return output
+
+    partials = [multiprocessing.RawArray('d', length) for _ in range(processes)]
+    pool = multiprocessing.Pool(
+        processes, _initialize_worker,
+        (voices, partials, multiprocessing.Value('i', 0), engine))
+    try:
+        mixed = sum(pool.imap_unordered(_mix, range(len(voices))))
+        pool.close()
+    except:
+        pool.terminate()
+        raise
+    finally:
+        pool.join()
+    logging.debug('mixed %d samples from %d voices', mixed, len(voices))
+
+    output = numpy.frombuffer(partials[0], dtype=numpy.float64)
+    for partial in partials[1:]:
+        output += numpy.frombuffer(partial, dtype=numpy.float64)
+    return output
@@ -0,0 +1,197 @@
+# Copyright (c) 2011 Leif Johnson <leif@leifjohnson.net>
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+'''Plan short phone sequences that cover a set of units with little waste.
+
+Synthesizing every VCV or CVC triple as its own utterance renders each posture
+several times over: a unit of k postures costs k postures of audio, even though
+the units of a corpus overlap heavily. This module instead chains units
+together so that consecutive units share postures. For example, the diphones
+(a, b), (b, c) and (c, a) are all covered by the single sequence a b c a, and
+the VCV units (a, t, i) and (i, k, a) by a t i k a.
+
+Units are rows of posture ids, as returned by Repertoire.query(), and packing
+them is a matter of covering every edge of a graph whose nodes are the postures
+that consecutive units share, and whose edges are the units. pack() finds the
+fewest trails that use every edge exactly once (an Euler path decomposition),
+then cuts trails that are longer than the allowed sequence length. plan() does
+all of this for a repertoire and returns sequences of posture symbols:
+
+    for symbols in plan(repertoire, 'vocoid', '-vocoid', 'vocoid', repeats=2):
+        frames = repertoire.interpolate(250., symbols)
+'''
+
+import collections
+import itertools
+import numpy
+import numpy.random as rng
+
+
+def category_units(repertoire, categories=None, seed=None):
+    '''Return diphone units that cover every ordered pair of categories.
+
+    For each ordered pair of categories (c1, c2), one pair of postures is
+    picked at random from the postures in c1 and c2. Returns an (N, 2) array of
+    posture ids, one row for each pair of categories that both have postures.
+    '''
+    index = repertoire.index
+    categories = categories or index.categories
+    state = rng.RandomState(seed)
+    rows = []
+    for c1, c2 in itertools.product(categories, repeat=2):
+        rows.extend(index.sample(1, c1, c2, rng=state) if
+                    index.count(c1, c2) else [])
+    return numpy.array(rows, dtype=numpy.intp).reshape((len(rows), 2))
+
+
+def _trails(units, repeats, overlap):
+    '''Decompose the graph of units into the fewest edge-disjoint trails.
+
+    Each node of the graph is a sequence of `overlap` postures, and each unit
+    is an edge from its first to its last `overlap` postures, repeated the
+    given number of times. Nodes that start more edges than they end (or the
+    reverse) can only be covered by trails that start (or end) there, so the
+    graph is balanced with virtual edges from each node with extra ends to a
+    node with extra starts. An Euler circuit of each component of the balanced
+    graph, cut at the virtual edges, then gives the smallest possible number of
+    trails.
+
+    Returns a list of trails, each a pair (first node, list of the postures
+    that each edge adds after the overlap).
+    '''
+    edges = collections.defaultdict(list)
+    balance = collections.defaultdict(int)
+    for unit in units:
+        unit = tuple(unit)
+        prefix, suffix = unit[:overlap], unit[-overlap:]
+        edges[prefix].extend([(suffix, unit[overlap:])] * repeats)
+        balance[prefix] += repeats
+        balance[suffix] -= repeats
+
+    starts = [n for n, b in sorted(balance.items()) for _ in range(max(0, b))]
+    ends = [n for n, b in sorted(balance.items()) for _ in range(max(0, -b))]
+    for end, start in zip(ends, starts):
+        edges[end].append((start, None))
+
+    trails = []
+    for node in starts + sorted(edges):
+        if not edges[node]:
+            continue
+        # iterative hierholzer: each stack entry is a node and the postures of
+        # the edge used to reach it, None for a virtual edge.
+        stack = [(node, None)]
+        circuit = []
+        while stack:
+            current = stack[-1][0]
+            if edges[current]:
+                stack.append(edges[current].pop())
+            else:
+                circuit.append(stack.pop())
+        circuit.reverse()
+        cut = [(circuit[0][0], [])]
+        for next_, tail in circuit[1:]:
+            if tail is None:
+                cut.append((next_, []))
+            else:
+                cut[-1][1].append(tail)
+        # the circuit closes on its first node, so unless that last edge was
+        # virtual, the last trail continues into the first.
+        if len(cut) > 1 and circuit[-1][1] is not None:
+            first, tails = cut.pop()
+            cut[0] = (first, tails + cut[0][1])
+        trails.extend(t for t in cut if t[1])
+    return trails
+
+
+def _pack(units, repeats, max_length, overlap):
+    sequences = []
+    for first, tails in _trails(units, repeats, overlap):
+        sequence = list(first)
+        for tail in tails:
+            if max_length and len(sequence) + len(tail) > max_length:
+                sequences.append(sequence)
+                sequence = sequence[-overlap:]
+            sequence.extend(tail)
+        sequences.append(sequence)
+    return sequences
+
+
+def pack(units, repeats=1, max_length=None, overlap=None):
+    '''Pack units of posture ids into as few and short sequences as possible.
+
+    units: An (N, k) array of posture ids, one unit in each row.
+    repeats: Number of times each unit should occur in the output.
+    max_length: Largest number of postures in a sequence, or None for no limit.
+      Sequences that are cut to fit overlap by one unit's worth of postures, so
+      that no unit is lost at the cut.
+    overlap: Number of postures that consecutive units share. Diphones and
+      arbitrary triphones chain best when consecutive units share k - 1
+      postures, but VCV units only chain by sharing a vowel. By default, every
+      overlap from 1 to k - 1 is tried and the shortest packing is returned.
+
+    Returns a list of sequences, each a list of posture ids. Every unit occurs
+    in the sequences at least `repeats` times; units can also turn up where two
+    others join, e.g. the CVC unit in the middle of two chained VCV units.
+    '''
+    units = numpy.asarray(units)
+    if not len(units):
+        return []
+    k = units.shape[1]
+    assert k >= 2, 'units must have at least two postures'
+    assert max_length is None or max_length >= k, \
+        'max_length must be at least the length of a unit'
+    units = units.tolist()
+    best = None
+    for o in ([overlap] if overlap else range(k - 1, 0, -1)):
+        sequences = _pack(units, repeats, max_length, o)
+        if best is None or sum(map(len, sequences)) < sum(map(len, best)):
+            best = sequences
+    return best
+
+
+def coverage(sequences, k):
+    '''Count the occurrences of each k-gram in a collection of sequences.'''
+    counts = collections.defaultdict(int)
+    for sequence in sequences:
+        sequence = tuple(sequence)
+        for i in range(len(sequence) - k + 1):
+            counts[sequence[i:i + k]] += 1
+    return counts
+
+
+def plan(repertoire, *pattern, **kwargs):
+    '''Plan posture sequences that cover every unit matching a pattern.
+
+    The pattern is given as for Repertoire.query, one element per posture of a
+    unit: plan(repertoire, None, None) covers all diphones, and
+    plan(repertoire, 'vocoid', '-vocoid', 'vocoid') all VCV triples. Alternatively, pass units=
+    an (N, k) array of posture ids, for instance from category_units().
+    Remaining keyword arguments (repeats, max_length, overlap) are passed to
+    pack().
+
+    Returns a list of sequences of posture symbols, each ready for
+    Repertoire.interpolate.
+    '''
+    units = kwargs.pop('units', None)
+    if units is None:
+        units = repertoire.query(*pattern)
+    kwargs.setdefault('max_length', 20)
+    symbols = repertoire.index.symbols
+    return [list(symbols[s]) for s in pack(units, **kwargs)]
@@ -25,9 +25,7 @@ import logging
 import numpy
 import numpy.random as rng
 import os
-import scipy.interpolate
-
-from xml.dom import minidom
+import random
 
 import tube
 
@@ -198,6 +196,209 @@ class GaussianPosture(Posture):
 
 DIPHONES_MXML = os.path.join(os.path.dirname(__file__), 'diphones.mxml')
 
+class CategoryIndex(object):
+    '''A bitmask index of the categories of a group of postures.
+
+    Each posture gets an integer id (its position in the sorted list of posture
+    symbols), and each category a bit. The categories of every posture are
+    stored as one integer mask in a numpy array, so finding all postures that
+    match a category pattern is a couple of vectorized bitwise operations.
+
+    A pattern element is a category name ('vocoid'), a name prefixed with '-'
+    for postures that lack the category ('-vocoid'), a sequence of such names
+    that must all hold (('contoid', 'stopped', '-voiced')), or None for any
+    posture.
+    '''
+
+    def __init__(self, postures):
+        self.symbols = numpy.array(sorted(postures), dtype=object)
+        self.postures = [postures[s] for s in self.symbols]
+        self.categories = sorted(set().union(*(p.categories for p in self.postures)))
+        assert len(self.categories) <= 64, 'too many categories for a bitmask'
+        self.bits = dict((c, 1 << i) for i, c in enumerate(self.categories))
+        self.masks = numpy.array(
+            [sum(self.bits[c] for c in p.categories) for p in self.postures],
+            dtype=numpy.uint64)
+        self.signature = CategoryIndex.signature_of(postures)
+
+    def __len__(self):
+        return len(self.symbols)
+
+    @staticmethod
+    def signature_of(postures):
+        '''Return a value that changes whenever a group of postures does.
+
+        The signature covers which posture object is stored under each symbol
+        and the categories of each posture, which is everything an index is
+        built from.
+        '''
+        return [(s, id(p), frozenset(p.categories))
+                for s, p in postures.iteritems()]
+
+    def _masks(self, element):
+        '''Return (required, excluded) bitmasks for one pattern element.'''
+        if element is None:
+            return 0, 0
+        if isinstance(element, basestring):
+            element = (element, )
+        required = excluded = 0
+        for name in element:
+            if name.startswith('-'):
+                excluded |= self.bits.get(name[1:], 0)
+            elif name in self.bits:
+                required |= self.bits[name]
+            else:
+                # nothing has an unknown category.
+                required |= 1 << 64
+        return required, excluded
+
+    def ids(self, element):
+        '''Return a numpy array of the ids of postures matching one element.'''
+        required, excluded = self._masks(element)
+        if required >> 64:
+            return numpy.zeros((0, ), dtype=numpy.intp)
+        required = numpy.uint64(required)
+        excluded = numpy.uint64(excluded)
+        match = ((self.masks & required) == required) & ((self.masks & excluded) == 0)
+        return numpy.flatnonzero(match)
+
+    def query(self, *pattern):
+        '''Return all id tuples that match a pattern, as rows of an array.'''
+        ids = [self.ids(e) for e in pattern]
+        if not ids or not all(len(i) for i in ids):
+            return numpy.zeros((0, len(ids)), dtype=numpy.intp)
+        grid = numpy.meshgrid(*ids, indexing='ij')
+        return numpy.column_stack([g.ravel() for g in grid])
+
+    def count(self, *pattern):
+        '''Return the number of id tuples that match a pattern.'''
+        return int(numpy.prod([len(self.ids(e)) for e in pattern]))
+
+    def sample(self, count, *pattern, **kwargs):
+        '''Draw random id tuples that match a pattern, as rows of an array.
+
+        The tuples are drawn without building the full product of matching ids.
+        Pass replace=False to draw distinct tuples (count must not exceed the
+        number of matches), and rng=numpy.random.RandomState(seed) to draw
+        reproducibly.
+        '''
+        state = kwargs.get('rng') or rng
+        ids = [self.ids(e) for e in pattern]
+        if not ids:
+            return numpy.zeros((0, 0), dtype=numpy.intp)
+        sizes = [len(i) for i in ids]
+        if kwargs.get('replace', True):
+            assert all(sizes) or not count, 'no postures match %r' % (pattern, )
+            return numpy.column_stack(
+                [i[state.randint(len(i), size=count)] for i in ids]
+                ).reshape((count, len(ids))).astype(numpy.intp)
+        total = int(numpy.prod(sizes))
+        assert count <= total, 'only %d tuples match %r' % (total, pattern)
+        flat = random.Random(state.randint(1 << 30)).sample(xrange(total), count)
+        index = numpy.unravel_index(numpy.array(flat, dtype=numpy.intp), sizes)
+        return numpy.column_stack(
+            [i[j] for i, j in zip(ids, index)]
+            ).reshape((count, len(ids))).astype(numpy.intp)
+
+
+class StreamingInterpolator(object):
+    '''Turns an unbounded stream of postures into control frames.
+
+    Every posture contributes two knots, where it is reached and where it is
+    left, and frames are sampled every 1000 / control_rate milliseconds along
+    a monotone piecewise cubic Hermite curve through the knots. The tangent at
+    each knot is the Fritsch-Carlson harmonic mean of the neighbouring secants,
+    so a frame depends only on the two knots around it and one on either side.
+    Unlike the global spline in Repertoire.interpolate() the curve never
+    overshoots its targets, and an interval can be sampled as soon as the knot
+    after it is known: frames lag the input by a single posture, and only the
+    last four knots are kept in memory.
+
+    Call add() with each posture symbol as it arrives, and finish() at the end
+    of the stream; each returns a (possibly empty) numpy array with the frames
+    that became ready in its rows.
+    '''
+
+    # knots closer than this (in milliseconds) are nudged apart, so that a
+    # zero transition or duration gives a steep step rather than a 0 / 0.
+    MIN_SPACING = 1e-3
+
+    def __init__(self, repertoire, control_rate):
+        self.repertoire = repertoire
+        self.period = 1000. / control_rate
+        self.width = len(repertoire.parameters)
+        self.times = []
+        self.values = []
+        self.frame = 0
+
+    def add(self, symbol):
+        '''Adds the posture for a symbol, and returns the frames now ready.'''
+        posture = self.repertoire.postures[symbol]
+        targets = numpy.asarray(posture.targets, float)
+        t = 0.
+        if self.times:
+            t = self.times[-1] + posture.transition
+        ready = []
+        for t in (t, t + posture.duration):
+            if self.times:
+                t = max(t, self.times[-1] + self.MIN_SPACING)
+            self.times.append(t)
+            self.values.append(targets)
+            # the interval before the previous knot now has both tangents.
+            if len(self.times) > 2:
+                ready.append(self._sample(len(self.times) - 3))
+            if len(self.times) > 4:
+                del self.times[0], self.values[0]
+        return self._stack(ready)
+
+    def finish(self):
+        '''Flushes the frames up to and including the last knot.'''
+        ready = []
+        if len(self.times) > 1:
+            ready.append(self._sample(len(self.times) - 2))
+        if self.times and self.frame * self.period <= self.times[-1]:
+            ready.append(self.values[-1][None, :])
+            self.frame += 1
+        self.times = []
+        self.values = []
+        return self._stack(ready)
+
+    def _stack(self, ready):
+        if not ready:
+            return numpy.zeros((0, self.width))
+        return numpy.vstack(ready)
+
+    def _tangent(self, i):
+        '''Returns the Fritsch-Carlson tangent at knot i of the window.'''
+        if i == 0 or i == len(self.times) - 1:
+            return numpy.zeros(self.width)
+        t, v = self.times, self.values
+        h0, h1 = t[i] - t[i - 1], t[i + 1] - t[i]
+        d0 = (v[i] - v[i - 1]) / h0
+        d1 = (v[i + 1] - v[i]) / h1
+        w0, w1 = 2 * h1 + h0, h1 + 2 * h0
+        m = numpy.zeros(self.width)
+        ok = d0 * d1 > 0
+        m[ok] = (w0 + w1) / (w0 / d0[ok] + w1 / d1[ok])
+        return m
+
+    def _sample(self, i):
+        '''Samples the frames that fall between knots i and i + 1.'''
+        t0, t1 = self.times[i], self.times[i + 1]
+        stop = int(numpy.ceil(t1 / self.period))
+        if stop <= self.frame:
+            return numpy.zeros((0, self.width))
+        h = t1 - t0
+        s = ((numpy.arange(self.frame, stop) * self.period - t0) / h)[:, None]
+        self.frame = stop
+        s2 = s * s
+        s3 = s2 * s
+        return ((2 * s3 - 3 * s2 + 1) * self.values[i] +
+                (s3 - 2 * s2 + s) * h * self._tangent(i) +
+                (3 * s2 - 2 * s3) * self.values[i + 1] +
+                (s3 - s2) * h * self._tangent(i + 1))
+
+
 class Repertoire:
     '''A group of postures that are defined for the TRM.
 
@@ -216,11 +417,13 @@ class Repertoire:
         self.parameters = parameters or {}
         self.symbols = symbols or {}
         self.postures = postures or {}
+        self._index = None
 
         if xml_file:
             self.parse_xml(xml_file)
 
     def parse_xml(self, xml_file):
+        from xml.dom import minidom
         xml = minidom.parse(xml_file)
 
         # PARAMETERS
@@ -247,31 +450,56 @@ class Repertoire:
         for r in sorted(self.postures):
             logging.info(self.postures[r])
 
+        self._index = None
+
+    @property
+    def index(self):
+        '''A CategoryIndex of the postures in this repertoire.'''
+        if (self._index is None or self._index.signature !=
+                CategoryIndex.signature_of(self.postures)):
+            self._index = CategoryIndex(self.postures)
+        return self._index
+
+    def query(self, *pattern):
+        '''Return the posture ids of every sequence that matches a pattern.
+
+        Each element of the pattern describes one posture of the sequence (see
+        CategoryIndex). For example, query('vocoid', 'stopped', 'vocoid')
+        returns an array with a row of three posture ids for each vowel-stop-
+        vowel sequence. Use symbols_of() to look up the posture symbols.
+        '''
+        return self.index.query(*pattern)
+
+    def sample(self, count, *pattern, **kwargs):
+        '''Return posture ids of count random sequences matching a pattern.'''
+        return self.index.sample(count, *pattern, **kwargs)
+
+    def symbols_of(self, ids):
+        '''Return an array with the posture symbols for an array of ids.'''
+        return self.index.symbols[ids]
+
+    def _iter_pattern(self, *pattern):
+        index = self.index
+        return itertools.product(
+            *[[index.postures[i] for i in index.ids(e)] for e in pattern])
+
     def iter_vocoid(self):
         '''Iterate over all vocoid postures.'''
-        for p in self.postures.itervalues():
-            if p.is_vocoid:
-                yield p
+        for p, in self._iter_pattern('vocoid'):
+            yield p
 
     def iter_non_vocoid(self):
         '''Iterate over all non-vocoid postures.'''
-        for p in self.postures.itervalues():
-            if not p.is_vocoid:
-                yield p
+        for p, in self._iter_pattern('-vocoid'):
+            yield p
 
     def iter_vcv(self):
         '''Iterate over triples of vowel-consonant-vowel postures.'''
-        for p1 in self.iter_vocoid():
-            for p2 in self.iter_non_vocoid():
-                for p3 in self.iter_vocoid():
-                    yield p1, p2, p3
+        return self._iter_pattern('vocoid', '-vocoid', 'vocoid')
 
     def iter_cvc(self):
         '''Iterate over triples of consonant-vowel-consonant postures.'''
-        for p1 in self.iter_non_vocoid():
-            for p2 in self.iter_vocoid():
-                for p3 in self.iter_non_vocoid():
-                    yield p1, p2, p3
+        return self._iter_pattern('-vocoid', 'vocoid', '-vocoid')
 
     def create_gaussian(self, *args, **kwargs):
         '''Create a gaussianized version of the postures in this repertoire.'''
@@ -286,6 +514,7 @@ class Repertoire:
     def interpolate(self, control_rate, *symbols):
         '''Given a sequence of posture symbols, produces interpolated control frames.
         '''
+        import scipy.interpolate
         times = []
         postures = []
         for symbol in itertools.chain.from_iterable(symbols):
@@ -303,3 +532,41 @@ class Repertoire:
             scipy.interpolate.UnivariateSpline(times, p, k=3)
             for p in numpy.array(postures).T]
         return numpy.array([s(t) for s in interpolators]).T
+
+    def stream(self, control_rate, *symbols):
+        '''Given posture symbols, generates control frames one at a time.
+
+        Unlike interpolate(), this never holds the whole utterance: symbols are
+        consumed lazily through a StreamingInterpolator, so the input may be
+        an endless iterable (e.g. repeated Babbler.generate() calls), and the
+        frames can be passed straight to loudness.stream() or a BlockRenderer.
+        '''
+        interp = StreamingInterpolator(self, control_rate)
+        for symbol in itertools.chain.from_iterable(symbols):
+            for frame in interp.add(symbol):
+                yield frame
+        for frame in interp.finish():
+            yield frame
+
+    def keyframes(self, *symbols):
+        '''Given a sequence of posture symbols, produces sparse keyframes.
+
+        Returns a pair (times, frames): the time of each keyframe in seconds,
+        and a numpy array with the control values of each keyframe in its rows.
+        Each posture contributes a keyframe where it is reached and another
+        where it is left, and TubeModel.synthesize_keyframes ramps linearly
+        between them, so the output has a handful of rows per posture rather
+        than one per control period as from interpolate().
+        '''
+        times = []
+        frames = []
+        for symbol in itertools.chain.from_iterable(symbols):
+            posture = self.postures[symbol]
+            t = 0.
+            if times:
+                t = times[-1] + posture.transition
+            times.append(t)
+            frames.append(posture.targets)
+            times.append(times[-1] + posture.duration)
+            frames.append(posture.targets)
+        return numpy.array(times) / 1000., numpy.array(frames)
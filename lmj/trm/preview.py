@@ -0,0 +1,266 @@
+# Copyright (c) 2011 Leif Johnson <leif@leifjohnson.net>
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+'''Preview phone sequences by concatenating pre-rendered posture audio.
+
+A full render runs the tube for every sample of an utterance. For quick
+auditioning, a PreviewEngine instead renders each posture of a repertoire once
+(holding it steady), and optionally each posture pair (moving from one to the
+other), into a cache of short audio units for one set of tube Parameters. A
+preview is then just an overlap-add of short windowed grains taken from these
+units: each posture's hold is stretched or squeezed to posture.duration, and
+each transition to the next posture's transition time, so a long sequence is
+assembled in a few milliseconds once its units are cached:
+
+    engine = PreviewEngine(repertoire, parameters, diphones=True)
+    samples = engine.preview('hh e l uu'.split())
+
+Without diphones, transitions are crossfades between the two steady units,
+which blurs consonants; with diphones, the first use of each pair renders a
+real tube transition. The timeline is the same as for Repertoire.keyframes(),
+and render() runs the full tube on it for final output.
+
+As for diphones.DiphoneCache, units are rendered from a single draw of
+posture.targets, so a gaussian repertoire has one draw frozen into each unit.
+'''
+
+import itertools
+import numpy
+
+import diphones
+import tube
+
+
+class PreviewEngine(object):
+    '''A cache of rendered posture units, and overlap-add previews from it.'''
+
+    def __init__(self, repertoire, parameters, diphones=False, engine='fast',
+                 unit_ms=200., grain_ms=20., warmup_ms=50.):
+        '''Initialize a preview engine.
+
+        repertoire: The postures.Repertoire that provides the postures.
+        parameters: The tube.Parameters that units are rendered with.
+        diphones: If True, transitions are taken from rendered posture pairs
+          rather than crossfaded between steady postures.
+        engine: The tube engine used to render units.
+        unit_ms: Length of the steady unit rendered for each posture.
+        grain_ms: Length of the overlap-add grains; grains overlap by half.
+        warmup_ms: Time that the tube runs before a unit starts, so that the
+          onset from rest is not part of the unit.
+        '''
+        self.repertoire = repertoire
+        self.parameters = parameters
+        self.diphones = diphones
+        self.sample_rate = parameters.sample_rate_hz
+        self.control_rate = parameters.control_rate_hz
+        self.unit_ms = unit_ms
+        self.warmup_ms = warmup_ms
+        # the hop between grains is half a grain, so that periodic hann
+        # windows add up to exactly one.
+        self.hop = max(1, int(round(grain_ms * self.sample_rate / 2000.)))
+        self.window = 0.5 - 0.5 * numpy.cos(
+            numpy.pi * numpy.arange(2 * self.hop) / self.hop)
+        self.engine = engine
+        self.clear()
+
+    def __len__(self):
+        return len(self._units)
+
+    def __contains__(self, key):
+        return key in self._units
+
+    def clear(self):
+        '''Drop all cached units.'''
+        self._units = {}
+        self._pieces = []
+        self._bank = numpy.zeros(0)
+
+    def _samples(self, ms):
+        return int(round(ms * self.sample_rate / 1000.))
+
+    @property
+    def _margin_ms(self):
+        '''Time rendered past the end of a unit: the padding, plus a couple
+        of control periods, since the last frame only ends the output.'''
+        return 2000. * self.hop / self.sample_rate + 2000. / self.control_rate
+
+    def _render(self, frames, start, length):
+        '''Render control frames, and cut a padded unit out of the output.
+
+        The unit holds length samples from start, plus a hop on either side,
+        so that a grain centred anywhere in the unit stays inside it.
+        '''
+        # a model's output accumulates from one synthesize() call to the next,
+        # so each unit gets a fresh one.
+        model = tube.TubeModel(self.parameters, engine=self.engine)
+        samples = numpy.asarray(model.synthesize(frames))
+        unit = samples[start - self.hop:start + length + self.hop]
+        assert len(unit) == length + 2 * self.hop, 'unit rendered too short'
+        return unit
+
+    def _posture_unit(self, symbol):
+        targets = self.repertoire.postures[symbol].targets
+        span = self.warmup_ms + self.unit_ms + self._margin_ms
+        frames = diphones.transition_block(
+            targets, None, span, 0, self.control_rate)
+        return self._render(frames, self._samples(self.warmup_ms),
+                            self._samples(self.unit_ms))
+
+    def _diphone_unit(self, a, b):
+        source = self.repertoire.postures[a].targets
+        target = self.repertoire.postures[b]
+        transition = max(target.transition, 1000. / self.control_rate)
+        tail = self._margin_ms
+        frames = numpy.vstack([
+            diphones.transition_block(source, target.targets, self.warmup_ms,
+                                      transition, self.control_rate),
+            diphones.transition_block(target.targets, None, tail, 0,
+                                      self.control_rate)])
+        return self._render(frames, self._samples(self.warmup_ms),
+                            self._samples(transition))
+
+    def unit(self, a, b=None):
+        '''Return the (offset, length) of a unit in the bank, rendering it if
+        it is not cached yet.
+
+        a: Symbol of the posture.
+        b: Symbol of the following posture, for the transition unit from a to
+          b, or None for the steady unit of a.
+
+        The unit's samples are bank[offset:offset + length + 2 * hop]: the
+        first and last hop samples are padding for the grains at its ends.
+        '''
+        key = a if b is None else (a, b)
+        if key not in self._units:
+            if b is None:
+                samples = self._posture_unit(a)
+            else:
+                samples = self._diphone_unit(a, b)
+            self._units[key] = (sum(len(p) for p in self._pieces),
+                                len(samples) - 2 * self.hop)
+            self._pieces.append(samples)
+        return self._units[key]
+
+    @property
+    def bank(self):
+        '''All rendered units, concatenated into one array.'''
+        if len(self._bank) != sum(len(p) for p in self._pieces):
+            self._bank = numpy.concatenate(self._pieces)
+        return self._bank
+
+    def prepare(self, symbols=None):
+        '''Render the units for some postures ahead of time.
+
+        symbols: Posture symbols to render; defaults to the whole repertoire.
+          With diphones, the units for every ordered pair of these postures are
+          rendered too.
+        '''
+        if symbols is None:
+            symbols = sorted(self.repertoire.postures)
+        symbols = list(symbols)
+        for a in symbols:
+            self.unit(a)
+        if self.diphones:
+            for a, b in itertools.product(symbols, repeat=2):
+                self.unit(a, b)
+
+    def segments(self, *symbols):
+        '''Lay out the preview of a sequence of posture symbols.
+
+        Returns a list of (start, length, first, second) tuples, in samples,
+        one for each posture hold and each transition. first is the unit that
+        the segment is taken from, and second is the unit that it crossfades
+        into (None for holds and diphone transitions).
+        '''
+        segments = []
+        start = 0
+        previous = None
+        for symbol in itertools.chain.from_iterable(symbols):
+            posture = self.repertoire.postures[symbol]
+            if previous is not None:
+                length = self._samples(posture.transition)
+                if length > 0:
+                    if self.diphones:
+                        unit = (self.unit(previous, symbol), None)
+                    else:
+                        unit = (self.unit(previous), self.unit(symbol))
+                    segments.append((start, length) + unit)
+                    start += length
+            length = self._samples(posture.duration)
+            if length > 0:
+                segments.append((start, length, self.unit(symbol), None))
+                start += length
+            previous = symbol
+        return segments
+
+    def preview(self, *symbols):
+        '''Given a sequence of posture symbols, produces preview audio.
+
+        Symbols are given as for Repertoire.interpolate. Returns a numpy array
+        of samples at the output sample rate of the parameters, unscaled like
+        the output of TubeModel.synthesize.
+        '''
+        segments = self.segments(*symbols)
+        if not segments:
+            return numpy.zeros(0)
+        bank = self.bank
+        hop = self.hop
+        total = segments[-1][0] + segments[-1][1]
+
+        # each grain covers output samples k * hop .. (k + 2) * hop, and is
+        # taken from the segment that its centre falls in, at the same
+        # relative position within the segment's unit.
+        count = total // hop + 1
+        centres = numpy.arange(count) * hop + hop
+        starts = numpy.array([s[0] for s in segments])
+        index = numpy.searchsorted(starts, centres, side='right') - 1
+        lengths = numpy.array([s[1] for s in segments], float)
+        fraction = numpy.clip((centres - starts[index]) / lengths[index], 0, 1)
+
+        def positions(units):
+            offsets = numpy.array([u[0] for u in units])[index]
+            sizes = numpy.array([u[1] for u in units])[index]
+            return offsets + (fraction * sizes).astype(int)
+
+        grains = bank[positions([s[2] for s in segments])[:, None] +
+                      numpy.arange(2 * hop)]
+        crossfade = numpy.array([s[3] is not None for s in segments])[index]
+        if crossfade.any():
+            second = [s[3] or s[2] for s in segments]
+            mix = numpy.where(crossfade, diphones.smoothstep(fraction), 0.)
+            grains *= (1 - mix)[:, None]
+            grains += mix[:, None] * bank[
+                positions(second)[:, None] + numpy.arange(2 * hop)]
+        grains *= self.window
+
+        # grains overlap by half, so add the two halves into adjacent hops.
+        output = numpy.zeros((count + 1, hop))
+        output[:-1] += grains[:, :hop]
+        output[1:] += grains[:, hop:]
+        return output.ravel()[:total]
+
+    def render(self, *symbols):
+        '''Render a sequence of posture symbols with the full tube model.
+
+        The postures follow the same timeline as preview(), so the two can be
+        compared directly; this is the output to use once a sequence is final.
+        '''
+        times, frames = self.repertoire.keyframes(*symbols)
+        model = tube.TubeModel(self.parameters, engine=self.engine)
+        return numpy.asarray(model.synthesize_keyframes(times, frames))
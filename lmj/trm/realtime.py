@@ -0,0 +1,234 @@
+# Copyright (c) 2011 Leif Johnson <leif@leifjohnson.net>
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+'''Real-time, block-based synthesis with live control parameter automation.
+
+The TubeModel class renders a whole utterance from a queue of control frames.
+For interactive use (articulatory puppeteering, closed-loop learning agents)
+the BlockRenderer class instead produces fixed-size blocks of output samples,
+ramping the tube toward the most recent target frame over each block. Target
+frames are handed over from another thread through a FrameSlot.
+'''
+
+import ctypes
+import logging
+import math
+import numpy
+import threading
+import timeit
+
+import gnuspeech
+import tube
+
+
+def _as_ndarray(pointer, length):
+    '''Return a numpy array sharing memory with a SWIG double pointer.'''
+    buf = (ctypes.c_double * length).from_address(int(pointer))
+    return numpy.frombuffer(buf, dtype=numpy.float64)
+
+
+class FrameSlot(object):
+    '''A lock-free, single-producer single-consumer slot for control frames.
+
+    One thread calls put() with new target frames, while another thread calls
+    get() to copy out the latest one. Neither side ever waits on the other: the
+    frame is double-buffered, and a sequence counter lets the consumer notice if
+    the producer overwrote the frame it was reading, in which case the consumer
+    just tries again (or keeps its previous frame).
+    '''
+
+    def __init__(self, frame):
+        '''Initialize the slot with an initial frame of 16 control values.'''
+        self._frames = (numpy.array(frame, dtype=numpy.float64),
+                        numpy.array(frame, dtype=numpy.float64))
+        assert self._frames[0].shape == (tube.FRAME_SIZE, )
+        self._index = 0
+        self._sequence = 0
+        self._seen = 0
+
+    @property
+    def sequence(self):
+        '''The number of frames that have been put into this slot.'''
+        return self._sequence
+
+    def put(self, frame):
+        '''Publish a new target frame. Only call this from the producer.'''
+        back = 1 - self._index
+        self._frames[back][:] = frame
+        self._index = back
+        self._sequence += 1
+
+    def get(self, out, retries=3):
+        '''Copy the latest frame into out. Only call this from the consumer.
+
+        Returns True if a frame newer than the last one read was copied, False
+        if there was nothing new (or if every attempt was torn by concurrent
+        writes, in which case out is left alone).
+        '''
+        for _ in range(retries):
+            sequence = self._sequence
+            if sequence == self._seen:
+                return False
+            out[:] = self._frames[self._index]
+            # the producer flips between two buffers, so our read can only have
+            # been overwritten if at least two frames arrived in the meantime.
+            if self._sequence - sequence < 2:
+                self._seen = sequence
+                return True
+        return False
+
+
+class BlockRenderer(object):
+    '''Render fixed-size blocks of audio while control targets change live.
+
+    Each call to render() reads the latest target frame from the slot, ramps
+    the tube model toward it over the course of the block, and returns exactly
+    block_size output samples. All buffers are allocated up front, so the
+    render path does not allocate any arrays.
+
+    The renderer also measures how long each block takes to render. A block is
+    counted as a deadline miss if it took longer than the deadline, which by
+    default is the playing time of one block.
+    '''
+
+    def __init__(self, parameters, frame, block_size=256, deadline=None,
+                 history=1024, limiter=None, engine='fast'):
+        '''Initialize a block renderer.
+
+        parameters: A tube.Parameters object describing the tube.
+        frame: The initial frame of 16 control values (see TubeModel).
+        block_size: The number of output samples in each block.
+        deadline: Maximum render time for one block, in seconds. Defaults to
+          the duration of one block at the output sample rate.
+        history: Number of recent per-block render times to keep.
+        limiter: If given, a dictionary of settings for TubeModel.set_limiter,
+          so that blocks come out normalized and limited, ready to play.
+        engine: The synthesis engine (see TubeModel).
+        '''
+        self.parameters = parameters
+        self.block_size = block_size
+        self.deadline = deadline or float(block_size) / parameters.sample_rate_hz
+        self.slot = FrameSlot(frame)
+
+        self._model = tube.TubeModel(parameters, engine=engine)
+        if limiter is not None:
+            self._model.set_limiter(**limiter)
+        self._converter = self._model._model.sampleRateConverter
+        self._ratio = self._converter.sampleRateRatio
+
+        self._target_ptr = gnuspeech.new_double_array(tube.FRAME_SIZE)
+        self._target = _as_ndarray(self._target_ptr, tube.FRAME_SIZE)
+        self._target[:] = frame
+
+        # the converter can emit up to a ring buffer's worth of samples beyond
+        # what we ask for, so leave plenty of headroom.
+        size = 2 * block_size + int(4096 * math.ceil(self._ratio))
+        self._output_ptr = gnuspeech.new_double_array(size)
+        self._output = _as_ndarray(self._output_ptr, size)
+        self._converter.outputBuffer = self._output_ptr
+        self._converter.outputBufferSize = size
+        self._converter.outputBufferCount = 0
+
+        self._block = numpy.zeros(block_size, dtype=numpy.float64)
+
+        self.blocks = 0
+        self.misses = 0
+        self.render_times = numpy.zeros(history, dtype=numpy.float64)
+        self.last_render_time = 0.
+        self.max_render_time = 0.
+        self.total_render_time = 0.
+
+        # jump straight to the initial frame.
+        gnuspeech.synthesizeBlock(
+            self._model._model, parameters._params, self._target_ptr, 0)
+
+    def __del__(self):
+        '''Free up the memory for the C buffers.'''
+        self._converter.outputBuffer = None
+        gnuspeech.delete_double_array(self._output_ptr)
+        gnuspeech.delete_double_array(self._target_ptr)
+
+    def set_target(self, frame):
+        '''Set the target frame for subsequent blocks (producer side).'''
+        self.slot.put(frame)
+
+    def render(self):
+        '''Render one block of output samples.
+
+        Returns a numpy array of block_size samples. The array is reused for
+        every block, so copy it if you need to keep the samples around.
+        '''
+        start = timeit.default_timer()
+
+        self.slot.get(self._target)
+
+        model = self._model._model
+        params = self.parameters._params
+        converter = self._converter
+        n = self.block_size
+        count = converter.outputBufferCount
+        while count < n:
+            steps = int(math.ceil((n - count) / self._ratio))
+            gnuspeech.synthesizeBlock(model, params, self._target_ptr, steps)
+            count = converter.outputBufferCount
+        assert count < converter.outputBufferSize, 'output buffer overflow'
+
+        # hand out one block, and move any leftover samples to the front.
+        self._block[:] = self._output[:n]
+        address = self._output.ctypes.data
+        ctypes.memmove(address, address + 8 * n, 8 * (count - n))
+        converter.outputBufferCount = count - n
+
+        elapsed = timeit.default_timer() - start
+        self.render_times[self.blocks % len(self.render_times)] = elapsed
+        self.last_render_time = elapsed
+        self.total_render_time += elapsed
+        if elapsed > self.max_render_time:
+            self.max_render_time = elapsed
+        if elapsed > self.deadline:
+            self.misses += 1
+        self.blocks += 1
+
+        return self._block
+
+    def stats(self):
+        '''Return a dictionary summarizing block render times (in seconds).'''
+        return dict(
+            blocks=self.blocks,
+            misses=self.misses,
+            deadline=self.deadline,
+            last=self.last_render_time,
+            max=self.max_render_time,
+            mean=self.total_render_time / max(1, self.blocks))
+
+    def run(self, callback, stop=None):
+        '''Render blocks and pass each one to callback until stop is set.
+
+        callback: A callable that accepts a block of samples, e.g. a function
+          that writes the block to an audio device.
+        stop: A threading.Event that ends the loop once it is set. If None, the
+          loop continues until callback returns False.
+        '''
+        stop = stop or threading.Event()
+        while not stop.is_set():
+            if callback(self.render()) is False:
+                break
+        logging.debug('rendered %(blocks)d blocks, %(misses)d deadline misses, '
+                      'max %(max).4fs, mean %(mean).4fs', self.stats())
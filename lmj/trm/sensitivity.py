@@ -0,0 +1,185 @@
+# Copyright (c) 2011 Leif Johnson <leif@leifjohnson.net>
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+'''Finite-difference sensitivity of audio features to control frames.
+
+The sensitivity of a feature of the output (say, the spectrum of a frame) to
+each control value of each frame around a trajectory can be estimated by
+rendering many copies of the frames, each with one value nudged, and comparing
+their features with those of the unperturbed render. Rendering every copy from
+scratch costs one full synthesis per perturbation, even though each copy is
+identical to the unperturbed render up to the perturbed frame, and nearly so
+shortly after it.
+
+jacobian() renders the unperturbed frames once with a leader model, keeping
+the result, and then again frame by frame. When the leader reaches a frame
+with perturbations, its state is copied into a scratch model
+(TubeModel.copy_from), which renders the perturbed frame and a short horizon
+after it. The perturbed output is the unperturbed render with that stretch
+spliced in, so each perturbation costs a few frames of synthesis rather than
+a full render.
+
+The horizon assumes that the effect of a perturbation dies away with the tube
+memory, which holds for all controls but the pitch: a pitch change shifts the
+phase of the glottal pulse for the rest of the render. Pitch perturbations are
+therefore rendered to the end (see the persistent argument), and with
+horizon=None every perturbation is, which makes the results exact.
+'''
+
+import math
+import numpy
+
+import gnuspeech
+import tube
+
+# default finite-difference steps for each control value: semitones, dB, dB,
+# dB, cm, Hz, Hz, then cm for the 8 radii and the velum.
+STEPS = (0.1, 0.5, 0.5, 0.5, 0.05, 10., 10.) + (0.01, ) * 9
+
+
+class _Renderer(object):
+    '''A fast-engine tube model that renders frames into a numpy buffer.'''
+
+    def __init__(self, parameters, frames):
+        self.parameters = parameters
+        self.model = tube.TubeModel(parameters, engine='fast')
+        converter = self.model._model.sampleRateConverter
+        ratio = converter.sampleRateRatio
+        # the converter can emit up to a ring buffer's worth of samples beyond
+        # the frames, so leave plenty of headroom.
+        size = int(math.ceil(
+            (frames + 2) * self.model._model.controlPeriod * ratio)) + \
+            int(4096 * math.ceil(ratio))
+        self.output = numpy.zeros(size)
+        self.converter = converter
+        converter.outputBuffer = gnuspeech.double_array_from_address(
+            self.output.ctypes.data)
+        converter.outputBufferSize = size
+        converter.outputBufferCount = 0
+
+    def __del__(self):
+        self.converter.outputBuffer = None
+
+    @property
+    def count(self):
+        return self.converter.outputBufferCount
+
+    def reset(self):
+        '''Start a new output, keeping the synthesis state.'''
+        self.converter.outputBufferCount = 0
+
+    def render(self, frame, first=False):
+        '''Ramp to a frame (a float64 numpy row) over one control period, or
+        jump straight to it if it is the first frame.'''
+        samples = 0 if first else self.model._model.controlPeriod
+        gnuspeech.synthesizeBlock(
+            self.model._model, self.parameters._params,
+            gnuspeech.double_array_from_address(frame.ctypes.data), samples)
+
+    def finish(self):
+        '''Flush the samples still held by the converter.'''
+        gnuspeech.finishSynthesis(self.model._model)
+        assert self.count < len(self.output), 'output buffer overflow'
+        return self.output[:self.count]
+
+
+def jacobian(parameters, frames, feature, perturbations=None, steps=STEPS,
+             horizon=0.05, persistent=(0, )):
+    '''Estimate the sensitivity of an audio feature to each control value.
+
+    parameters: The tube.Parameters to render with (on the fast engine).
+    frames: A (frames, 16) array of control frames, as for
+      TubeModel.synthesize.
+    feature: A function that maps an array of output samples to a numpy
+      array of features. It gets a new array for each perturbation.
+    perturbations: A sequence of (frame, control) index pairs to perturb.
+      Defaults to every control value of every frame.
+    steps: The finite-difference step for each of the 16 control values, or
+      a single step for all of them.
+    horizon: Seconds of output rendered for a perturbation after the ramp out
+      of the perturbed frame, or None to render to the end.
+    persistent: Indices of the controls whose perturbations are always
+      rendered to the end, since their effect does not die away. Defaults to
+      the pitch.
+
+    Returns an array with the forward difference (feature(perturbed) -
+    feature(unperturbed)) / step of each perturbation. Its shape is (frames,
+    16) + the feature shape by default, or (perturbations, ) + the feature
+    shape for an explicit sequence of perturbations.
+    '''
+    frames = numpy.array(frames, dtype=numpy.float64, order='C')
+    count = len(frames)
+    assert frames.ndim == 2 and frames.shape[1] == tube.FRAME_SIZE, \
+        'frames must have %d control values' % tube.FRAME_SIZE
+    steps = numpy.asarray(steps, float) * numpy.ones(tube.FRAME_SIZE)
+
+    shape = None
+    if perturbations is None:
+        shape = (count, tube.FRAME_SIZE)
+        perturbations = [(k, c) for k in range(count)
+                         for c in range(tube.FRAME_SIZE)]
+    perturbations = list(perturbations)
+    by_frame = {}
+    for i, (k, c) in enumerate(perturbations):
+        assert 0 <= k < count and 0 <= c < tube.FRAME_SIZE, \
+            'no control %r in frame %r' % (c, k)
+        by_frame.setdefault(k, []).append((i, c))
+
+    span = count
+    if horizon is not None:
+        span = max(1, int(math.ceil(horizon * parameters.control_rate_hz)))
+
+    # render the unperturbed frames once to get the output to splice into.
+    leader = _Renderer(parameters, count)
+    for k in range(count):
+        leader.render(frames[k], first=k == 0)
+    baseline = leader.finish().copy()
+    reference = numpy.asarray(feature(baseline), float)
+    result = numpy.zeros((len(perturbations), ) + reference.shape)
+
+    persistent = set(persistent)
+    leader = _Renderer(parameters, count)
+    scratch = _Renderer(parameters, count if persistent else span + 2)
+    row = numpy.zeros(tube.FRAME_SIZE)
+    for k in range(count):
+        start = leader.count
+        for i, c in by_frame.get(k, ()):
+            scratch.model.copy_from(leader.model)
+            scratch.reset()
+            row[:] = frames[k]
+            row[c] += steps[c]
+            scratch.render(row, first=k == 0)
+            # a frame is the target of the ramp into it and the start of the
+            # ramp out of it, so the horizon starts after the next frame.
+            end = count if c in persistent else min(count, k + 1 + span)
+            for j in range(k + 1, end):
+                scratch.render(frames[j])
+            if end == count:
+                output = numpy.concatenate([baseline[:start], scratch.finish()])
+            else:
+                output = baseline.copy()
+                stop = min(len(output), start + scratch.count)
+                output[start:stop] = scratch.output[:stop - start]
+            output = numpy.asarray(feature(output), float)
+            result[i] = (output - reference) / steps[c]
+        leader.render(frames[k], first=k == 0)
+
+    if shape is not None:
+        result = result.reshape(shape + reference.shape)
+    return result
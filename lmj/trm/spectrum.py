@@ -0,0 +1,228 @@
+# Copyright (c) 2011 Leif Johnson <leif@leifjohnson.net>
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+'''Frequency-domain analysis of static tube configurations.
+
+The functions here evaluate the transfer function of the same waveguide that
+vocalTract() simulates in the time domain -- the 10-section oropharynx, the
+three-way junction with the nasal branch at the velum, the 6-section nasal
+cavity, and the mouth and nose reflection/radiation filters -- analytically in
+the z-domain. Instead of rendering audio and analyzing it, each frequency is
+handled by a backward recursion for the reflectance seen at each section,
+followed by a forward pass for the wave amplitudes, all vectorized over any
+number of tube configurations at once.
+
+Usage:
+
+    p = lmj.trm.Parameters()
+    radii = numpy.array([posture.targets[7:15] for posture in ...])
+    velum = numpy.array([posture.targets[15] for posture in ...])
+    freqs, peaks = formants(radii, velum, p)
+'''
+
+import numpy
+
+import gnuspeech
+
+# internal gain applied to the glottal source (VT_SCALE in structs.h).
+VT_SCALE = 0.125
+
+
+def _amplitude(db):
+    '''Convert a level in dB (0-60) to an amplitude, like amplitude() in C.'''
+    if db <= 0:
+        return 0.
+    return min(1., 10. ** ((db - 60.) / 20.))
+
+
+def _coefficient(a, b):
+    '''Return the scattering coefficient between sections of radius a and b.'''
+    a2, b2 = a * a, b * b
+    return (a2 - b2) / (a2 + b2)
+
+
+def _aperture(coeff_hz, nyquist):
+    '''Return reflection and radiation filters for an aperture, as functions.
+
+    These match initializeMouthCoefficients() and the reflectionFilter() and
+    radiationFilter() functions (and their nasal counterparts).
+    '''
+    coeff = (nyquist - coeff_hz) / nyquist
+    b11 = -coeff
+    a10 = 1. - abs(b11)
+    a20 = coeff
+    a21 = b21 = -a20
+    reflection = lambda zi: a10 / (1. + b11 * zi)
+    radiation = lambda zi: (a20 + a21 * zi) / (1. + b21 * zi)
+    return reflection, radiation
+
+
+def _reflectance(coeffs, end, d, zi):
+    '''Compute reflectances for a chain of sections, from the far end back.
+
+    coeffs: Sequence of junction coefficients between successive sections.
+    end: Reflectance at the last section.
+
+    Returns the reflectance at the first section, and a list of the forward
+    transmission factors across each junction.
+    '''
+    gamma = end
+    transmissions = []
+    for k in reversed(coeffs):
+        t = d * zi * (1. + k) / (1. + d * zi * k * gamma)
+        gamma = d * zi * (k + (1. - k) * gamma * t)
+        transmissions.append(t)
+    transmissions.reverse()
+    return gamma, transmissions
+
+
+def transfer_function(radii, velum, parameters, frequencies=None, n=512,
+                      throat=False):
+    '''Compute the glottis-to-output transfer function of static tubes.
+
+    radii: Array of shape (..., 8) holding radii for the 8 tube regions, in cm.
+    velum: Array of shape (...) holding velum radii, in cm.
+    parameters: A tube.Parameters object.
+    frequencies: Frequencies (in Hz) to evaluate. Defaults to n frequencies
+      spaced evenly from 0 up to the nyquist frequency of the output.
+    throat: If True, add the sound radiated through the throat walls.
+
+    Returns a tuple (frequencies, response), where response is a complex array
+    of shape (..., len(frequencies)) giving the output of the mouth plus nose
+    for the glottal source, including the VT_SCALE gain.
+    '''
+    radii = numpy.asarray(radii, dtype=float)
+    velum = numpy.asarray(velum, dtype=float)
+    assert radii.shape[-1] == gnuspeech.TOTAL_REGIONS
+    assert radii.shape[:-1] == velum.shape
+
+    rate = parameters.tube_sample_rate_hz
+    nyquist = rate / 2.
+    if frequencies is None:
+        frequencies = numpy.linspace(
+            0, min(nyquist, parameters.sample_rate_hz / 2.), n)
+    frequencies = numpy.asarray(frequencies, dtype=float)
+
+    # z^-1 at each frequency, broadcast against the configurations.
+    zi = numpy.exp(-2j * numpy.pi * frequencies / rate)
+    r = radii[..., None, :]
+    v = velum[..., None]
+    d = 1. - parameters.loss_factor / 100.
+    ap = parameters.aperture_scale_cm
+
+    mouth_reflection, mouth_radiation = _aperture(parameters.mouth_coeff_hz, nyquist)
+    nose_reflection, nose_radiation = _aperture(parameters.nose_coeff_hz, nyquist)
+
+    # scattering coefficients, as in calculateTubeCoefficients().
+    c = [_coefficient(r[..., i], r[..., i + 1]) for i in range(7)]
+    c8 = _coefficient(r[..., 7], ap)
+
+    nose = (0., ) + tuple(parameters.nose_radii_cm)
+    nc1 = _coefficient(v, nose[1])
+    ncs = [_coefficient(nose[i], nose[i + 1]) for i in range(1, 5)]
+    nc6 = _coefficient(nose[5], ap)
+
+    r4 = r[..., 3] * r[..., 3]
+    v2 = v * v
+    total = 2. / (2. * r4 + v2)
+    alpha_left = alpha_right = total * r4
+    alpha_upper = total * v2
+
+    # sections S5..S10: junctions C4 (S5-S6), none (S6-S7), C5..C7.
+    oral_end = d * zi * c8 * mouth_reflection(zi)
+    gamma5, oral = _reflectance([c[3], 0., c[4], c[5], c[6]], oral_end, d, zi)
+
+    # nasal sections N1..N6: junctions NC1..NC5.
+    nasal_end = d * zi * nc6 * nose_reflection(zi)
+    gamma_n1, nasal = _reflectance([nc1] + ncs, nasal_end, d, zi)
+
+    # three-way junction between S4, S5 and N1.
+    g5 = d * zi / (1. + d * zi * gamma5)
+    gn = d * zi / (1. + d * zi * gamma_n1)
+    junction = alpha_left / (1. - alpha_right * gamma5 * g5 - alpha_upper * gamma_n1 * gn)
+    gamma4 = d * zi * (junction - 1.)
+
+    # sections S1..S4: junctions C1..C3.
+    gamma1, pharynx = _reflectance(c[:3], gamma4, d, zi)
+
+    # forward pass, starting from the glottis (S1 top = d z^-1 S1 bottom + u).
+    f = 1. / (1. - d * zi * gamma1)
+    for t in pharynx:
+        f = f * t
+    p = junction * f
+    f_oral = g5 * p
+    f_nasal = gn * p
+    for t in oral:
+        f_oral = f_oral * t
+    for t in nasal:
+        f_nasal = f_nasal * t
+
+    response = (mouth_radiation(zi) * (1. + c8) * zi * f_oral +
+                nose_radiation(zi) * (1. + nc6) * zi * f_nasal)
+
+    if throat:
+        ta0 = parameters.throat_lowpass_cutoff_hz * 2. / rate
+        tb1 = 1. - ta0
+        gain = _amplitude(parameters.throat_volume_db)
+        response = response + gain * ta0 / (1. - tb1 * zi)
+
+    return frequencies, VT_SCALE * response
+
+
+def formants(radii, velum, parameters, count=4, n=1024, fmax=5000.):
+    '''Find the formants (spectral peaks) of static tube configurations.
+
+    radii, velum, parameters: See transfer_function().
+    count: Maximum number of peaks to return for each configuration.
+    n: Number of frequencies to evaluate between 0 and fmax.
+    fmax: Highest frequency to consider, in Hz.
+
+    Returns a tuple (frequencies, magnitudes) of arrays with shape (..., count)
+    holding the peak frequencies in Hz and their magnitudes in dB, in order of
+    increasing frequency. Missing peaks are filled with NaN.
+    '''
+    fmax = min(fmax, parameters.tube_sample_rate_hz / 2.)
+    freqs, response = transfer_function(
+        radii, velum, parameters, numpy.linspace(0, fmax, n))
+    db = 20. * numpy.log10(abs(response) + 1e-300)
+    shape = db.shape[:-1]
+    db = db.reshape((-1, n))
+
+    # local maxima in the interior of the frequency grid.
+    left, mid, right = db[:, :-2], db[:, 1:-1], db[:, 2:]
+    peak = (mid > left) & (mid >= right)
+
+    # refine each peak with a parabola through its neighbors (in dB).
+    denom = left - 2. * mid + right
+    offset = numpy.where(denom < 0, 0.5 * (left - right) / numpy.where(denom < 0, denom, -1.), 0.)
+    step = freqs[1] - freqs[0]
+    peak_freqs = freqs[1:-1] + offset * step
+    peak_db = mid - 0.25 * (left - right) * offset
+
+    out_freqs = numpy.empty((len(db), count))
+    out_db = numpy.empty((len(db), count))
+    out_freqs.fill(numpy.nan)
+    out_db.fill(numpy.nan)
+    rank = numpy.cumsum(peak, axis=1) - 1
+    rows, cols = numpy.nonzero(peak & (rank < count))
+    out_freqs[rows, rank[rows, cols]] = peak_freqs[rows, cols]
+    out_db[rows, rank[rows, cols]] = peak_db[rows, cols]
+    return (out_freqs.reshape(shape + (count, )),
+            out_db.reshape(shape + (count, )))
@@ -21,12 +21,74 @@
 '''A high-level wrapper for the gnuspeech Tube Resonance Model (TRM).'''
 
 import array
+import ctypes
 import itertools
 import logging
 import os
+import struct
 
 import gnuspeech
 
+# number of control values in a frame (see TubeModel.synthesize).
+FRAME_SIZE = 16
+
+
+class _TRMInputParameters(ctypes.Structure):
+    '''The memory layout of the TRMInputParameters struct in structs.h.'''
+
+    _fields_ = [
+        ('outputFileFormat', ctypes.c_int),
+        ('outputRate', ctypes.c_float),
+        ('controlRate', ctypes.c_float),
+        ('volume', ctypes.c_double),
+        ('channels', ctypes.c_int),
+        ('balance', ctypes.c_double),
+        ('waveform', ctypes.c_int),
+        ('tp', ctypes.c_double),
+        ('tnMin', ctypes.c_double),
+        ('tnMax', ctypes.c_double),
+        ('breathiness', ctypes.c_double),
+        ('length', ctypes.c_double),
+        ('temperature', ctypes.c_double),
+        ('lossFactor', ctypes.c_double),
+        ('apScale', ctypes.c_double),
+        ('mouthCoef', ctypes.c_double),
+        ('noseCoef', ctypes.c_double),
+        ('noseRadius', ctypes.c_double * gnuspeech.TOTAL_NASAL_SECTIONS),
+        ('throatCutoff', ctypes.c_double),
+        ('throatVol', ctypes.c_double),
+        ('modulation', ctypes.c_int),
+        ('mixOffset', ctypes.c_double),
+        ('noiseSeed', ctypes.c_int),
+        ]
+
+
+def _check_layout():
+    '''Make sure that _TRMInputParameters matches the compiled struct.'''
+    raw = _TRMInputParameters()
+    for i, (name, kind) in enumerate(raw._fields_):
+        if name == 'noseRadius':
+            for j in range(gnuspeech.TOTAL_NASAL_SECTIONS):
+                raw.noseRadius[j] = i + j
+        else:
+            setattr(raw, name, i)
+    params = gnuspeech.TRMInputParameters()
+    ctypes.memmove(int(params.this), ctypes.addressof(raw), ctypes.sizeof(raw))
+    for i, (name, kind) in enumerate(raw._fields_):
+        if name == 'noseRadius':
+            value = gnuspeech.double_array_getitem(params.noseRadius, 0)
+        else:
+            value = getattr(params, name)
+        assert value == i, 'TRMInputParameters.%s is not at the expected offset' % name
+
+
+def _field(name, doc):
+    '''A read-only property for a scalar field of the parameter buffer.'''
+    kind = dict(_TRMInputParameters._fields_)[name]
+    unpack = struct.Struct('=' + kind._type_).unpack_from
+    offset = getattr(_TRMInputParameters, name).offset
+    return property(lambda self: unpack(self._data, offset)[0], doc=doc)
+
 
 class Parameters(object):
     '''This object holds a number of global synthesis parameters.
@@ -38,6 +100,10 @@ class Parameters(object):
     A sound is synthesized by combining these parameter settings with a sequence
     of control parameters. See the TubeModel class for information about
     synthesis.
+
+    Parameters are immutable: they are stored as the bytes of a C
+    TRMInputParameters struct, so they can be hashed, compared and pickled
+    cheaply. Use replace() to derive a modified set of parameters.
     '''
 
     DEFAULTS = dict(
@@ -62,168 +128,228 @@ class Parameters(object):
         throat_lowpass_cutoff_hz=1500.,
         throat_volume_db=5.,
         modulation=1,
-        noise_crossmix_offset_db=50.)
+        noise_crossmix_offset_db=50.,
+        seed=0)
+
+    # python attribute names for the fields of the C struct.
+    FIELDS = dict(
+        file_format='outputFileFormat',
+        sample_rate_hz='outputRate',
+        control_rate_hz='controlRate',
+        volume_db='volume',
+        channels='channels',
+        balance='balance',
+        waveform='waveform',
+        pulse_rise='tp',
+        pulse_fall_min='tnMin',
+        pulse_fall_max='tnMax',
+        breathiness='breathiness',
+        length_cm='length',
+        temperature_degc='temperature',
+        loss_factor='lossFactor',
+        aperture_scale_cm='apScale',
+        mouth_coeff_hz='mouthCoef',
+        nose_coeff_hz='noseCoef',
+        nose_radii_cm='noseRadius',
+        throat_lowpass_cutoff_hz='throatCutoff',
+        throat_volume_db='throatVol',
+        modulation='modulation',
+        noise_crossmix_offset_db='mixOffset',
+        seed='noiseSeed')
+
+    _layout_checked = False
+
+    __slots__ = ('_data', '_hash', '_struct')
 
     def __init__(self, **kwargs):
         '''Initialize a set of model parameters for a tube synthesizer.'''
-        self._params = gnuspeech.TRMInputParameters()
+        raw = _TRMInputParameters()
         for attr, default in Parameters.DEFAULTS.items():
-            setattr(self, attr, kwargs.get(attr, default))
+            value = kwargs.get(attr, default)
+            if attr == 'nose_radii_cm':
+                assert len(value) == gnuspeech.TOTAL_NASAL_SECTIONS - 1
+                raw.noseRadius[:] = [0.] + list(value)
+            else:
+                setattr(raw, Parameters.FIELDS[attr], value)
         extra = set(kwargs) - set(Parameters.DEFAULTS)
         if extra:
             logging.debug('%d extra parameters: %s',
                           len(extra),
                           ', '.join(sorted(extra)))
+        self._set_data(ctypes.string_at(ctypes.addressof(raw), ctypes.sizeof(raw)))
+
+    def _set_data(self, data):
+        assert len(data) == ctypes.sizeof(_TRMInputParameters)
+        object.__setattr__(self, '_data', data)
+        object.__setattr__(self, '_hash', hash(data))
+        object.__setattr__(self, '_struct', None)
+
+    @classmethod
+    def from_bytes(cls, data):
+        '''Create parameters from the bytes of a TRMInputParameters struct.'''
+        params = cls.__new__(cls)
+        params._set_data(data)
+        return params
+
+    def to_bytes(self):
+        '''Return the bytes of the TRMInputParameters struct.'''
+        return self._data
+
+    def replace(self, **kwargs):
+        '''Return a copy of these parameters with some values replaced.'''
+        unknown = set(kwargs) - set(Parameters.DEFAULTS)
+        assert not unknown, 'unknown parameters: %s' % ', '.join(sorted(unknown))
+        raw = _TRMInputParameters.from_buffer_copy(self._data)
+        for attr, value in kwargs.items():
+            if attr == 'nose_radii_cm':
+                assert len(value) == gnuspeech.TOTAL_NASAL_SECTIONS - 1
+                raw.noseRadius[:] = [0.] + list(value)
+            else:
+                setattr(raw, Parameters.FIELDS[attr], value)
+        return Parameters.from_bytes(
+            ctypes.string_at(ctypes.addressof(raw), ctypes.sizeof(raw)))
+
+    def __setattr__(self, name, value):
+        raise AttributeError(
+            'Parameters are immutable; use replace(%s=...)' % name)
+
+    def __eq__(self, other):
+        return isinstance(other, Parameters) and self._data == other._data
+
+    def __ne__(self, other):
+        return not self == other
+
+    def __hash__(self):
+        return self._hash
+
+    def __reduce__(self):
+        return (_parameters_from_bytes, (self._data, ))
 
     def __repr__(self):
         return 'Parameters(\n  %s)' % ',\n  '.join(
             '%s=%s' % (k, getattr(self, k)) for k in sorted(self.DEFAULTS))
 
-    def _set_file_format(self, v): self._params.outputFileFormat = v
-    file_format = property(
-        lambda self: self._params.outputFileFormat,
-        _set_file_format,
+    @property
+    def _params(self):
+        '''A SWIG TRMInputParameters struct holding these parameters.'''
+        if self._struct is None:
+            if not Parameters._layout_checked:
+                _check_layout()
+                Parameters._layout_checked = True
+            params = gnuspeech.TRMInputParameters()
+            ctypes.memmove(int(params.this), self._data, len(self._data))
+            object.__setattr__(self, '_struct', params)
+        return self._struct
+
+    file_format = _field(
+        'outputFileFormat',
         doc='output file format (0=AU, 1=AIFF, 2=WAVE), default 2')
 
-    def _set_sample_rate_hz(self, v): self._params.outputRate = v
-    sample_rate_hz = property(
-        lambda self: self._params.outputRate,
-        _set_sample_rate_hz,
-        doc='output sample rate (22050, 44100 Hz), default 44100')
+    sample_rate_hz = _field(
+        'outputRate',
+        doc='output sample rate (any rate, e.g. 8000, 16000, 22050, 44100 Hz), default 44100')
 
-    def _set_control_rate_hz(self, v): self._params.controlRate = v
-    control_rate_hz = property(
-        lambda self: self._params.controlRate,
-        _set_control_rate_hz,
+    control_rate_hz = _field(
+        'controlRate',
         doc='control rate (1.0-1000.0 input tables/second), default 10.0')
 
-    def _set_volume_db(self, v): self._params.volume = v
-    volume_db = property(
-        lambda self: self._params.volume,
-        _set_volume_db,
+    volume_db = _field(
+        'volume',
         doc='master volume (0-60 dB), default 10.0')
 
-    def _set_channels(self, v): self._params.channels = v
-    channels = property(
-        lambda self: self._params.channels,
-        _set_channels,
+    channels = _field(
+        'channels',
         doc='output channels (1 or 2), default 1')
 
-    def _set_balance(self, v): self._params.balance = v
-    balance = property(
-        lambda self: self._params.balance,
-        _set_balance,
+    balance = _field(
+        'balance',
         doc='stereo balance (-1 to +1), default 0.0')
 
-    def _set_waveform(self, v): self._params.waveform = v
-    waveform = property(
-        lambda self: self._params.waveform,
-        _set_waveform,
+    waveform = _field(
+        'waveform',
         doc='glottal source waveform type (0=PULSE, 1=SINE), default 0')
 
-    def _set_pulse_rise(self, v): self._params.tp = v
-    pulse_rise = property(
-        lambda self: self._params.tp,
-        _set_pulse_rise,
+    pulse_rise = _field(
+        'tp',
         doc='glottal pulse rise (5-50 % of GP period), default 40.0')
 
-    def _set_pulse_fall_min(self, v): self._params.tnMin = v
-    pulse_fall_min = property(
-        lambda self: self._params.tnMin,
-        _set_pulse_fall_min,
+    pulse_fall_min = _field(
+        'tnMin',
         doc='glottal pulse fall minimum (5-50 % of GP period), default 16.0')
 
-    def _set_pulse_fall_max(self, v): self._params.tnMax = v
-    pulse_fall_max = property(
-        lambda self: self._params.tnMax,
-        _set_pulse_fall_max,
+    pulse_fall_max = _field(
+        'tnMax',
         doc='glottal pulse fall maximum (5-50 % of GP period), default 32.0')
 
-    def _set_breathiness(self, v): self._params.breathiness = v
-    breathiness = property(
-        lambda self: self._params.breathiness,
-        _set_breathiness,
+    breathiness = _field(
+        'breathiness',
         doc='glottal source breathiness (0-10 % of GP amplitude), default 1.0')
 
-    def _set_length_cm(self, v): self._params.length = v
-    length_cm = property(
-        lambda self: self._params.length,
-        _set_length_cm,
+    length_cm = _field(
+        'length',
         doc='nominal tube length (10-20 cm), default 17.5')
 
-    def _set_temperature_degc(self, v): self._params.temperature = v
-    temperature_degc = property(
-        lambda self: self._params.temperature,
-        _set_temperature_degc,
+    temperature_degc = _field(
+        'temperature',
         doc='tube temperature (25-40 C), default 30.0')
 
-    def _set_loss_factor(self, v): self._params.lossFactor = v
-    loss_factor = property(
-        lambda self: self._params.lossFactor,
-        _set_loss_factor,
+    loss_factor = _field(
+        'lossFactor',
         doc='junction loss factor (0-5 % unity gain), default 0.5')
 
-    def _set_aperture_scale_cm(self, v): self._params.apScale = v
-    aperture_scale_cm = property(
-        lambda self: self._params.apScale,
-        _set_aperture_scale_cm,
+    aperture_scale_cm = _field(
+        'apScale',
         doc='aperture scale radius (3.05-12 cm), default 4.0')
 
-    def _set_mouth_coeff_hz(self, v): self._params.mouthCoef = v
-    mouth_coeff_hz = property(
-        lambda self: self._params.mouthCoef,
-        _set_mouth_coeff_hz,
+    mouth_coeff_hz = _field(
+        'mouthCoef',
         doc='mouth aperture coefficient (100-nyquist Hz), default 5000.0')
 
-    def _set_nose_coeff_hz(self, v): self._params.noseCoef = v
-    nose_coeff_hz = property(
-        lambda self: self._params.noseCoef,
-        _set_nose_coeff_hz,
+    nose_coeff_hz = _field(
+        'noseCoef',
         doc='nose aperture coefficient (100-nyquist Hz), default 5000.0')
 
-    def _get_nose_radii(self):
-        return tuple(
-            gnuspeech.double_array_getitem(self._params.noseRadius, i)
-            for i in range(1, gnuspeech.TOTAL_NASAL_SECTIONS))
-
-    def _set_nose_radii(self, values):
-        assert len(values) == gnuspeech.TOTAL_NASAL_SECTIONS - 1
-        radii = gnuspeech.new_double_array(gnuspeech.TOTAL_NASAL_SECTIONS)
-        gnuspeech.double_array_setitem(radii, 0, 0.)
-        for i, v in enumerate(values):
-            gnuspeech.double_array_setitem(radii, i + 1, v)
-        self._params.noseRadius = radii
-        gnuspeech.delete_double_array(radii)
-
-    nose_radii_cm = property(
-        _get_nose_radii,
-        _set_nose_radii,
-        doc='fixed nose radii (6 values from 0-3 cm), default (1.5, ) * 6')
+    @property
+    def nose_radii_cm(self):
+        '''fixed nose radii (5 values from 0-3 cm), default (1.5, ) * 5'''
+        field = _TRMInputParameters.noseRadius
+        return struct.unpack_from(
+            '=%dd' % (gnuspeech.TOTAL_NASAL_SECTIONS - 1),
+            self._data, field.offset + ctypes.sizeof(ctypes.c_double))
 
-    def _set_throat_lowpass_cutoff_hz(self, v): self._params.throatCutoff = v
-    throat_lowpass_cutoff_hz = property(
-        lambda self: self._params.throatCutoff,
-        _set_throat_lowpass_cutoff_hz,
+    throat_lowpass_cutoff_hz = _field(
+        'throatCutoff',
         doc='throat low-pass cutoff (50-nyquist Hz), default 1500.0')
 
-    def _set_throat_volume_db(self, v): self._params.throatVol = v
-    throat_volume_db = property(
-        lambda self: self._params.throatVol,
-        _set_throat_volume_db,
+    throat_volume_db = _field(
+        'throatVol',
         doc='throat volume (0-48 dB), default 5.0')
 
-    def _set_modulation(self, v): self._params.modulation = v
-    modulation = property(
-        lambda self: self._params.modulation,
-        _set_modulation,
+    modulation = _field(
+        'modulation',
         doc='pulse modulation of noise (0=OFF, 1=ON), default 1')
 
-    def _set_noise_crossmix_offset_db(self, v): self._params.mixOffset = v
-    noise_crossmix_offset_db = property(
-        lambda self: self._params.mixOffset,
-        _set_noise_crossmix_offset_db,
+    noise_crossmix_offset_db = _field(
+        'mixOffset',
         doc='noise crossmix offset (30-60 dB), default 50.0')
 
+    seed = _field(
+        'noiseSeed',
+        doc='noise generator seed (0=gnuspeech sequence), default 0')
+
+    @property
+    def tube_sample_rate_hz(self):
+        '''internal sample rate of the waveguide, derived from the tube length,
+        temperature and control rate (as in TRMTubeModelCreate)'''
+        c = 331.4 + 0.6 * self.temperature_degc
+        period = round(c * 10 * 100. / (self.length_cm * self.control_rate_hz))
+        return float(int(self.control_rate_hz * period))
+
+
+def _parameters_from_bytes(data):
+    '''Unpickle a Parameters object (python 2 cannot pickle classmethods).'''
+    return Parameters.from_bytes(data)
+
 
 class TubeModel(object):
     '''A Tube Resonance Model (TRM) synthesizes sound from a vocal tract model.
@@ -234,19 +360,128 @@ class TubeModel(object):
     argument to the synthesize method of this class.
     '''
 
-    def __init__(self, parameters):
+    ENGINES = dict(reference=gnuspeech.REFERENCE_ENGINE,
+                   fast=gnuspeech.FAST_ENGINE)
+
+    # fields of the frame statistics from synthesize(statistics=True): start
+    # time of the frame (seconds), RMS and peak magnitude of the output
+    # samples, zero crossings per second, and the mean square of the glottal
+    # source (zero when unvoiced). samples are as they come out of the
+    # converter (and limiter), before any scaling for a sound file.
+    STATISTICS = ('time', 'rms', 'peak', 'zcr', 'voicing')
+
+    # the sums that the C model keeps for each frame, in order.
+    _STATISTICS_SUMS = ('samples', 'energy', 'peak', 'crossings', 'source', 'voicing')
+
+    # stages of the fast engine, in the order that they run.
+    STAGES = ('parameter', 'gain', 'source', 'noise', 'mix', 'tract', 'output')
+
+    def __init__(self, parameters, engine='reference', skip_silence=False,
+                 silence_threshold=gnuspeech.SILENCE_THRESHOLD):
         '''Initialize this tube model with static tube configuration parameters.
+
+        The engine selects the C synthesis kernel: 'reference' is the original
+        gnuspeech code, while 'fast' is an optimized kernel that produces the
+        same output (see test/engines.py).
+
+        If skip_silence is True, the model outputs zeros without running the
+        tube whenever the glottal, aspiration and frication volumes are all at
+        0 dB and the pressure in the tube has died away below
+        silence_threshold. Only the tube itself is skipped: the glottal
+        oscillator, noise generator and sample rate converter still run for
+        every sample, so an utterance that is half pause renders about 2.5x
+        faster. Cutting off the decaying tail changes the output by an amount
+        on the order of the threshold (about 6e-4 of the peak for speech at
+        the default master volume). With the reference engine, the filter
+        memory that it keeps in statics is not cleared either. The number of
+        samples skipped is in skipped_samples.
         '''
+        assert engine in TubeModel.ENGINES, 'unknown engine %r' % engine
         self._model = gnuspeech.TRMTubeModelCreate(parameters._params)
+        if self._model is None:
+            raise ValueError('invalid tube parameters (check length_cm and '
+                             'sample_rate_hz): %r' % parameters)
+        self._model.engine = TubeModel.ENGINES[engine]
+        self._model.skipSilence = int(bool(skip_silence))
+        self._model.silenceThreshold = silence_threshold
         self.parameters = parameters
+        self.engine = engine
 
     def __del__(self):
         '''Free up the memory for this tube model.'''
-        gnuspeech.TRMTubeModelFree(self._model)
+        if getattr(self, '_model', None) is not None:
+            gnuspeech.TRMTubeModelFree(self._model)
+
+    def set_limiter(self, target=0.5, ceiling=0.99, lookahead=0.005,
+                    release=0.1, window=1., max_gain=1e4):
+        '''Stream the output of this model through a limiter.
+
+        The limiter normalizes loudness and limits peaks as samples come out of
+        the sample rate converter, so the output is ready to play or store as
+        soon as it is synthesized, rather than after a second pass that scales
+        by the peak of the whole render. The output is delayed internally by
+        the lookahead, but keeps the same length and alignment.
+
+        target: Peak level that the loudness envelope is scaled to.
+        ceiling: Largest magnitude of any output sample.
+        lookahead: How far ahead the limiter looks for peaks, in seconds.
+        release: Time constant for the gain to recover after a peak, in seconds.
+        window: Time constant for the loudness envelope to decay, in seconds.
+        max_gain: Largest gain applied to quiet (or silent) stretches.
+
+        Pass None as the target to remove the limiter again.
+        '''
+        if target is None:
+            gnuspeech.TRMTubeModelClearLimiter(self._model)
+            return
+        result = gnuspeech.TRMTubeModelSetLimiter(
+            self._model, lookahead, release, window, target, ceiling, max_gain)
+        if result != gnuspeech.SUCCESS:
+            raise ValueError('invalid limiter settings')
+
+    def copy_from(self, other):
+        '''Copy the synthesis state of another model into this one.
+
+        Both models must have been created with the same parameters. After the
+        copy, this model carries on exactly where the other one is, so the
+        same controls produce the same samples from both; the output already
+        synthesized by the other model is not copied. The reference engine
+        keeps some filter memory outside the model, so only the fast engine
+        continues exactly. Models with a limiter cannot be copied.
+        '''
+        result = gnuspeech.TRMTubeModelCopy(self._model, other._model)
+        if result != gnuspeech.SUCCESS:
+            raise ValueError('cannot copy state between these tube models')
+
+    def profile_stages(self, profile=True):
+        '''Start (or stop) timing each stage of the fast engine.
+
+        The fast engine runs as a pipeline of stages (see STAGES), each of
+        which processes a block of samples before the next one runs. While
+        profiling, the time spent in each stage is added up in stage_seconds.
+        Starting to profile resets the times.
+        '''
+        gnuspeech.TRMTubeModelProfileStages(self._model, int(bool(profile)))
 
-    def synthesize(self, *controls):
+    @property
+    def stage_seconds(self):
+        '''A dict of the seconds spent in each stage while profiling.'''
+        return dict(
+            (name, gnuspeech.TRMTubeModelStageSeconds(self._model, i))
+            for i, name in enumerate(TubeModel.STAGES))
+
+    @property
+    def skipped_samples(self):
+        '''The number of samples (at the internal sample rate) skipped so far.'''
+        return self._model.skippedSamples
+
+    def synthesize(self, *controls, **kwargs):
         '''Synthesize a sound from the given control variables.
 
+        Each model has its own noise generator, started from the seed in its
+        parameters and continued from one call to the next. Pass seed=N to
+        restart it from seed N, so that the sound is reproducible.
+
         Each element of controls is expected to be a list or numpy array
         containing controls for each frame of the sound synthesis. If it is a
         numpy array, frames are read from the 0 axis (the "rows") of the array.
@@ -264,8 +499,124 @@ class TubeModel(object):
         ...
         radius[7] - radius of vocal tract, region 7, cm
         velum - radius of velar opening, cm
+
+        Pass statistics=True to also get statistics of each control frame,
+        accumulated while the samples are synthesized: the return value is
+        then a pair (samples, statistics), where statistics is a numpy record
+        array with the fields in STATISTICS.
         '''
-        # convert control frames into TRM linked list structure
+        data = self._control_data(*controls)
+
+        seed = kwargs.get('seed')
+        if seed is not None:
+            gnuspeech.TRMTubeModelSeed(self._model, seed)
+
+        statistics = kwargs.get('statistics')
+        if statistics:
+            self._collect_statistics()
+
+        # run the synthesizer
+        gnuspeech.synthesize(self._model, data)
+
+        if statistics:
+            return self._read_output(), self._read_statistics()
+        return self._read_output()
+
+    def synthesize_keyframes(self, times, keyframes, **kwargs):
+        '''Synthesize a sound from sparse keyframes at arbitrary times.
+
+        times is a sequence of (non-decreasing) keyframe times in seconds, and
+        keyframes holds the 16 control variables of each keyframe, in the same
+        order as a frame for synthesize(). The controls are ramped linearly
+        from one keyframe to the next at the internal sample rate, so a steady
+        vowel or a pause needs just a keyframe at each end, rather than a frame
+        every 1 / control_rate_hz seconds. Keyframes spaced exactly one control
+        period apart produce the same sound as synthesize().
+
+        Pass seed=N to restart the noise generator, and statistics=True to get
+        per-frame statistics, as for synthesize().
+        '''
+        times = list(times)
+        keyframes = list(keyframes)
+        assert len(times) == len(keyframes), \
+            'got %d times for %d keyframes' % (len(times), len(keyframes))
+        assert all(a <= b for a, b in zip(times, times[1:])), \
+            'keyframe times must not decrease'
+
+        values = gnuspeech.new_double_array(len(keyframes) * FRAME_SIZE)
+        stamps = gnuspeech.new_double_array(len(times))
+        try:
+            for i, (t, frame) in enumerate(zip(times, keyframes)):
+                assert len(frame) == FRAME_SIZE, \
+                    'keyframe %d has %d controls, expected %d' % (
+                        i, len(frame), FRAME_SIZE)
+                gnuspeech.double_array_setitem(stamps, i, t)
+                for j, v in enumerate(frame):
+                    gnuspeech.double_array_setitem(
+                        values, i * FRAME_SIZE + j, v)
+
+            seed = kwargs.get('seed')
+            if seed is not None:
+                gnuspeech.TRMTubeModelSeed(self._model, seed)
+
+            statistics = kwargs.get('statistics')
+            if statistics:
+                self._collect_statistics()
+
+            gnuspeech.synthesizeKeyframes(
+                self._model, self.parameters._params, values, stamps, len(times))
+        finally:
+            gnuspeech.delete_double_array(values)
+            gnuspeech.delete_double_array(stamps)
+
+        if statistics:
+            return self._read_output(), self._read_statistics()
+        return self._read_output()
+
+    def _collect_statistics(self):
+        '''Start accumulating frame statistics in the C model.'''
+        result = gnuspeech.TRMTubeModelCollectStatistics(
+            self._model, self.parameters._params)
+        if result != gnuspeech.SUCCESS:
+            raise ValueError('invalid rates for frame statistics')
+
+    def _read_statistics(self):
+        '''Return the frame statistics collected so far, and stop collecting.
+
+        The C model keeps sums for each frame (see statistics.h), which are
+        turned into the per-frame values of STATISTICS here.
+        '''
+        import numpy
+        count = gnuspeech.TRMTubeModelReadStatistics(self._model, None, 0)
+        sums = numpy.zeros((count, len(TubeModel._STATISTICS_SUMS)))
+        gnuspeech.TRMTubeModelReadStatistics(
+            self._model, gnuspeech.double_array_from_address(sums.ctypes.data),
+            count)
+        gnuspeech.TRMTubeModelClearStatistics(self._model)
+
+        sums = dict(zip(TubeModel._STATISTICS_SUMS, sums.T))
+        samples = numpy.maximum(sums['samples'], 1)
+        stats = numpy.zeros(count, dtype=[(f, 'f8') for f in TubeModel.STATISTICS])
+        stats['time'] = numpy.arange(count) / float(self.parameters.control_rate_hz)
+        stats['rms'] = numpy.sqrt(sums['energy'] / samples)
+        stats['peak'] = sums['peak']
+        stats['zcr'] = sums['crossings'] / samples * self.parameters.sample_rate_hz
+        stats['voicing'] = sums['voicing'] / numpy.maximum(sums['source'], 1)
+        return stats.view(numpy.recarray)
+
+    def _read_output(self):
+        '''Return the synthesized sound data as an array of doubles.'''
+        converter = self._model.sampleRateConverter
+        converter.tempFilePtr.seek(0)
+	logging.debug('number of samples: %d', converter.numberSamples)
+	logging.debug('maximum sample value: %.4f', converter.maximumSampleValue)
+        arr = array.array('d')
+        arr.fromstring(converter.tempFilePtr.read())
+        return arr
+
+
+    def _control_data(self, *controls):
+        '''Convert control frames into a TRM linked list structure.'''
         data = gnuspeech.TRMData()
         data.inputParameters = self.parameters._params
 
@@ -279,18 +630,7 @@ class TubeModel(object):
                                fric_vol, fric_pos, fric_cf, fric_bw,
                                radii, velum)
         gnuspeech.delete_double_array(radii)
-
-        # run the synthesizer
-        gnuspeech.synthesize(self._model, data)
-
-        # now return the synthesized sound data as an array of doubles
-        converter = self._model.sampleRateConverter
-        converter.tempFilePtr.seek(0)
-	logging.debug('number of samples: %d', converter.numberSamples)
-	logging.debug('maximum sample value: %.4f', converter.maximumSampleValue)
-        arr = array.array('d')
-        arr.fromstring(converter.tempFilePtr.read())
-        return arr
+        return data
 
 
 def parse_input_file(filename):
@@ -299,12 +639,24 @@ def parse_input_file(filename):
     return gnuspeech.parseInputFile(filename)
 
 
-def synthesize(input_filename, output_filename):
-    '''Synthesize the control data from input_filename into output_filename.'''
+def synthesize(input_filename, output_filename, engine='reference'):
+    '''Synthesize the control data from input_filename into output_filename.
+
+    Returns the number of samples written, and the largest absolute sample
+    value before the samples were scaled for output.
+    '''
     frames = parse_input_file(input_filename)
+    if frames is None:
+        raise ValueError('%s: cannot parse control file' % input_filename)
     t = gnuspeech.TRMTubeModelCreate(frames.inputParameters)
+    if t is None:
+        raise ValueError('%s: invalid tube parameters' % input_filename)
+    t.engine = TubeModel.ENGINES[engine]
     logging.info('Calculating floating point samples...')
     gnuspeech.synthesize(t, frames)
     gnuspeech.writeOutputToFile(t.sampleRateConverter, frames, output_filename)
     logging.info('Wrote scaled samples to file: %s', output_filename)
+    samples = t.sampleRateConverter.numberSamples
+    peak = t.sampleRateConverter.maximumSampleValue
     gnuspeech.TRMTubeModelFree(t)
+    return samples, peak
@@ -22,6 +22,7 @@ setuptools.setup(
             sources=glob.glob('gnuspeech/Tube/*.c') + ['lmj/trm/gnuspeech_wrap.c'],
             include_dirs=['./gnuspeech'],
             define_macros=[('GNUSTEP', '1')])],
+    entry_points={'console_scripts': ['trm-render = lmj.trm.batch:main']},
     classifiers=[
         'Development Status :: 3 - Alpha',
         'Intended Audience :: Science/Research',
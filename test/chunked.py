@@ -0,0 +1,89 @@
+#!/usr/bin/env python
+
+# Copyright (c) 2011 Leif Johnson <leif@leifjohnson.net>
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+'''Check that chunked parallel rendering matches a serial render.
+
+The control frames of each bundled .gnuspeech file are repeated to make a long
+utterance, which is rendered serially and then in parallel chunks. The script
+reports the largest and rms difference between the two (relative to the peak
+sample) and the time taken by each, and exits with a nonzero status if any
+file differs by more than the tolerance.
+
+usage: python chunked.py [--repeat 10] [--chunk 500] [--warmup 20] [file.gnuspeech ...]
+'''
+
+import glob
+import logging
+import numpy
+import optparse
+import os
+import sys
+
+import lmj.trm
+import lmj.trm.chunked
+
+
+def read_frames(filename):
+    '''Read the control frames (the lines without a comment) of a file.'''
+    return numpy.array([[float(x) for x in line.split()]
+                        for line in open(filename)
+                        if line.strip() and ';' not in line])
+
+
+if __name__ == '__main__':
+    logging.basicConfig(level=logging.INFO)
+
+    parser = optparse.OptionParser()
+    parser.add_option('--tolerance', type=float, default=1e-9,
+                      help='largest allowed difference, relative to the peak')
+    parser.add_option('--repeat', type=int, default=10,
+                      help='repeat the frames of each file this many times')
+    parser.add_option('--chunk', type=int, default=500,
+                      help='number of frames in each chunk')
+    parser.add_option('--warmup', type=int, default=20,
+                      help='number of warm-up frames before each chunk')
+    parser.add_option('--processes', type=int, default=None,
+                      help='number of worker processes')
+    parser.add_option('--engine', default='fast',
+                      help='synthesis engine')
+    opts, args = parser.parse_args()
+
+    here = os.path.dirname(os.path.abspath(__file__))
+    filenames = args or sorted(glob.glob(os.path.join(here, '*.gnuspeech')))
+
+    failed = False
+    for filename in filenames:
+        frames = numpy.tile(read_frames(filename), (opts.repeat, 1))
+        report = lmj.trm.chunked.compare(
+            lmj.trm.Parameters(), frames, engine=opts.engine,
+            chunk_frames=opts.chunk, warmup_frames=opts.warmup,
+            processes=opts.processes)
+        ok = (report['length_difference'] == 0 and
+              report['max_error'] <= opts.tolerance)
+        failed = failed or not ok
+        print '%-20s %8d samples  error %.3g (rms %.3g)  serial %.3fs  chunked %.3fs  (%.2fx)  %s' % (
+            os.path.basename(filename), report['samples'],
+            report['max_error'], report['rms_error'],
+            report['serial_time'], report['chunked_time'], report['speedup'],
+            'ok' if ok else 'FAILED')
+
+    sys.exit(1 if failed else 0)
@@ -0,0 +1,81 @@
+#!/usr/bin/env python
+
+# Copyright (c) 2011 Leif Johnson <leif@leifjohnson.net>
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+'''Check that an interrupted dataset build resumes correctly.
+
+A small dataset is built in one go, and again in two steps with a partially
+written index line left between them, as if the first build had been killed
+while recording an utterance. The script checks that the resumed index parses,
+that both datasets hold the same utterances, and exits with a nonzero status
+otherwise.
+
+usage: python dataset.py [--count 6] [--processes 2]
+'''
+
+import numpy
+import optparse
+import os
+import shutil
+import sys
+import tempfile
+
+import lmj.trm.dataset as dataset
+
+
+def build(root, opts, count):
+    return dataset.build(root, count, phones=3, seed=opts.seed,
+                         processes=opts.processes)
+
+
+if __name__ == '__main__':
+
+    parser = optparse.OptionParser()
+    parser.add_option('--count', type=int, default=6,
+                      help='number of utterances in the dataset')
+    parser.add_option('--processes', type=int, default=2,
+                      help='number of worker processes')
+    parser.add_option('--seed', type=int, default=0,
+                      help='random seed for the babbler')
+    opts, args = parser.parse_args()
+
+    tmp = tempfile.mkdtemp()
+    try:
+        whole = os.path.join(tmp, 'whole')
+        build(whole, opts, opts.count)
+
+        resumed = os.path.join(tmp, 'resumed')
+        build(resumed, opts, opts.count // 2)
+        # simulate a build killed halfway through writing an index line.
+        with open(os.path.join(resumed, dataset.INDEX), 'a') as handle:
+            handle.write('%d\tfoo bar\t0:' % (opts.count // 2))
+        build(resumed, opts, opts.count)
+
+        ok = len(dataset.read_index(resumed)) == opts.count
+        for a, b in zip(dataset.read(whole), dataset.read(resumed)):
+            same = a[0] == b[0] and all(
+                numpy.array_equal(x, y) for x, y in zip(a[1:], b[1:]))
+            print '%-30s %s' % (' '.join(a[0]), 'ok' if same else 'DIFFERENT')
+            ok = ok and same
+    finally:
+        shutil.rmtree(tmp)
+
+    sys.exit(0 if ok else 1)
@@ -0,0 +1,120 @@
+#!/usr/bin/env python
+
+# Copyright (c) 2011 Leif Johnson <leif@leifjohnson.net>
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+'''Check that the fast synthesis engine matches the reference engine.
+
+Each engine renders every bundled .gnuspeech file in a fresh process, since
+the reference engine keeps some filter memory in static variables that would
+otherwise carry over from one render to the next. The script reports the
+largest difference between the engines (relative to the peak sample) and the
+render time of each, and exits with a nonzero status if any file differs by
+more than the tolerance. With --stages, it also reports the time spent in each
+stage of the fast engine's pipeline.
+
+usage: python engines.py [--tolerance 1e-9] [--stages] [file.gnuspeech ...]
+'''
+
+import glob
+import logging
+import numpy
+import optparse
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+import lmj.trm
+import lmj.trm.gnuspeech as gnuspeech
+
+
+def render(filename, engine, output, stages=False):
+    '''Render a .gnuspeech file with an engine, saving samples and times.'''
+    data = lmj.trm.parse_input_file(filename)
+    model = gnuspeech.TRMTubeModelCreate(data.inputParameters)
+    model.engine = lmj.trm.TubeModel.ENGINES[engine]
+    gnuspeech.TRMTubeModelProfileStages(model, int(bool(stages)))
+    start = time.time()
+    gnuspeech.synthesize(model, data)
+    elapsed = time.time() - start
+    temp = model.sampleRateConverter.tempFilePtr
+    temp.seek(0)
+    samples = numpy.frombuffer(temp.read(), dtype=numpy.float64)
+    seconds = [gnuspeech.TRMTubeModelStageSeconds(model, i)
+               for i in range(gnuspeech.TOTAL_STAGES)]
+    numpy.savez(output, samples=samples, elapsed=elapsed, stages=seconds)
+    gnuspeech.TRMTubeModelFree(model)
+
+
+def render_in_subprocess(filename, engine, stages=False):
+    handle, output = tempfile.mkstemp(suffix='.npz')
+    os.close(handle)
+    try:
+        args = [sys.executable, __file__, '--render', engine, output]
+        if stages:
+            args.append('--stages')
+        with open(os.devnull, 'w') as devnull:
+            subprocess.check_call(args + [filename], stdout=devnull)
+        result = numpy.load(output)
+        return result['samples'], float(result['elapsed']), result['stages']
+    finally:
+        os.remove(output)
+
+
+if __name__ == '__main__':
+    logging.basicConfig(level=logging.INFO)
+
+    parser = optparse.OptionParser()
+    parser.add_option('--tolerance', type=float, default=1e-9,
+                      help='largest allowed difference, relative to the peak')
+    parser.add_option('--stages', action='store_true',
+                      help='report the time spent in each fast engine stage')
+    parser.add_option('--render', nargs=2, metavar='ENGINE OUTPUT',
+                      help=optparse.SUPPRESS_HELP)
+    opts, args = parser.parse_args()
+
+    if opts.render:
+        render(args[0], *opts.render, stages=opts.stages)
+        sys.exit(0)
+
+    here = os.path.dirname(os.path.abspath(__file__))
+    filenames = args or sorted(glob.glob(os.path.join(here, '*.gnuspeech')))
+
+    failed = False
+    for filename in filenames:
+        reference, reference_time, _ = render_in_subprocess(filename, 'reference')
+        fast, fast_time, stages = render_in_subprocess(filename, 'fast', opts.stages)
+        if len(reference) != len(fast):
+            error = numpy.inf
+        else:
+            error = abs(reference - fast).max() / max(abs(reference).max(), 1e-300)
+        ok = error <= opts.tolerance
+        failed = failed or not ok
+        print '%-20s %6d samples  error %.3g  reference %.3fs  fast %.3fs  (%.2fx)  %s' % (
+            os.path.basename(filename), len(reference), error,
+            reference_time, fast_time, reference_time / max(fast_time, 1e-9),
+            'ok' if ok else 'FAILED')
+        if opts.stages:
+            print '    ' + '  '.join('%s %.3fs' % (name, seconds) for name, seconds
+                                     in zip(lmj.trm.TubeModel.STAGES, stages))
+
+    sys.exit(1 if failed else 0)
@@ -0,0 +1,83 @@
+#!/usr/bin/env python
+
+# Copyright (c) 2011 Leif Johnson <leif@leifjohnson.net>
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+'''Check that importing lmj.trm stays fast.
+
+The package is imported in a number of fresh processes, and the fastest import
+time is compared against a fixed budget. The lmj namespace package (and the
+pkg_resources machinery behind it) is imported first and not counted, since
+its cost varies a lot from one installation to the next. The script also
+checks that none of the lazily imported subsystems (or their heavy
+dependencies) were loaded, and exits with a nonzero status if either check
+fails.
+
+usage: python import_time.py [--budget 0.05] [--runs 5]
+'''
+
+import optparse
+import subprocess
+import sys
+
+# modules that a plain "import lmj.trm" must not load.
+LAZY = ('numpy', 'scipy', 'xml.dom.minidom',
+        'lmj.trm.postures', 'lmj.trm.babbler', 'lmj.trm.realtime')
+
+PROBE = '''
+import sys, time
+import lmj
+start = time.time()
+import lmj.trm
+elapsed = time.time() - start
+print elapsed
+print ' '.join(m for m in %r if m in sys.modules)
+''' % (LAZY, )
+
+
+def measure():
+    '''Import lmj.trm in a fresh process, returning (seconds, loaded modules).'''
+    output = subprocess.check_output([sys.executable, '-c', PROBE])
+    lines = output.splitlines()
+    return float(lines[0]), lines[1].split() if len(lines) > 1 else []
+
+
+if __name__ == '__main__':
+    parser = optparse.OptionParser()
+    parser.add_option('--budget', type=float, default=0.05,
+                      help='largest allowed import time, in seconds')
+    parser.add_option('--runs', type=int, default=5,
+                      help='number of fresh processes to time')
+    opts, args = parser.parse_args()
+
+    times = []
+    loaded = set()
+    for _ in range(opts.runs):
+        elapsed, modules = measure()
+        times.append(elapsed)
+        loaded.update(modules)
+
+    fastest = min(times)
+    print 'import lmj.trm: %.3fs (fastest of %d, budget %.3fs)' % (
+        fastest, opts.runs, opts.budget)
+    if loaded:
+        print 'eagerly imported: %s' % ', '.join(sorted(loaded))
+
+    sys.exit(0 if fastest <= opts.budget and not loaded else 1)